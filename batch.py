@@ -0,0 +1,77 @@
+"""Render de CVs en lote.
+
+Ejemplo:
+    python3 batch.py --exports-dir data/exports --manifest data/manifest.json --workers 4
+
+El manifiesto mapea cada export (carpeta o `.zip` dentro de `--exports-dir`) a sus datos
+personales, con las mismas claves que el `.env`:
+    {"Basic_LinkedInDataExport_01-01-2025": {"PHOTO_NAME": "photo.jpg", "BIRTHDAY": "1990-01-01", ...}}
+"""
+
+from pathlib import Path
+import argparse
+import os
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.app.configure_logging import configure_logging
+configure_logging()
+
+from src.app.drivers.batch_render.service import BatchRenderService
+from src.app.drivers.linkedin_data.factory import CSV_ENGINES
+from src.app.drivers.pdf_compressor_factory import PDF_COMPRESSORS
+from src.core.constants import PATH_DATA_DIR
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exports-dir", type=Path, required=True)
+    parser.add_argument("--manifest", type=Path, required=True)
+    parser.add_argument("--output-dir", type=Path, default=PATH_DATA_DIR / "batch")
+    parser.add_argument("--summary", type=Path, default=None, help="Por defecto: <output-dir>/batch_summary.json")
+    parser.add_argument("--workers", type=int, default=None, help="Por defecto: cantidad de CPUs.")
+    parser.add_argument("--font-name", default=os.getenv("FONT_NAME", "HackNerdFont"))
+    parser.add_argument("--csv-engine", choices=CSV_ENGINES, default=os.getenv("CSV_ENGINE", "pandas"))
+    parser.add_argument("--no-compress", action="store_true")
+    parser.add_argument("--gs-workers", type=int, default=0, help="Llamadas gs en paralelo, fuera de los workers de render (0: cada worker comprime).")
+    parser.add_argument("--gs-timeout", type=float, default=120.0, help="Segundos máximos por llamada gs.")
+    parser.add_argument("--pdf-compressor", choices=PDF_COMPRESSORS, default=os.getenv("PDF_COMPRESSOR", "auto"))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--auto-fit", action="store_true", help="Escala fuentes y espaciados para que cada CV entre en una página.")
+    parser.add_argument("--metrics", type=Path, default=None, help="Mide cada etapa y escribe las métricas (Prometheus) en este archivo.")
+    parser.add_argument("--trace-memory", action="store_true", help="Con --metrics: picos de memoria (tracemalloc) en vez de tiempos.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    batch_service = BatchRenderService(
+        workers=args.workers,
+        font_name=args.font_name,
+        gs_workers=args.gs_workers,
+        gs_timeout_s=args.gs_timeout,
+    )
+    jobs = batch_service.load_jobs(
+        path_exports_dir=args.exports_dir,
+        path_manifest=args.manifest,
+        path_output_dir=args.output_dir,
+        compress=not args.no_compress,
+        pdf_compressor=args.pdf_compressor,
+        csv_engine=args.csv_engine,
+        use_cache=not args.no_cache,
+        auto_fit=args.auto_fit,
+        instrument=args.metrics is not None,
+        trace_memory=args.trace_memory,
+    )
+    summary = batch_service.run(jobs)
+    batch_service.write_summary(summary, args.summary or args.output_dir / "batch_summary.json")
+    if args.metrics is not None:
+        batch_service.write_metrics(summary, args.metrics)
+    return 0 if summary.n_error == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
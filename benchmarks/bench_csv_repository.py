@@ -0,0 +1,95 @@
+"""Compara import y carga de `LinkedinCSVRepository` (pandas) vs `LinkedinCSVStreamRepository`.
+
+También carga el mismo export desde un `.zip` armado en el directorio temporal (con `--zip-filler-mb`
+de mensajes que nunca deberían descomprimirse) y verifica que dé el mismo `LinkedinData`.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_csv_repository --positions 50 --repeat 200
+"""
+
+import argparse
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from benchmarks.synthetic_export import write_synthetic_export
+
+_MODULES = {
+    "pandas": "src.app.drivers.linkedin_data.csv_repository",
+    "stream": "src.app.drivers.linkedin_data.csv_stream_repository",
+}
+
+
+def _import_time(module: str, *, repeat: int) -> float:
+    """Mediana del import en frío de `module`, en un intérprete nuevo por muestra."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    samples = [
+        float(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    ]
+    return statistics.median(samples)
+
+
+def _load_time(engine: str, *, folder: Path, repeat: int):
+    from src.app.drivers.linkedin_data.factory import build_linkedin_csv_repository
+    from src.core.entities import CVSettings
+
+    settings = CVSettings(folder_data=folder.name, path_data_dir=folder.parent)
+    repository = build_linkedin_csv_repository(engine, settings)
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        linkedin_data = repository.load_linkedin_data()
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples), linkedin_data
+
+
+def _write_zip(folder: Path, *, filler_bytes: int) -> Path:
+    """`folder` comprimido como un export real: CSVs en la raíz y un miembro pesado en `messages/`."""
+    path_zip = folder.with_suffix(".zip")
+    with zipfile.ZipFile(path_zip, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path_csv in sorted(folder.glob("*.csv")):
+            archive.write(path_csv, path_csv.name)
+        archive.writestr("messages/big.bin", random.Random(0).randbytes(filler_bytes))
+    return path_zip
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--import-repeat", type=int, default=5)
+    parser.add_argument("--zip-filler-mb", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = write_synthetic_export(Path(tmp) / "export", n_positions=args.positions)
+
+        import logging
+        logging.disable(logging.INFO)
+
+        results = {}
+        for engine, module in _MODULES.items():
+            import_s = _import_time(module, repeat=args.import_repeat)
+            load_s, linkedin_data = _load_time(engine, folder=folder, repeat=args.repeat)
+            results[engine] = linkedin_data
+            print(f"{engine:>6} | import={import_s * 1e3:8.1f} ms | load={load_s * 1e3:8.3f} ms")
+
+        path_zip = _write_zip(folder, filler_bytes=int(args.zip_filler_mb * 1024 * 1024))
+        load_s, results["zip"] = _load_time("stream", folder=path_zip, repeat=args.repeat)
+        print(f"{'zip':>6} | {path_zip.stat().st_size / 1024:9.0f} KB | load={load_s * 1e3:8.3f} ms")
+
+        dumps = [linkedin_data.model_dump() for linkedin_data in results.values()]
+        identical = all(dump == dumps[0] for dump in dumps)
+        print(f"LinkedinData idéntico: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Costo de armar las entradas de dibujo por elemento: modelos pydantic validados vs dataclasses.
+
+Mide la construcción de los objetos que el layout arma por cada posición, con las dataclasses
+actuales y con modelos pydantic equivalentes (el camino anterior), y el `layout_positions` completo
+de un export sintético con el caché de párrafos caliente.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_draw_inputs --positions 200 --repeat 20
+"""
+
+import argparse
+import dataclasses
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from pydantic import ConfigDict, Field, create_model
+from reportlab.platypus import Paragraph
+
+from benchmarks.synthetic_export import write_synthetic_export
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.layout_cv.paragraph_cache import ParagraphMeasureCache
+from src.app.drivers.layout_cv.service import LayoutCVService
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.core.constants import PATH_PYTHON_ICON
+from src.core.drivers.font_loader import FontLoaderConfig
+from src.core.entities import (
+    BuilderCVConfig,
+    CVSettings,
+    DividerLine,
+    DrawCVConfig,
+    ImageDrawCfg,
+    ImageTitleDrawCfg,
+    PlacedFlowable,
+    PositionLayout,
+    PositionsDrawCfg,
+    SizesCV,
+    StyleCV,
+)
+
+_PER_POSITION = (ImageTitleDrawCfg, ImageDrawCfg, PlacedFlowable, DividerLine, PositionLayout)
+
+
+def _validated_mirrors() -> Dict[type, type]:
+    """Un modelo pydantic con los mismos campos por dataclass (los campos anidados, como `Any`)."""
+    mirrors = {}
+    for cls in _PER_POSITION:
+        fields: Dict[str, Any] = {}
+        for field in dataclasses.fields(cls):
+            annotation = Any if field.type in _PER_POSITION or "Layout" in str(field.type) else field.type
+            if field.default_factory is not dataclasses.MISSING:
+                default = Field(default_factory=field.default_factory)
+            elif field.default is not dataclasses.MISSING:
+                default = field.default
+            else:
+                default = ...
+            fields[field.name] = (annotation, default)
+        mirrors[cls] = create_model(cls.__name__, __config__=ConfigDict(arbitrary_types_allowed=True), **fields)
+    return mirrors
+
+
+def _position_objects(types: Dict[type, type], paragraph: Paragraph) -> None:
+    """Los objetos que el layout arma por cada posición."""
+    types[ImageTitleDrawCfg](path_img=PATH_PYTHON_ICON, title_html="<b>Puesto</b>", img_size=8.5, image_to_title_dist=4.0)
+    icon = types[ImageDrawCfg](path_img=PATH_PYTHON_ICON, x=1.0, y=2.0, width=8.5, height=8.5)
+    boxes = [types[PlacedFlowable](flowable=paragraph, x=1.0, y=2.0, width=3.0, height=4.0) for _ in range(3)]
+    types[DividerLine](x_start=1.0, y_start=2.0, x_end=3.0, y_end=2.0)
+    types[PositionLayout](
+        icon=icon, title=boxes[0], subtitle=boxes[1], description=boxes[2], top=1.0, title_row_bottom=2.0, bottom=3.0
+    )
+
+
+def _median_s(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--font", default="HackNerdFont")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    FontLoader().load_fonts(FontLoaderConfig(base_name=args.font))
+    paragraph = Paragraph("texto", StyleCV().get_styles()["JobDesc"])
+    n = args.positions
+    validated = _validated_mirrors()
+    native = {cls: cls for cls in _PER_POSITION}
+    validated_s = _median_s(lambda: [_position_objects(validated, paragraph) for _ in range(n)], args.repeat)
+    native_s = _median_s(lambda: [_position_objects(native, paragraph) for _ in range(n)], args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = write_synthetic_export(Path(tmp) / "export", n_positions=n)
+        settings = CVSettings(folder_data=folder.name, path_data_dir=folder.parent)
+        linkedin_data = LinkedinDataService(settings=settings, csv_engine="stream", use_cache=False).load()
+
+    style_cv = StyleCV()
+    page_width, page_height = BuilderCVConfig().page_size
+    cfg = PositionsDrawCfg(
+        linkedin_data=linkedin_data,
+        sizes_cv=SizesCV(),
+        style_cv=style_cv,
+        styles=style_cv.get_styles(),
+        page_width=page_width,
+        page_height=page_height,
+    )
+    service = LayoutCVService(paragraph_cache=ParagraphMeasureCache())
+    service.layout_positions(cfg=cfg, draw_config=DrawCVConfig())
+    layout_s = _median_s(lambda: service.layout_positions(cfg=cfg, draw_config=DrawCVConfig()), args.repeat)
+
+    print(f"positions={n} repeat={args.repeat}")
+    print(f"objetos por posición | pydantic {validated_s * 1e3:8.2f} ms | dataclass {native_s * 1e3:8.2f} ms"
+          f" | {validated_s / native_s:4.1f}x")
+    print(f"layout_positions     | {layout_s * 1e3:8.2f} ms (caché de párrafos caliente)")
+
+
+if __name__ == "__main__":
+    main()
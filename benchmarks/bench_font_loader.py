@@ -0,0 +1,115 @@
+"""Arranque de `FontLoader`: parseo de los `.ttf` vs métricas cacheadas por `FontMetricsCache`.
+
+Cada muestra corre en un intérprete nuevo (arranque en frío real). Además verifica que anchos de
+texto y PDF resultante (con subset de fuentes) sean idénticos con y sin caché.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_font_loader --font HackNerdFont --repeat 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+_SAMPLE_TEXT = "Curriculum Vitae — Python, ñandú, ¿qué tal? 0123456789 "
+
+_LOAD_CODE = """
+import sys, time
+from pathlib import Path
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.font_metrics_cache import FontMetricsCache
+from src.core.drivers.font_loader import FontLoaderConfig
+
+mode, font, path_cache = sys.argv[1], sys.argv[2], Path(sys.argv[3])
+loader = FontLoader(metrics_cache=FontMetricsCache(path_dir=path_cache))
+cfg = FontLoaderConfig(base_name=font, lazy=False)
+t = time.perf_counter()
+if mode == "parse":
+    for pair in loader._font_pairs(cfg):
+        if pair.path:
+            pdfmetrics.registerFont(TTFont(pair.name, str(pair.path)))
+else:
+    loader.load_fonts(cfg)
+print(time.perf_counter() - t)
+"""
+
+_PDF_CODE = """
+import sys
+from reportlab import rl_config
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.font_metrics_cache import FontMetricsCache
+from src.core.drivers.font_loader import FontLoaderConfig
+
+mode, font, path_cache, path_pdf, text = sys.argv[1:6]
+rl_config.invariant = 1
+loader = FontLoader(metrics_cache=FontMetricsCache(path_dir=path_cache))
+cfg = FontLoaderConfig(base_name=font, lazy=False)
+names = [pair.name for pair in loader._font_pairs(cfg) if pair.path]
+if mode == "parse":
+    for pair in loader._font_pairs(cfg):
+        if pair.path:
+            pdfmetrics.registerFont(TTFont(pair.name, str(pair.path)))
+else:
+    loader.load_fonts(cfg)
+c = Canvas(path_pdf)
+for i, name in enumerate(names):
+    c.setFont(name, 11)
+    c.drawString(40, 800 - 20 * i, text)
+    print(pdfmetrics.stringWidth(text, name, 11))
+c.save()
+"""
+
+
+def _run(code: str, *args: str) -> str:
+    return subprocess.run([sys.executable, "-c", code, *args], check=True, capture_output=True, text=True).stdout
+
+
+def _load_time(mode: str, *, font: str, path_cache: Path, repeat: int, clear: bool) -> float:
+    samples = []
+    for _ in range(repeat):
+        if clear:
+            for path in path_cache.glob("*"):
+                path.unlink()
+        samples.append(float(_run(_LOAD_CODE, mode, font, str(path_cache))))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--font", default="HackNerdFont")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path_cache = Path(tmp) / "fonts"
+        path_cache.mkdir()
+
+        parse_s = _load_time("parse", font=args.font, path_cache=path_cache, repeat=args.repeat, clear=False)
+        miss_s = _load_time("cache", font=args.font, path_cache=path_cache, repeat=args.repeat, clear=True)
+        hit_s = _load_time("cache", font=args.font, path_cache=path_cache, repeat=args.repeat, clear=False)
+        print(f" parse | {parse_s * 1e3:8.1f} ms")
+        print(f"  miss | {miss_s * 1e3:8.1f} ms")
+        print(f"   hit | {hit_s * 1e3:8.1f} ms | x{parse_s / hit_s:.1f}")
+
+        outputs = {}
+        for mode in ("parse", "cache"):
+            path_pdf = Path(tmp) / f"{mode}.pdf"
+            widths = _run(_PDF_CODE, mode, args.font, str(path_cache), str(path_pdf), _SAMPLE_TEXT)
+            outputs[mode] = (widths, path_pdf.read_bytes())
+
+        identical = outputs["parse"] == outputs["cache"]
+        print(f"Anchos y PDF idénticos: {identical}")
+        if not identical:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
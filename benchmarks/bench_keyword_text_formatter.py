@@ -0,0 +1,78 @@
+"""Compara `KeywordTextFormatter.format_text` contra el reemplazo keyword por keyword.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_keyword_text_formatter --keywords 10000 --texts 30
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from src.app.drivers.keyword_text_formatter import KeywordTextFormatter
+from src.core.drivers.keyword_text_formatter import KeywordFormat, KeywordsConfig
+
+
+def _legacy_format_text(text: str, keywords: KeywordsConfig) -> str:
+    """Implementación anterior: un `re.sub` por keyword, de la más larga a la más corta."""
+    out = text
+    for keyword_cfg in sorted(keywords.keywords, key=lambda item: len(item.keyword), reverse=True):
+        pattern = re.compile(rf"(?<!\w)({re.escape(keyword_cfg.keyword)})(?!\w)")
+        if keyword_cfg.formatter == "bold":
+            out = pattern.sub(lambda m: f"<b>{m.group(1)}</b>", out)
+    return out
+
+
+def _synthetic_keywords(n: int, rng: random.Random) -> list[str]:
+    """Keywords sin prefijos de palabra compartidos, para que ambos caminos den el mismo HTML."""
+    return [f"Skill{i:05d} {rng.choice(['Cloud', 'Data', 'Web', 'ML'])}" for i in range(n)]
+
+
+def _synthetic_text(keywords: list[str], rng: random.Random, n_words: int) -> str:
+    words = []
+    for _ in range(n_words):
+        words.append(rng.choice(keywords) if rng.random() < 0.1 else rng.choice(["trabajo", "con", "equipo", "➣"]))
+    return " ".join(words)
+
+
+def _median_s(fn, texts: list[str], keywords: KeywordsConfig, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for text in texts:
+            fn(text, keywords)
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keywords", type=int, default=10_000)
+    parser.add_argument("--texts", type=int, default=30)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    words = _synthetic_keywords(args.keywords, rng)
+    keywords = KeywordsConfig(keywords=[KeywordFormat(keyword=w) for w in words])
+    texts = [_synthetic_text(words, rng, args.words) for _ in range(args.texts)]
+    formatter = KeywordTextFormatter()
+
+    t = time.perf_counter()
+    formatter.format_text(texts[0], keywords)
+    compile_s = time.perf_counter() - t
+
+    legacy_s = _median_s(_legacy_format_text, texts, keywords, repeat=1)
+    new_s = _median_s(formatter.format_text, texts, keywords, repeat=args.repeat)
+    identical = all(formatter.format_text(t, keywords) == _legacy_format_text(t, keywords) for t in texts[:3])
+
+    print(f"keywords={args.keywords} texts={args.texts} words/text={args.words}")
+    print(f"legacy    | {legacy_s * 1e3:10.1f} ms")
+    print(f"automaton | {new_s * 1e3:10.1f} ms (+ compilación única {compile_s * 1e3:.1f} ms)")
+    print(f"speedup   | {legacy_s / new_s:10.1f}x | mismo HTML: {identical}")
+
+
+if __name__ == "__main__":
+    main()
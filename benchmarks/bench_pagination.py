@@ -0,0 +1,102 @@
+"""Render paginado de carreras largas: páginas, tiempo y pico de memoria por cantidad de posiciones.
+
+Para cada tamaño genera un export sintético y lo construye en memoria con `BuilderCVConfig(paginate=True)`
+y, como referencia, con `paginate=False` (todo en una página, lo que no entra queda bajo el margen). El
+pico de memoria es el de tracemalloc durante el build y crece con la cantidad de posiciones: el layout
+(todos los `Paragraph` de todas las páginas) se arma entero antes de dibujar, y reportlab guarda el
+stream de cada página hasta `save()` aunque `showPage` la cierre.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_pagination --positions 50 200 500 1000 --description-words 80
+"""
+
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_scaling import PERSONAL_INFORMATION
+from benchmarks.synthetic_export import write_synthetic_export
+from src.app.drivers.build_cv.service import BuildCVService
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.core.drivers.font_loader import FontLoaderConfig
+from src.core.entities import BuilderCVConfig, CVSettings, LinkedinData, PersonalInformation
+
+
+def _build(builder: BuildCVService, linkedin_data: LinkedinData, *, paginate: bool) -> tuple[float, int, int]:
+    """Devuelve segundos, páginas y bytes del PDF sin comprimir."""
+    buffer = BytesIO()
+    start = time.perf_counter()
+    result = builder.build_and_save(
+        path_pdf=buffer,
+        personal_information=PersonalInformation(**PERSONAL_INFORMATION),
+        linkedin_data=linkedin_data,
+        cfg_builder=BuilderCVConfig(paginate=paginate),
+    )
+    return time.perf_counter() - start, result.pages, len(buffer.getvalue())
+
+
+def _run_size(args: argparse.Namespace, n_positions: int, path_tmp: Path) -> Dict[str, Any]:
+    folder = write_synthetic_export(
+        path_tmp / f"export_{n_positions}",
+        n_positions=n_positions,
+        description_words=args.description_words,
+        bullets=args.bullets,
+    )
+    settings = CVSettings(folder_data=folder.name, path_data_dir=folder.parent, photo_name=args.photo_name)
+    linkedin_data = LinkedinDataService(settings=settings, use_cache=False).load()
+    builder = BuildCVService(settings=settings)
+
+    row: Dict[str, Any] = {"positions": n_positions}
+    for paginate in (True, False):
+        _build(builder, linkedin_data, paginate=paginate)  # calienta cachés de párrafos e imágenes
+        timings = []
+        for _ in range(args.repeat):
+            wall_s, pages, pdf_bytes = _build(builder, linkedin_data, paginate=paginate)
+            timings.append(wall_s)
+        tracemalloc.start()
+        _build(builder, linkedin_data, paginate=paginate)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        row["paginate" if paginate else "single"] = {
+            "pages": pages,
+            "median_wall_s": statistics.median(timings),
+            "peak_bytes": peak_bytes,
+            "pdf_bytes": pdf_bytes,
+        }
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, nargs="+", default=[50, 200, 500, 1000])
+    parser.add_argument("--description-words", type=int, default=80)
+    parser.add_argument("--bullets", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--font", default="HackNerdFont")
+    parser.add_argument("--photo-name", default="photo.jpg")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    FontLoader().load_fonts(FontLoaderConfig(base_name=args.font))
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = [_run_size(args, n, Path(tmp)) for n in args.positions]
+
+    print(f"{'positions':>9} | {'pages':>5} | {'paginado':>9} | {'pico':>9} | {'KB/pág':>7} | {'1 página':>9} | {'pico':>9}")
+    for row in rows:
+        paginated, single = row["paginate"], row["single"]
+        print(
+            f"{row['positions']:>9} | {paginated['pages']:>5} | {paginated['median_wall_s'] * 1e3:7.1f}ms | "
+            f"{paginated['peak_bytes'] / 1024:7.0f}KB | {paginated['peak_bytes'] / 1024 / paginated['pages']:7.1f} | "
+            f"{single['median_wall_s'] * 1e3:7.1f}ms | {single['peak_bytes'] / 1024:7.0f}KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Escalado del pipeline con exports sintéticos de tamaño creciente.
+
+Para cada tamaño genera un export, lo renderiza `--repeat` veces con `RenderCVService` instrumentado y
+guarda la mediana por etapa: carga del CSV (`csv_load`), cada fix (`fix:<nombre>`), `build` (con sus
+etapas internas) y `compress`. Los resultados quedan en JSON para comparar corridas.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.bench_scaling --positions 10 50 200 --description-words 60 --output data/benchmarks/scaling.json
+"""
+
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+
+import reportlab
+
+from benchmarks.synthetic_export import write_synthetic_export
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.linkedin_data.factory import CSVEngine
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.app.drivers.pdf_compressor_factory import PDF_COMPRESSORS, PDFCompressor, build_pdf_compressor
+from src.app.drivers.render_cv.service import RenderCVService
+from src.core.drivers.font_loader import FontLoaderConfig
+from src.core.entities import CVSettings, PersonalInformation, RunReport
+
+PERSONAL_INFORMATION = dict(
+    BIRTHDAY="1990-01-01",
+    location="Buenos Aires",
+    email="ada@example.com",
+    url_web_es="https://example.com/es",
+    url_web_en="https://example.com/en",
+)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def render_reports(
+    settings: CVSettings,
+    *,
+    repeat: int,
+    csv_engine: CSVEngine = "pandas",
+    pdf_compressor: PDFCompressor = "auto",
+    trace_memory: bool = False,
+) -> Tuple[List[RunReport], int]:
+    """Renderiza `repeat` veces en memoria con el pipeline instrumentado; devuelve los reportes y el tamaño del PDF."""
+    render_cv_service = RenderCVService(
+        settings=settings,
+        linkedin_data_service=LinkedinDataService(settings=settings, csv_engine=csv_engine, use_cache=False),
+        ghostscript=build_pdf_compressor(pdf_compressor),
+        instrument=True,
+        trace_memory=trace_memory,
+    )
+    reports: List[RunReport] = []
+    pdf_bytes = 0
+    for _ in range(repeat):
+        pdf_bytes = render_cv_service.render_to(
+            BytesIO(), personal_information=PersonalInformation(**PERSONAL_INFORMATION), compress=True
+        )
+        reports.append(render_cv_service.last_report)
+    return reports, pdf_bytes
+
+
+def _summarize(reports: List[RunReport], memory_reports: List[RunReport]) -> Dict[str, Dict[str, float]]:
+    """Tiempos de las corridas sin tracemalloc y picos de las corridas con tracemalloc."""
+    stages: Dict[str, Dict[str, List[float]]] = {}
+    for report in reports:
+        for stage in [*report.stages, report.model_copy(update={"name": "total"})]:
+            samples = stages.setdefault(stage.name, {"wall_s": [], "cpu_s": [], "peak_bytes": []})
+            samples["wall_s"].append(stage.wall_s)
+            samples["cpu_s"].append(stage.cpu_s)
+    for report in memory_reports:
+        for stage in [*report.stages, report.model_copy(update={"name": "total"})]:
+            if stage.name in stages and stage.peak_bytes is not None:
+                stages[stage.name]["peak_bytes"].append(stage.peak_bytes)
+    return {
+        name: {
+            "median_wall_s": statistics.median(samples["wall_s"]),
+            "min_wall_s": min(samples["wall_s"]),
+            "median_cpu_s": statistics.median(samples["cpu_s"]),
+            **({"max_peak_bytes": max(samples["peak_bytes"])} if samples["peak_bytes"] else {}),
+        }
+        for name, samples in stages.items()
+    }
+
+
+def _run_size(args: argparse.Namespace, n_positions: int, path_tmp: Path) -> Dict[str, Any]:
+    folder = write_synthetic_export(
+        path_tmp / f"export_{n_positions}",
+        n_positions=n_positions,
+        description_words=args.description_words,
+        bullets=args.bullets,
+        unicode=args.unicode,
+    )
+    settings = CVSettings(folder_data=folder.name, path_data_dir=folder.parent, photo_name=args.photo_name)
+    reports, pdf_bytes = render_reports(
+        settings, repeat=args.repeat, csv_engine=args.csv_engine, pdf_compressor=args.pdf_compressor
+    )
+    memory_reports: List[RunReport] = []
+    if args.memory:
+        memory_reports, _ = render_reports(
+            settings, repeat=1, csv_engine=args.csv_engine, pdf_compressor=args.pdf_compressor, trace_memory=True
+        )
+    return {
+        "positions": n_positions,
+        "description_words": args.description_words,
+        "bullets": args.bullets,
+        "unicode": args.unicode,
+        "csv_engine": args.csv_engine,
+        "pdf_bytes": pdf_bytes,
+        "stages": _summarize(reports, memory_reports),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--positions", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--description-words", type=int, default=40)
+    parser.add_argument("--bullets", type=int, default=3)
+    parser.add_argument("--unicode", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--csv-engine", choices=["pandas", "stream"], default="pandas")
+    parser.add_argument("--pdf-compressor", choices=PDF_COMPRESSORS, default="auto")
+    parser.add_argument("--memory", action="store_true", help="Suma una corrida con tracemalloc para los picos.")
+    parser.add_argument("--font", default="HackNerdFont")
+    parser.add_argument("--photo-name", default="photo.jpg")
+    parser.add_argument("--output", type=Path, default=Path("data/benchmarks/scaling.json"))
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    FontLoader().load_fonts(FontLoaderConfig(base_name=args.font))
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [_run_size(args, n, Path(tmp)) for n in args.positions]
+
+    result = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "reportlab": reportlab.Version,
+            "repeat": args.repeat,
+            "pdf_compressor": args.pdf_compressor,
+        },
+        "runs": runs,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    stage_names = ["csv_load", "build", "compress", "total"]
+    print(f"{'positions':>9} | " + " | ".join(f"{name:>10}" for name in stage_names) + " |   fixes")
+    for run in runs:
+        fixes_s = sum(v["median_wall_s"] for k, v in run["stages"].items() if k.startswith("fix:"))
+        row = " | ".join(f"{run['stages'].get(name, {}).get('median_wall_s', 0) * 1e3:8.1f}ms" for name in stage_names)
+        print(f"{run['positions']:>9} | {row} | {fixes_s * 1e3:5.1f}ms")
+    print(f"Resultados: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
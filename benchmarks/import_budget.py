@@ -0,0 +1,89 @@
+"""Presupuesto de tiempo de import del camino del CLI.
+
+Importa `main` (o el módulo pedido) en intérpretes nuevos con `-X importtime`, toma el mínimo del
+tiempo acumulado entre `--repeat` corridas y sale con código 1 si supera `--budget-ms` o si el import
+carga alguno de los módulos que solo deberían cargarse al usarse (pandas, PyMuPDF, platypus, canvas).
+
+`import main` ronda los 200-370 ms según la máquina y la corrida (casi todo pydantic y sus validadores); el presupuesto
+por defecto deja margen para ese ruido y aun así falla si vuelve al import algo como `ttfonts` (~200 ms).
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.import_budget --budget-ms 500
+    python -m benchmarks.import_budget --module batch --top 15
+"""
+
+from typing import Dict, List, Tuple
+import argparse
+import subprocess
+import sys
+
+DEFERRED_MODULES = ["pandas", "fitz", "pymupdf", "reportlab.platypus", "reportlab.pdfgen"]
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """`(módulo, µs propios, µs acumulados)` por línea de `-X importtime`."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_import(module: str) -> List[Tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Falló `import {module}`:\n{result.stderr[-2000:]}")
+    return _parse_importtime(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=500.0)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10, help="Imports de primer nivel más caros a mostrar.")
+    parser.add_argument("--allow", nargs="*", default=[], help="Módulos diferidos que se permite cargar.")
+    args = parser.parse_args()
+
+    best_ms = float("inf")
+    best_rows: List[Tuple[str, int, int]] = []
+    for _ in range(args.repeat):
+        rows = measure_import(args.module)
+        total_ms = next(cumulative for name, _, cumulative in reversed(rows) if name.strip() == args.module) / 1e3
+        if total_ms < best_ms:
+            best_ms, best_rows = total_ms, rows
+
+    top_level: Dict[str, int] = {}
+    for name, _, cumulative in best_rows:
+        # `-X importtime` indenta con dos espacios por nivel; nivel 1 son los imports directos del módulo.
+        if name.startswith("   ") and not name.startswith("     "):
+            top_level[name.strip()] = cumulative
+    print(f"import {args.module}: {best_ms:.1f} ms (mínimo de {args.repeat}, presupuesto {args.budget_ms:.0f} ms)")
+    for name, cumulative in sorted(top_level.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {cumulative / 1e3:8.1f} ms  {name}")
+
+    loaded = {name.strip() for name, _, _ in best_rows}
+    deferred = [
+        module for module in DEFERRED_MODULES
+        if module not in args.allow and any(name == module or name.startswith(f"{module}.") for name in loaded)
+    ]
+    failed = False
+    if deferred:
+        print(f"Módulos que deberían cargarse recién al usarse: {', '.join(deferred)}", file=sys.stderr)
+        failed = True
+    if best_ms > args.budget_ms:
+        print(f"El import supera el presupuesto: {best_ms:.1f} ms > {args.budget_ms:.0f} ms", file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
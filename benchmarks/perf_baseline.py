@@ -0,0 +1,277 @@
+"""Baselines de performance por etapa y comparador de regresiones.
+
+`record` renderiza un set fijo de perfiles sintéticos y guarda, por etapa, las muestras de tiempo de
+reloj (con su mediana y MAD) y el pico de memoria en `benchmarks/baselines/<nombre>.json`. `compare`
+repite la medición y sale con código 1 si alguna etapa vigilada empeora más que el umbral y más que
+el ruido medido. Las etapas son las de `src.app.drivers.instrumentation`: `positions` es
+`PositionsDrawer.draw_positions` y `fix:highlight_keywords_in_text` es `KeywordTextFormatter.format_text`
+sobre el resumen y cada descripción.
+
+Los tiempos se miden sin tracemalloc (una corrida aparte mide la memoria) y con los cachés calientes:
+la primera corrida de cada perfil se descarta.
+
+Calibración: entre render y render se corre una carga de referencia fija que no depende del código del
+repo (Python puro + zlib). `compare` escala la baseline por `referencia actual / referencia grabada`,
+así la deriva de la máquina entre sesiones (frecuencia, carga, otro runner) no se lee como regresión.
+La calibración corrige la velocidad general, no las diferencias de arquitectura, así que las baselines
+siguen siendo de la máquina en que se graban: no se versionan (`benchmarks/baselines/` está en
+`.gitignore`) y cada uno graba la suya antes de tocar el código.
+
+Uso (desde la raíz del repo):
+    python -m benchmarks.perf_baseline record local
+    python -m benchmarks.perf_baseline compare local --threshold-pct 15
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import argparse
+import gc
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+from benchmarks.bench_scaling import git_commit, render_reports
+from benchmarks.synthetic_export import write_synthetic_export
+from src.app.drivers.font_loader import FontLoader
+from src.core.drivers.font_loader import FontLoaderConfig
+from src.core.entities import CVSettings
+
+PATH_BASELINES_DIR = Path(__file__).parent / "baselines"
+PROFILES: Dict[str, Dict[str, Any]] = {
+    "small": dict(n_positions=10, description_words=20, bullets=2),
+    "medium": dict(n_positions=50, description_words=60, bullets=3),
+    "large": dict(n_positions=200, description_words=80, bullets=3, unicode=True),
+}
+WATCHED_STAGES = ["fix:highlight_keywords_in_text", "positions", "sidebar", "layout", "build", "compress", "total"]
+# Factor que lleva la MAD al desvío estándar de una normal.
+_MAD_TO_SIGMA = 1.4826
+
+
+def _mad(samples: List[float]) -> float:
+    median = statistics.median(samples)
+    return statistics.median(abs(sample - median) for sample in samples)
+
+
+def _reference_workload() -> float:
+    """Segundos de una carga fija parecida a la del pipeline (strings, dicts, ordenamiento y zlib)."""
+    gc.collect()  # que la basura del render anterior no caiga dentro de la medición
+    rng = random.Random(0)
+    words = ["".join(rng.choice("abcdefghij") for _ in range(8)) for _ in range(2000)]
+    t_start = time.perf_counter()
+    for _ in range(20):
+        counts: Dict[str, int] = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+        text = " ".join(f"<b>{word}</b>" if counts[word] > 1 else word for word in sorted(words))
+        zlib.compress(text.encode(), 6)
+    return time.perf_counter() - t_start
+
+
+def _measure_profile(name: str, *, repeat: int, path_tmp: Path) -> Dict[str, Any]:
+    folder = write_synthetic_export(path_tmp / name, **PROFILES[name])
+    settings = CVSettings(folder_data=folder.name, path_data_dir=folder.parent, photo_name="photo.jpg")
+    # Referencia intercalada con los renders: mide la misma deriva que sufren las etapas.
+    reports, reference_samples = [], []
+    for _ in range(repeat + 1):
+        reference_samples.append(_reference_workload())
+        reports.extend(render_reports(settings, repeat=1)[0])
+    memory_reports, _ = render_reports(settings, repeat=1, trace_memory=True)
+
+    wall_samples: Dict[str, List[float]] = {}
+    for report in reports[1:]:
+        wall_samples.setdefault("total", []).append(report.wall_s)
+        for stage in report.stages:
+            wall_samples.setdefault(stage.name, []).append(stage.wall_s)
+    peaks = {stage.name: stage.peak_bytes for stage in memory_reports[0].stages}
+    peaks["total"] = memory_reports[0].peak_bytes
+    return {
+        "reference_s": statistics.median(reference_samples[1:]),
+        "stages": {
+            stage_name: {
+                "median_s": statistics.median(samples),
+                "mad_s": _mad(samples),
+                "samples_s": samples,
+                "peak_bytes": peaks.get(stage_name),
+            }
+            for stage_name, samples in wall_samples.items()
+        },
+    }
+
+
+def _code_changed() -> bool | None:
+    """Si el código medido difiere de `HEAD` (entonces `git_commit` no describe lo que se midió)."""
+    try:
+        return bool(
+            subprocess.run(
+                ["git", "status", "--porcelain", "--", "src", "benchmarks", "main.py", ":!benchmarks/baselines"],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(profiles: List[str], *, repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        measured = {name: _measure_profile(name, repeat=repeat, path_tmp=Path(tmp)) for name in profiles}
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "code_changed": _code_changed(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "profiles": measured,
+    }
+
+
+def calibrated(stage: Dict[str, Any], scale: float) -> Dict[str, Any]:
+    """La etapa de la baseline llevada a la velocidad de la máquina actual."""
+    return {**stage, "median_s": stage["median_s"] * scale, "mad_s": stage["mad_s"] * scale}
+
+
+def compare_stage(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    *,
+    threshold_pct: float,
+    noise_k: float,
+    min_delta_s: float,
+    memory_threshold_pct: float,
+) -> List[str]:
+    """Motivos de regresión de una etapa; vacío si está dentro del umbral o del ruido.
+
+    `baseline` ya viene calibrada (`calibrated`). Un aumento cuenta si supera `threshold_pct` sobre la
+    mediana de la baseline, `noise_k` desvíos (estimados con la MAD mayor entre ambas corridas) y
+    `min_delta_s` en términos absolutos.
+    """
+    reasons = []
+    delta_s = current["median_s"] - baseline["median_s"]
+    noise_s = noise_k * _MAD_TO_SIGMA * max(baseline["mad_s"], current["mad_s"])
+    if delta_s > baseline["median_s"] * threshold_pct / 100 and delta_s > noise_s and delta_s > min_delta_s:
+        reasons.append(f"tiempo +{delta_s / baseline['median_s'] * 100:.1f}% (ruido ±{noise_s * 1e3:.2f}ms)")
+    if baseline.get("peak_bytes") and current.get("peak_bytes") is not None:
+        growth = current["peak_bytes"] / baseline["peak_bytes"] - 1
+        if growth * 100 > memory_threshold_pct:
+            reasons.append(f"memoria +{growth * 100:.1f}%")
+    return reasons
+
+
+def _path_baseline(name: str, path_dir: Path) -> Path:
+    return path_dir / f"{name}.json"
+
+
+def _record(args: argparse.Namespace) -> int:
+    path_baseline = _path_baseline(args.name, args.path_dir)
+    result = measure(args.profiles or list(PROFILES), repeat=args.repeat)
+    if result["meta"]["code_changed"]:
+        print(
+            f"Aviso: hay cambios sin commitear; la baseline no corresponde a {result['meta']['git_commit']}. "
+            "Commitear y volver a grabar.",
+            file=sys.stderr,
+        )
+    path_baseline.parent.mkdir(parents=True, exist_ok=True)
+    path_baseline.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"Baseline guardada: {path_baseline}")
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    path_baseline = _path_baseline(args.name, args.path_dir)
+    if not path_baseline.exists():
+        print(f"No existe la baseline {path_baseline}; grabala con `record {args.name}`.", file=sys.stderr)
+        return 2
+    baseline = json.loads(path_baseline.read_text(encoding="utf-8"))
+    if baseline["meta"]["platform"] != platform.platform() or baseline["meta"]["python"] != platform.python_version():
+        print(
+            f"~ Aviso: la baseline es de {baseline['meta']['platform']} / Python {baseline['meta']['python']}.",
+            file=sys.stderr,
+        )
+    profiles = args.profiles or list(baseline["profiles"])
+    current = measure(profiles, repeat=args.repeat)
+    stages = args.stages or WATCHED_STAGES
+
+    regressions = 0
+    print(f"{'perfil':>8} | {'etapa':<32} | {'baseline':>10} | {'actual':>10} | {'cambio':>7} | resultado")
+    for profile in profiles:
+        base_profile: Dict[str, Any] = baseline["profiles"].get(profile, {})
+        cur_profile: Dict[str, Any] = current["profiles"][profile]
+        scale = 1.0
+        if args.calibrate and base_profile.get("reference_s"):
+            scale = cur_profile["reference_s"] / base_profile["reference_s"]
+        print(f"{profile:>8} | calibración: referencia x{scale:.3f}")
+        for stage_name in stages:
+            base_stage: Optional[Dict[str, Any]] = base_profile.get("stages", {}).get(stage_name)
+            cur_stage: Optional[Dict[str, Any]] = cur_profile["stages"].get(stage_name)
+            if base_stage is None or cur_stage is None:
+                continue
+            base_stage = calibrated(base_stage, scale)
+            reasons = compare_stage(
+                base_stage,
+                cur_stage,
+                threshold_pct=args.threshold_pct,
+                noise_k=args.noise_k,
+                min_delta_s=args.min_delta_ms / 1e3,
+                memory_threshold_pct=args.memory_threshold_pct,
+            )
+            regressions += bool(reasons)
+            change = (cur_stage["median_s"] / base_stage["median_s"] - 1) * 100
+            print(
+                f"{profile:>8} | {stage_name:<32} | {base_stage['median_s'] * 1e3:8.2f}ms | "
+                f"{cur_stage['median_s'] * 1e3:8.2f}ms | {change:+6.1f}% | {'; '.join(reasons) or 'ok'}"
+            )
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    if regressions:
+        print(f"{regressions} etapa(s) con regresión respecto de {path_baseline}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--font", default="HackNerdFont")
+    parser.add_argument("--path-dir", type=Path, default=PATH_BASELINES_DIR, help="Carpeta de las baselines.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record = subparsers.add_parser("record", help="Mide y guarda una baseline con nombre.")
+    record.set_defaults(run=_record)
+
+    compare = subparsers.add_parser("compare", help="Mide y compara contra una baseline; sale con 1 si hay regresión.")
+    compare.add_argument("--stages", nargs="+", help=f"Etapas vigiladas (default: {' '.join(WATCHED_STAGES)}).")
+    compare.add_argument("--threshold-pct", type=float, default=15.0)
+    compare.add_argument("--noise-k", type=float, default=3.0, help="Desvíos de ruido que tiene que superar el aumento.")
+    compare.add_argument("--min-delta-ms", type=float, default=1.0)
+    compare.add_argument("--memory-threshold-pct", type=float, default=20.0)
+    compare.add_argument(
+        "--no-calibrate", dest="calibrate", action="store_false", help="Compara tiempos crudos, sin la referencia."
+    )
+    compare.add_argument("--output", type=Path, help="Guarda también la medición actual en JSON.")
+    compare.set_defaults(run=_compare)
+
+    for subparser in (record, compare):
+        subparser.add_argument("name")
+        subparser.add_argument("--profiles", nargs="+", choices=list(PROFILES))
+        subparser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    FontLoader().load_fonts(FontLoaderConfig(base_name=args.font))
+    sys.exit(args.run(args))
+
+
+if __name__ == "__main__":
+    main()
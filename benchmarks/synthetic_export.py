@@ -0,0 +1,118 @@
+"""Generador de exports sintéticos de LinkedIn para benchmarks.
+
+Uso (desde la raíz del repo), para tener un export de prueba en `data/`:
+    python -m benchmarks.synthetic_export data/Synthetic_200 --positions 200 --description-words 80
+"""
+
+import argparse
+import csv
+import random
+from pathlib import Path
+
+from src.core.hardcoded_config import SUMMARY_TECH_STACK_LABEL
+
+PROFILE_HEADER = [
+    "First Name", "Last Name", "Maiden Name", "Address", "Birth Date", "Headline", "Summary",
+    "Industry", "Zip Code", "Geo Location", "Twitter Handles", "Websites", "Instant Messengers",
+]
+POSITIONS_HEADER = ["Company Name", "Title", "Description", "Location", "Started On", "Finished On"]
+EDUCATION_HEADER = ["School Name", "Start Date", "End Date", "Notes", "Degree Name", "Activities"]
+
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+_WORDS = ["datos", "pipelines", "equipo", "servicios", "modelos", "métricas", "despliegue", "APIs", "Python", "SQL"]
+_UNICODE_WORDS = ["ñandú", "Zürich", "São Paulo", "año", "acción", "naïve", "Łódź", "€", "→", "—"]
+_BULLET_ITEMS = ["Pipelines", "APIs [FastAPI]", "Dashboards", "Scraping", "ETL", "Docker", "CI/CD", "Testing"]
+
+
+def _write_csv(path_csv: Path, header: list[str], rows: list[list[str]]) -> None:
+    with open(path_csv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _description(
+    i: int,
+    rng: random.Random,
+    *,
+    description_words: int,
+    bullets: int,
+    unicode: bool,
+) -> str:
+    """Oración base + relleno + viñetas `➣` + sección de logros con `●` y `■` (el markup de LinkedIn)."""
+    vocabulary = _WORDS + (_UNICODE_WORDS if unicode else [])
+    parts = [f"Trabajo con Python en el equipo {i}."]
+    if description_words:
+        parts.append(" ".join(rng.choice(vocabulary) for _ in range(description_words)) + ".")
+    if bullets:
+        parts.append(" ".join(f"➣ {_BULLET_ITEMS[(i + b) % len(_BULLET_ITEMS)]}" for b in range(bullets)))
+        parts.append(f"● Logros: ■ métrica {i}")
+    return " ".join(parts)
+
+
+def write_synthetic_export(
+    folder: Path,
+    *,
+    n_positions: int = 30,
+    n_educations: int = 3,
+    description_words: int = 0,
+    bullets: int = 2,
+    unicode: bool = False,
+    seed: int = 0,
+) -> Path:
+    """Escribe `Profile.csv`, `Positions.csv` y `Education.csv` en `folder`.
+
+    `description_words` agrega relleno a cada descripción, `bullets` la cantidad de viñetas `➣`
+    (con `0` no hay markup) y `unicode` mezcla palabras con acentos y símbolos fuera de ASCII.
+    """
+    rng = random.Random(seed)
+    folder.mkdir(parents=True, exist_ok=True)
+    summary = (
+        "Desarrollador Python con experiencia en Ciencia de Datos. ● Resumen: ➣ ETL ➣ APIs "
+        f"{SUMMARY_TECH_STACK_LABEL} Python, SQL, Docker"
+    )
+    _write_csv(folder / "Profile.csv", PROFILE_HEADER, [
+        ["Ada", "Lovelace", "", "", "", "Ingeniera de datos", summary, "Software", "", "Londres", "", "", ""],
+    ])
+    _write_csv(folder / "Positions.csv", POSITIONS_HEADER, [
+        [
+            f"Empresa {i}",
+            f"Puesto {i}" + (f" · {rng.choice(_UNICODE_WORDS)}" if unicode else ""),
+            _description(i, rng, description_words=description_words, bullets=bullets, unicode=unicode),
+            "" if i % 3 else "Buenos Aires",
+            f"{_MONTHS[i % 12]} {2024 - i % 40}",
+            "" if i == 0 else f"{_MONTHS[(i + 5) % 12]} {2025 - i % 40}",
+        ]
+        for i in range(n_positions)
+    ])
+    _write_csv(folder / "Education.csv", EDUCATION_HEADER, [
+        [f"Universidad {i}", str(2010 + i), "" if i == 0 else str(2014 + i), "", f"Título {i}", ""]
+        for i in range(n_educations)
+    ])
+    return folder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder", type=Path)
+    parser.add_argument("--positions", type=int, default=30)
+    parser.add_argument("--educations", type=int, default=3)
+    parser.add_argument("--description-words", type=int, default=0)
+    parser.add_argument("--bullets", type=int, default=2)
+    parser.add_argument("--unicode", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    folder = write_synthetic_export(
+        args.folder,
+        n_positions=args.positions,
+        n_educations=args.educations,
+        description_words=args.description_words,
+        bullets=args.bullets,
+        unicode=args.unicode,
+        seed=args.seed,
+    )
+    print(f"Export sintético: {folder}")
+
+
+if __name__ == "__main__":
+    main()
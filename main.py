@@ -1,5 +1,7 @@
 from pathlib import Path
+from typing import Optional
 import logging
+import os
 
 from dotenv import load_dotenv
 
@@ -8,47 +10,67 @@ load_dotenv()
 from src.app.configure_logging import configure_logging
 configure_logging()
 
-from src.app.drivers.build_cv.service import BuildCVService
 from src.app.drivers.font_loader import FontLoader
-from src.app.drivers.ghostscript import GhostScript
-from src.app.drivers.linkedin_data.fix.service import FixLinkedinDataService
-from src.core.constants import get_path_pdf_output
-from src.core.entities import PersonalInformation
-from src.app.drivers.linkedin_data.csv_repository import LinkedinCSVRepository
+from src.core.entities import AutoFitConfig, CVSettings, PersonalInformation, ProfilingConfig
+from src.app.drivers.linkedin_data.factory import CSVEngine
+from src.app.drivers.pdf_compressor_factory import PDFCompressor, build_pdf_compressor
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.app.drivers.profiling import profiling, profiling_config_from_env
+from src.app.drivers.render_cv.service import RenderCVService
 
 logger = logging.getLogger(__name__)
 
-def _compress_pdf(path_pdf: Path) -> None:
-    ghostscript = GhostScript()
-    ghostscript.compress_pdf(path_pdf)
-    logger.info(f"~ Export PDF: {path_pdf}")
 
-
-
-def main(*, personal_information: PersonalInformation, compress: bool = True) -> None:
+def main(
+    *,
+    personal_information: PersonalInformation,
+    compress: bool = True,
+    csv_engine: CSVEngine = "pandas",
+    use_cache: bool = True,
+    auto_fit: bool = False,
+    pdf_compressor: PDFCompressor = "auto",
+    path_report: Optional[Path] = None,
+    trace_memory: bool = False,
+    profiling_cfg: Optional[ProfilingConfig] = None,
+) -> None:
+    """Con `path_report`, mide cada etapa y guarda el reporte en JSON (con `trace_memory`, picos de
+    memoria en vez de tiempos); con `profiling_cfg`, perfila la corrida."""
     logger.info("==================== Iniciando ====================")
     FontLoader.load_font_from_env()
 
-    linkedin_data_repository = LinkedinCSVRepository()
-    linkedin_data = linkedin_data_repository.load_linkedin_data()
-    linkedin_data = FixLinkedinDataService().fix(linkedin_data)
-
-    builder_cv = BuildCVService()
-    path_pdf = get_path_pdf_output(linkedin_data.profile.full_name)
-    positions_result = builder_cv.build_and_save(
-        path_pdf=path_pdf,
-        personal_information=personal_information,
-        linkedin_data=linkedin_data,
+    settings = CVSettings()
+    render_cv_service = RenderCVService(
+        settings=settings,
+        linkedin_data_service=LinkedinDataService(settings=settings, csv_engine=csv_engine, use_cache=use_cache),
+        ghostscript=build_pdf_compressor(pdf_compressor) if compress else None,
+        instrument=path_report is not None,
+        trace_memory=trace_memory,
     )
-
-    logger.info("==================== Líneas divisorias posición ====================")
-    builder_cv.draw_lines(path_pdf=path_pdf, lines=positions_result.divider_lines)
-
-    if compress:
-        logger.info("==================== Compress and export PDF ====================")
-        _compress_pdf(path_pdf=path_pdf)
+    with profiling(profiling_cfg, name=settings.folder_data or "cv"):
+        render_cv_service.render(
+            personal_information=personal_information,
+            compress=compress,
+            auto_fit=AutoFitConfig() if auto_fit else None,
+        )
+    if path_report is not None:
+        path_report.write_text(render_cv_service.last_report.to_json(), encoding="utf-8")
+        logger.info(f"~ Reporte de etapas: {path_report}")
 
 if __name__ == "__main__":
     COMPRESS = True
+    CSV_ENGINE = os.getenv("CSV_ENGINE", "pandas")
+    AUTO_FIT = os.getenv("AUTO_FIT", "false").lower() in ("1", "true", "yes")
+    PDF_COMPRESSOR = os.getenv("PDF_COMPRESSOR", "auto")
+    RUN_REPORT = os.getenv("RUN_REPORT")
+    TRACE_MEMORY = os.getenv("TRACE_MEMORY", "false").lower() in ("1", "true", "yes")
     personal_information = PersonalInformation()
-    main(personal_information=personal_information, compress=COMPRESS)
+    main(
+        personal_information=personal_information,
+        compress=COMPRESS,
+        csv_engine=CSV_ENGINE,
+        auto_fit=AUTO_FIT,
+        pdf_compressor=PDF_COMPRESSOR,
+        path_report=Path(RUN_REPORT) if RUN_REPORT else None,
+        trace_memory=TRACE_MEMORY,
+        profiling_cfg=profiling_config_from_env(),
+    )
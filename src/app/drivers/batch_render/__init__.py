@@ -0,0 +1,3 @@
+from src.app.drivers.batch_render.service import BatchRenderService
+
+__all__ = ["BatchRenderService"]
@@ -0,0 +1,239 @@
+"""Render de muchos CVs en paralelo con un pool de procesos reutilizable."""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+import time
+
+from src.app.configure_logging import configure_logging
+from src.app.drivers.font_loader import FontLoader
+from src.app.drivers.ghostscript import GhostScript
+from src.app.drivers.ghostscript_parallel import ParallelGhostScript
+from src.app.drivers.linkedin_data.factory import CSVEngine
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.app.drivers.pdf_compressor_factory import PDFCompressor, build_pdf_compressor
+from src.app.drivers.render_cv.service import RenderCVService
+from src.core.constants import ENV_PHOTO_NAME
+from src.core.drivers.font_loader import FontLoaderConfig
+from src.core.entities import (
+    AutoFitConfig,
+    BatchJob,
+    BatchJobResult,
+    BatchSummary,
+    CompressedPDF,
+    CVSettings,
+    ManifestPersonalInformation,
+    PersonalInformation,
+)
+from src.core.entities.instrumentation import render_prometheus
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_BIRTHDAY_KEY = "BIRTHDAY"
+
+
+def _init_worker(font_name: str) -> None:
+    """Se ejecuta una vez por proceso: las fuentes quedan parseadas y registradas para todos sus jobs.
+
+    Sin registro diferido (`lazy=False`): el parseo se paga acá, fuera del primer job de cada worker.
+    """
+    configure_logging()
+    FontLoader().load_fonts(FontLoaderConfig(base_name=font_name, lazy=False))
+
+
+def _render_job(job: BatchJob) -> BatchJobResult:
+    t_start = time.perf_counter()
+    try:
+        render_cv_service = RenderCVService(
+            settings=job.settings,
+            linkedin_data_service=LinkedinDataService(
+                settings=job.settings,
+                csv_engine=job.csv_engine,
+                use_cache=job.use_cache,
+            ),
+            ghostscript=build_pdf_compressor(job.pdf_compressor) if job.compress else None,
+            instrument=job.instrument,
+            trace_memory=job.trace_memory,
+        )
+        path_pdf = render_cv_service.render(
+            personal_information=job.personal_information,
+            compress=job.compress,
+            auto_fit=AutoFitConfig() if job.auto_fit else None,
+        )
+    except Exception as e:
+        logger.exception(f"~ Falló el perfil '{job.profile}'")
+        return BatchJobResult(
+            profile=job.profile,
+            status="error",
+            duration_s=time.perf_counter() - t_start,
+            error=f"{type(e).__name__}: {e}",
+        )
+    return BatchJobResult(
+        profile=job.profile,
+        status="ok",
+        duration_s=time.perf_counter() - t_start,
+        output_size_bytes=path_pdf.stat().st_size,
+        path_pdf=path_pdf,
+        report=render_cv_service.last_report,
+    )
+
+
+def _personal_information_from_manifest(entry: Dict[str, Any]) -> PersonalInformation:
+    """Las claves del manifiesto son las mismas que las del `.env` (`BIRTHDAY`, `EMAIL`, ...)."""
+    values = {
+        (_MANIFEST_BIRTHDAY_KEY if key.upper() == _MANIFEST_BIRTHDAY_KEY else key.lower()): value
+        for key, value in entry.items()
+        if key.upper() != ENV_PHOTO_NAME
+    }
+    return ManifestPersonalInformation(**values)
+
+
+def _finish_compression(result: BatchJobResult, future: "Future[CompressedPDF]") -> BatchJobResult:
+    try:
+        compressed = future.result()
+    except Exception as e:
+        logger.error(f"~ Falló la compresión del perfil '{result.profile}': {e}")
+        return result.model_copy(update={"status": "error", "error": f"Compresión: {type(e).__name__}: {e}"})
+    result.path_pdf.write_bytes(compressed.pdf)
+    return result.model_copy(
+        update={
+            "duration_s": result.duration_s + (compressed.duration_s or 0.0),
+            "output_size_bytes": compressed.size_after,
+        }
+    )
+
+
+class BatchRenderService:
+    def __init__(
+        self,
+        *,
+        workers: Optional[int] = None,
+        font_name: str = "HackNerdFont",
+        gs_workers: int = 0,
+        gs_timeout_s: float = 120.0,
+    ) -> None:
+        """Con `gs_workers > 0` y `gs` instalado, la compresión Ghostscript sale de los workers de render
+        y la hace un `ParallelGhostScript` en este proceso, en paralelo con el render de los perfiles siguientes.
+        Sin `gs`, cada worker comprime por su cuenta y el resumen lo registra en `warnings`.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.font_name = font_name
+        self.gs_workers = gs_workers
+        self.gs_timeout_s = gs_timeout_s
+
+    @staticmethod
+    def _compresses_with_gs(job: BatchJob) -> bool:
+        return job.compress and job.pdf_compressor in ("auto", "ghostscript")
+
+    def _build_parallel_gs(self, jobs: List[BatchJob], warnings: List[str]) -> Optional[ParallelGhostScript]:
+        if self.gs_workers <= 0 or not any(self._compresses_with_gs(job) for job in jobs):
+            return None
+        if not GhostScript.is_available():
+            message = (
+                f"Se pidieron {self.gs_workers} llamadas gs en paralelo pero Ghostscript no está instalado; "
+                "cada worker comprime con PyMuPDF."
+            )
+            logger.warning(f"~ {message}")
+            warnings.append(message)
+            return None
+        return ParallelGhostScript(workers=self.gs_workers, timeout_s=self.gs_timeout_s)
+
+    @staticmethod
+    def load_jobs(
+        *,
+        path_exports_dir: Path,
+        path_manifest: Path,
+        path_output_dir: Path,
+        compress: bool = True,
+        pdf_compressor: PDFCompressor = "auto",
+        csv_engine: CSVEngine = "pandas",
+        use_cache: bool = True,
+        auto_fit: bool = False,
+        instrument: bool = False,
+        trace_memory: bool = False,
+    ) -> List[BatchJob]:
+        """Un job por entrada del manifiesto: `{"<carpeta o .zip en exports_dir>": {...}}`."""
+        manifest: Dict[str, Dict[str, Any]] = json.loads(path_manifest.read_text(encoding="utf-8"))
+        jobs: List[BatchJob] = []
+        for profile, entry in manifest.items():
+            path_export = path_exports_dir / profile
+            if not path_export.exists():
+                raise FileNotFoundError(f"No existe el export del perfil '{profile}': {path_export}")
+            photo_name = entry.get(ENV_PHOTO_NAME) or entry.get(ENV_PHOTO_NAME.lower())
+            if not photo_name:
+                raise ValueError(f"Falta '{ENV_PHOTO_NAME}' en el manifiesto para '{profile}'.")
+            jobs.append(
+                BatchJob(
+                    profile=profile,
+                    settings=CVSettings(
+                        folder_data=profile,
+                        photo_name=photo_name,
+                        path_data_dir=path_exports_dir,
+                        path_output_dir=path_output_dir / Path(profile).stem,
+                    ),
+                    personal_information=_personal_information_from_manifest(entry),
+                    compress=compress,
+                    pdf_compressor=pdf_compressor,
+                    csv_engine=csv_engine,
+                    use_cache=use_cache,
+                    auto_fit=auto_fit,
+                    instrument=instrument,
+                    trace_memory=trace_memory,
+                )
+            )
+        return jobs
+
+    def run(self, jobs: List[BatchJob]) -> BatchSummary:
+        logger.info(f"==================== Batch: {len(jobs)} perfiles, {self.workers} workers ====================")
+        t_start = time.perf_counter()
+        warnings: List[str] = []
+        parallel_gs = self._build_parallel_gs(jobs, warnings)
+        deferred = [parallel_gs is not None and self._compresses_with_gs(job) for job in jobs]
+        render_jobs = [job.model_copy(update={"compress": False}) if d else job for job, d in zip(jobs, deferred)]
+
+        results: List[Optional[BatchJobResult]] = [None] * len(jobs)
+        compressions: List[Tuple[int, "Future[CompressedPDF]"]] = []
+        with parallel_gs or nullcontext():
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.font_name,),
+            ) as pool:
+                renders = {pool.submit(_render_job, job): idx for idx, job in enumerate(render_jobs)}
+                # En el orden en que terminan: un render lento no frena la compresión de los que ya están.
+                for render in as_completed(renders):
+                    idx = renders[render]
+                    result = results[idx] = render.result()
+                    if deferred[idx] and result.status == "ok":
+                        compressions.append((idx, parallel_gs.submit(result.path_pdf.read_bytes())))
+            for idx, future in compressions:
+                results[idx] = _finish_compression(results[idx], future)
+        summary = BatchSummary(
+            workers=self.workers,
+            duration_s=time.perf_counter() - t_start,
+            jobs=results,
+            gs_workers=parallel_gs.workers if parallel_gs is not None else 0,
+            warnings=warnings,
+        )
+        logger.info(f"~ Batch terminado: ok={summary.n_ok} error={summary.n_error} en {summary.duration_s:.2f}s")
+        return summary
+
+    @staticmethod
+    def write_summary(summary: BatchSummary, path_summary: Path) -> None:
+        path_summary.parent.mkdir(parents=True, exist_ok=True)
+        path_summary.write_text(summary.model_dump_json(indent=2), encoding="utf-8")
+        logger.info(f"~ Resumen batch: {path_summary}")
+
+    @staticmethod
+    def write_metrics(summary: BatchSummary, path_metrics: Path) -> None:
+        """Métricas por etapa de los jobs instrumentados, en formato de texto de Prometheus."""
+        path_metrics.parent.mkdir(parents=True, exist_ok=True)
+        path_metrics.write_text(
+            render_prometheus((({"profile": job.profile}, job.report) for job in summary.jobs if job.report)),
+            encoding="utf-8",
+        )
+        logger.info(f"~ Métricas batch: {path_metrics}")
@@ -0,0 +1,67 @@
+"""Búsqueda del factor de escala que hace entrar el CV en una página, usando sólo el layout."""
+
+from typing import Callable, Dict
+import logging
+
+from src.core.entities import AutoFitConfig, AutoFitResult, CVLayout
+
+logger = logging.getLogger(__name__)
+
+_REPORTED_STYLES = (
+    "JobTitle",
+    "JobSubTitle",
+    "JobDesc",
+    "SidebarName",
+    "SidebarHeadline",
+    "SidebarTitle",
+    "SidebarText",
+    "SidebarLinks",
+)
+
+
+class AutoFitSearch:
+    """Búsqueda binaria del mayor `scale` en `[min_scale, max_scale]` cuyo layout no tiene overflow.
+
+    Cada layout medido se guarda por escala, así el layout elegido se reproduce tal cual sin volver a medir.
+    Si ni con `min_scale` entra en una página y el layout a `max_scale` se pagina sin overflow, se usa ese.
+    """
+
+    def search(self, *, cfg: AutoFitConfig, layout_at: Callable[[float], CVLayout]) -> tuple[CVLayout, AutoFitResult]:
+        layouts: Dict[float, CVLayout] = {}
+
+        def measure(scale: float) -> CVLayout:
+            if scale not in layouts:
+                layouts[scale] = layout_at(scale)
+            return layouts[scale]
+
+        best = measure(cfg.max_scale)
+        if not best.fits:
+            best = measure(cfg.min_scale)
+            if best.fits:
+                lo, hi = cfg.min_scale, cfg.max_scale
+                for _ in range(cfg.max_iterations):
+                    if hi - lo <= cfg.tolerance:
+                        break
+                    mid = (lo + hi) / 2
+                    layout = measure(mid)
+                    if layout.fits:
+                        lo, best = mid, layout
+                    else:
+                        hi = mid
+            else:
+                logger.warning(f"~ Auto-fit: ni con scale={cfg.min_scale} entra el contenido en la página.")
+                paginated = measure(cfg.max_scale)
+                if not paginated.overflow:
+                    best = paginated
+
+        result = AutoFitResult(
+            scale=best.scale,
+            fits=best.fits,
+            n_layouts=len(layouts),
+            font_sizes={name: best.styles[name].fontSize for name in _REPORTED_STYLES},
+            draw_config=best.draw_config,
+        )
+        logger.info(f"~ Auto-fit: scale={result.scale:.4f} fits={result.fits} layouts={result.n_layouts}")
+        logger.info(f"~ Auto-fit: font_sizes={ {k: round(v, 2) for k, v in result.font_sizes.items()} }")
+        logger.info(f"~ Auto-fit: spacer_height={result.draw_config.spacer_height:.2f}")
+        return best, result
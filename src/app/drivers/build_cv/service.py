@@ -1,28 +1,30 @@
 """Servicio de construcción del CV en PDF."""
 
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 import logging
 
-import fitz
-from reportlab.lib.styles import StyleSheet1
 from reportlab.pdfgen.canvas import Canvas
 
-from src.app.drivers.build_cv._pdf_line_drawer import PDFLineDrawer
+from src.app.drivers.build_cv._auto_fit import AutoFitSearch
 from src.app.drivers.draw_cv.service import DrawCVService
-from src.core.constants import PATH_PHOTO
+from src.app.drivers.instrumentation import stage
+from src.app.drivers.layout_cv.service import LayoutCVService
+from src.app.drivers.photo_preprocessor import PhotoPreprocessor
+from src.app.drivers.profiling import profiling
 from src.core.drivers.builder import CoreBuilderCV
 from src.core.entities import (
+    AutoFitConfig,
     BackgroundDrawCfg,
     BuilderCVConfig,
-    DividerLine,
+    CVLayout,
+    CVSettings,
     DrawCVConfig,
     DrawPositionsResult,
     LinkedinData,
     PersonalInformation,
     PhotoDrawCfg,
-    PositionsDrawCfg,
-    SidebarDrawCfg,
+    ProfilingConfig,
     SizesCV,
     StyleCV,
 )
@@ -31,113 +33,176 @@ logger = logging.getLogger(__name__)
 
 
 class BuildCVService(CoreBuilderCV):
-    """Orquesta la construcción y guardado del CV."""
+    """Orquesta la construcción y guardado del CV.
+
+    Con `profiling`, cada `build_and_save` se perfila (salvo que ya corra dentro de otro perfilado).
+    """
 
     def __init__(
         self,
         *,
         draw_cv_service: Optional[DrawCVService] = None,
-        pdf_line_drawer: Optional[PDFLineDrawer] = None,
+        layout_cv_service: Optional[LayoutCVService] = None,
+        auto_fit_search: Optional[AutoFitSearch] = None,
+        photo_preprocessor: Optional[PhotoPreprocessor] = None,
+        settings: Optional[CVSettings] = None,
+        profiling: Optional[ProfilingConfig] = None,
     ):
+        self.settings = settings or CVSettings()
+        self.profiling = profiling
         self.draw_cv_service = draw_cv_service or DrawCVService()
-        self.pdf_line_drawer = pdf_line_drawer or PDFLineDrawer()
+        self.layout_cv_service = layout_cv_service or LayoutCVService()
+        self.auto_fit_search = auto_fit_search or AutoFitSearch()
+        self.photo_preprocessor = photo_preprocessor or PhotoPreprocessor()
+
+    def layout(
+        self,
+        *,
+        personal_information: PersonalInformation,
+        linkedin_data: LinkedinData,
+        style_cv: Optional[StyleCV] = None,
+        sizes_cv: Optional[SizesCV] = None,
+        cfg_builder: Optional[BuilderCVConfig] = None,
+        draw_config: Optional[DrawCVConfig] = None,
+        scale: float = 1.0,
+    ) -> CVLayout:
+        """Mide y ubica el CV sin renderizar; sirve para chequear si entra en la página."""
+        return self.layout_cv_service.layout(
+            personal_information=personal_information,
+            linkedin_data=linkedin_data,
+            style_cv=style_cv,
+            sizes_cv=sizes_cv,
+            cfg_builder=cfg_builder,
+            draw_config=draw_config,
+            scale=scale,
+        )
 
     def build_and_save(
         self,
         *,
-        path_pdf: Path,
+        path_pdf: Union[Path, BinaryIO],
+        personal_information: PersonalInformation,
+        linkedin_data: LinkedinData,
+        style_cv: Optional[StyleCV] = None,
+        sizes_cv: Optional[SizesCV] = None,
+        cfg_builder: Optional[BuilderCVConfig] = None,
+        auto_fit: Optional[AutoFitConfig] = None,
+    ) -> DrawPositionsResult:
+        """`path_pdf` puede ser una ruta o un archivo binario abierto (por ejemplo `BytesIO`).
+
+        Con `auto_fit`, busca primero la escala que entra en la página y renderiza una sola vez.
+        """
+        with profiling(self.profiling, name=self.settings.folder_data or "cv"):
+            return self._build_and_save(
+                path_pdf=path_pdf,
+                personal_information=personal_information,
+                linkedin_data=linkedin_data,
+                style_cv=style_cv,
+                sizes_cv=sizes_cv,
+                cfg_builder=cfg_builder,
+                auto_fit=auto_fit,
+            )
+
+    def _build_and_save(
+        self,
+        *,
+        path_pdf: Union[Path, BinaryIO],
         personal_information: PersonalInformation,
         linkedin_data: LinkedinData,
         style_cv: Optional[StyleCV] = None,
         sizes_cv: Optional[SizesCV] = None,
         cfg_builder: Optional[BuilderCVConfig] = None,
+        auto_fit: Optional[AutoFitConfig] = None,
     ) -> DrawPositionsResult:
         logger.info("==================== Creando CV ====================")
-        if not PATH_PHOTO.exists():
-            raise FileNotFoundError(f"No existe la foto de perfil: {PATH_PHOTO}")
+        path_photo = self.settings.path_photo
+        if not path_photo.exists():
+            raise FileNotFoundError(f"No existe la foto de perfil: {path_photo}")
 
         style_cv = style_cv or StyleCV()
         sizes_cv = sizes_cv or SizesCV()
         cfg_builder = cfg_builder or BuilderCVConfig()
         draw_config = DrawCVConfig()
         page_width, page_height = cfg_builder.page_size
-        canvas = Canvas(str(path_pdf), pagesize=cfg_builder.page_size)
-        styles: StyleSheet1 = style_cv.get_styles()
-
-        self.draw_cv_service.draw_background(
-            c=canvas,
-            cfg=BackgroundDrawCfg(
-                color=(
-                    style_cv.background.red,
-                    style_cv.background.green,
-                    style_cv.background.blue,
-                ),
-                page_width=page_width,
-                page_height=page_height,
-            ),
-        )
-        self.draw_cv_service.draw_sidebar(
-            c=canvas,
-            cfg=SidebarDrawCfg(
-                linkedin_data=linkedin_data,
+
+        def layout_at(scale: float) -> CVLayout:
+            return self.layout(
                 personal_information=personal_information,
-                sizes_cv=sizes_cv,
+                linkedin_data=linkedin_data,
                 style_cv=style_cv,
-                styles=styles,
-                page_height=page_height,
-            ),
-            draw_config=draw_config,
-        )
-        self.draw_cv_service.draw_photo(
-            c=canvas,
-            cfg=PhotoDrawCfg(
-                path_photo=PATH_PHOTO,
                 sizes_cv=sizes_cv,
-                page_height=page_height,
-                is_photo_circle=cfg_builder.is_photo_circle,
-            ),
-            draw_config=draw_config,
+                cfg_builder=cfg_builder,
+                draw_config=draw_config,
+                scale=scale,
+            )
+
+        auto_fit_result = None
+        with stage("layout"):
+            if auto_fit is not None:
+                layout, auto_fit_result = self.auto_fit_search.search(cfg=auto_fit, layout_at=layout_at)
+            else:
+                layout = layout_at(1.0)
+        cache_info = self.layout_cv_service.paragraph_cache_info()
+        logger.debug(
+            f"~ Caché de párrafos: hits={cache_info.hits} misses={cache_info.misses} "
+            f"size={cache_info.size}/{cache_info.maxsize}"
         )
-        positions_result = self.draw_cv_service.draw_positions(
-            c=canvas,
-            cfg=PositionsDrawCfg(
-                linkedin_data=linkedin_data,
-                sizes_cv=sizes_cv,
-                styles=styles,
-                page_width=page_width,
-                page_height=page_height,
+        if layout.overflow:
+            logger.warning(
+                f"~ El contenido no entra en la página (sidebar overflow={layout.sidebar.overflow}, "
+                f"posiciones overflow={layout.body.overflow})."
+            )
+        if layout.body.pages > 1:
+            logger.info(f"~ El CV ocupa {layout.body.pages} páginas.")
+
+        canvas = Canvas(str(path_pdf) if isinstance(path_pdf, Path) else path_pdf, pagesize=cfg_builder.page_size)
+        background_cfg = BackgroundDrawCfg(
+            color=(
+                style_cv.background.red,
+                style_cv.background.green,
+                style_cv.background.blue,
             ),
-            draw_config=draw_config,
+            page_width=page_width,
+            page_height=page_height,
         )
-        canvas.save()
-        logger.info(f"~ Export PDF: {path_pdf}")
-        return positions_result
+        self.draw_cv_service.draw_background(c=canvas, cfg=background_cfg)
 
-    def draw_lines(
-        self,
-        *,
-        path_pdf: Path,
-        lines: list[DividerLine],
-        color: tuple[float, float, float] = (1, 0, 0),
-        width: float = 1.0,
-    ) -> None:
-        """Dibuja líneas divisorias con fitz.
-
-        FIXME:
-        - Esto está hardcodeado a la primera hoja (`doc[0]`).
-        - Se hace con fitz porque no pude agregar estas líneas directamente con reportlab
-          durante la etapa de render de posiciones.
-        """
-        # FIXME: Desactivado temporalmente. Las líneas salen rojas y fuera de posición.
-        flag = False
-        if not flag:
-            logger.warning(">>>>> BUG: Desactivado `draw_lines` (líneas rojas/fuera de posición).")
-        else:
-            doc = fitz.open(path_pdf)
-            if len(doc) != 1:
-                doc.close()
-                raise ValueError(f"Se esperaba un PDF de 1 página para dibujar líneas, pero se encontraron {len(doc)}.")
-            page = doc[0]
-            self.pdf_line_drawer.draw_lines(page=page, lines=lines, color=color, width=width)
-            doc.saveIncr()
-            doc.close()
+        def start_page() -> None:
+            # Cada continuación arranca con fondo y panel. `showPage` no acota la memoria: reportlab guarda
+            # el stream de cada página hasta `save()` y el layout completo ya está armado.
+            canvas.showPage()
+            self.draw_cv_service.draw_background(c=canvas, cfg=background_cfg)
+            self.draw_cv_service.draw_sidebar_panel(c=canvas, layout=layout.sidebar)
+        with stage("sidebar"):
+            self.draw_cv_service.draw_sidebar(c=canvas, layout=layout.sidebar)
+        with stage("photo"):
+            self.draw_cv_service.draw_photo(
+                c=canvas,
+                cfg=PhotoDrawCfg(
+                    path_photo=self.photo_preprocessor.prepare(
+                        path_photo,
+                        size_pt=sizes_cv.photo_size_pt,
+                        cfg=cfg_builder.photo,
+                        is_circle=cfg_builder.is_photo_circle,
+                        matte=style_cv.sidebar_panel,
+                    ),
+                    sizes_cv=sizes_cv,
+                    page_height=page_height,
+                    is_photo_circle=cfg_builder.is_photo_circle,
+                ),
+                draw_config=draw_config,
+            )
+        with stage("positions"):
+            positions_result = self.draw_cv_service.draw_positions(
+                c=canvas, layout=layout.body, new_page=start_page
+            )
+        image_cache_info = self.draw_cv_service.image_cache_info()
+        logger.debug(
+            f"~ Caché de imágenes: hits={image_cache_info.hits} misses={image_cache_info.misses} "
+            f"{image_cache_info.nbytes / 1024:.1f}KB/{image_cache_info.max_bytes / 1024:.0f}KB"
+        )
+        with stage("save"):
+            canvas.save()
+        if isinstance(path_pdf, Path):
+            logger.info(f"~ Export PDF: {path_pdf}")
+        return positions_result.model_copy(update={"auto_fit": auto_fit_result})
@@ -2,10 +2,14 @@
 
 from reportlab.pdfgen.canvas import Canvas
 
+from src.app.drivers.draw_cv.image_cache import IMAGE_RESOURCE_CACHE, ImageResourceCache
 from src.core.entities import ImageDrawCfg
 
 
 class ImageDrawer:
+    def __init__(self, image_cache: ImageResourceCache | None = None) -> None:
+        self.image_cache = image_cache or IMAGE_RESOURCE_CACHE
+
     def draw_image(self, *, c: Canvas, cfg: ImageDrawCfg) -> None:
         if cfg.is_circle:
             c.saveState()
@@ -13,13 +17,13 @@ class ImageDrawer:
             path.circle(cfg.center_x, cfg.center_y, cfg.radius)
             c.clipPath(path, stroke=0)
 
-        c.drawImage(
-            str(cfg.path_img),
+        self.image_cache.draw(
+            c,
+            cfg.path_img,
             cfg.x,
             cfg.y,
             width=cfg.width,
             height=cfg.height,
-            preserveAspectRatio=True,
             mask="auto",
         )
         if cfg.is_circle:
@@ -1,151 +1,59 @@
 """Render de posiciones/experiencia del CV."""
 
-from reportlab.lib.units import mm
+from typing import Callable, Optional
+
 from reportlab.pdfgen.canvas import Canvas
-from reportlab.platypus import Paragraph
 
-from src.app.drivers.draw_cv._image_title import ImageTitleDrawer
-from src.core.constants import PATH_PYTHON_ICON
-from src.core.entities import (
-    DividerLine,
-    DrawCVConfig,
-    DrawPositionsResult,
-    ImageTitleDrawCfg,
-    PositionsDrawCfg,
-    PositionsLayoutDTO,
-)
-from src.core.hardcoded_config import (
-    JOB_DESCRIPTION_FALLBACK,
-    format_final_credit_html,
-    format_job_subtitle_html,
-    format_job_title_html,
-)
+from src.app.drivers.draw_cv._image import ImageDrawer
+from src.app.drivers.instrumentation import stage
+from src.app.drivers.draw_cv._replay import draw_divider_lines, draw_placed_flowables
+from src.core.entities import BodyLayout, DividerLine, DrawPositionsResult
 
 
 class PositionsDrawer:
-    def __init__(self, image_title_drawer: ImageTitleDrawer) -> None:
-        self.image_title_drawer = image_title_drawer
-
-    def _draw_position_title(
-        self,
-        *,
-        c: Canvas,
-        cfg: PositionsDrawCfg,
-        draw_config: DrawCVConfig,
-        position_title: str,
-        x: float,
-        y_cursor: float,
-        width: float,
-        usable_height: float,
-        icon_size: float,
-    ) -> float:
-        title_cfg = ImageTitleDrawCfg(
-            path_img=PATH_PYTHON_ICON,
-            title_html=format_job_title_html(title=position_title),
-            img_size=icon_size,
-            image_to_title_dist=draw_config.dist_python_icon_to_title,
-        )
-        title_paragraph, h_icon = self.image_title_drawer.measure_title_row(
-            cfg=title_cfg,
-            style=cfg.styles["JobTitle"],
-            available_width=width,
-            available_height=usable_height,
-        )
-        y_icon = y_cursor - h_icon
-        c.saveState()
-        c.translate(x, y_icon)
-        self.image_title_drawer.draw_title_row(c=c, cfg=title_cfg, paragraph=title_paragraph, row_height=h_icon)
-        c.restoreState()
-        return y_icon
-
-    def _draw_subtitle_and_description(
-        self,
-        *,
-        c: Canvas,
-        cfg: PositionsDrawCfg,
-        draw_config: DrawCVConfig,
-        subtitle_text: str,
-        description_text: str,
-        x: float,
-        y_icon: float,
-        width: float,
-        usable_height: float,
-    ) -> float:
-        subtitle = Paragraph(format_job_subtitle_html(subtitle=subtitle_text), cfg.styles["JobSubTitle"])
-        _, h_sub = subtitle.wrap(width, usable_height)
-        desc = Paragraph(description_text or JOB_DESCRIPTION_FALLBACK, cfg.styles["JobDesc"])
-        _, h_desc = desc.wrap(width, usable_height)
-
-        y_cursor = y_icon - draw_config.line_thickness
-        subtitle.drawOn(c, x, y_cursor - h_sub)
-        y_cursor -= h_sub + draw_config.line_thickness
-        desc.drawOn(c, x, y_cursor - h_desc)
-        y_cursor -= h_desc + draw_config.spacer_height
-        return y_cursor
-
-    def _build_divider_line(self, *, cfg: PositionsDrawCfg, draw_config: DrawCVConfig, x: float, y_line: float) -> DividerLine:
-        return DividerLine(
-            x_start=x + draw_config.dist_line_spacing_left_mm * mm,
-            y_start=y_line,
-            x_end=cfg.page_width - cfg.sizes_cv.margin_pt - draw_config.dist_line_spacing_right_mm * mm,
-            y_end=y_line,
-        )
-
-    def _draw_final_credit(self, *, c: Canvas, cfg: PositionsDrawCfg, x: float, y_cursor: float, width: float, usable_height: float) -> None:
-        final_text = Paragraph(format_final_credit_html(), cfg.styles["JobDesc"])
-        _, h_final = final_text.wrap(width, usable_height)
-        final_text.drawOn(c, x, y_cursor - h_final)
+    def __init__(self, image_drawer: ImageDrawer) -> None:
+        self.image_drawer = image_drawer
 
     def draw_positions(
         self,
         *,
         c: Canvas,
-        cfg: PositionsDrawCfg,
-        draw_config: DrawCVConfig,
+        layout: BodyLayout,
+        new_page: Optional[Callable[[], None]] = None,
     ) -> DrawPositionsResult:
-        layout = PositionsLayoutDTO.from_positions_and_draw_config(
-            positions_cfg=cfg,
-            draw_config=draw_config,
+        """Dibuja todas las posiciones, incluso las que se pasan del margen inferior.
+
+        Con varias páginas cierra cada una (divisores incluidos) al pasar a la siguiente con `new_page`,
+        por defecto `c.showPage`, que puede redibujar el fondo de la página nueva.
+        """
+        new_page = new_page or c.showPage
+        current_page = 0
+        pending_lines: list[DividerLine] = []
+
+        def flush_to(page: int) -> None:
+            nonlocal current_page
+            while current_page < page:
+                with stage("lines"):
+                    draw_divider_lines(c, pending_lines, color=layout.divider_color, width=layout.divider_width)
+                pending_lines.clear()
+                new_page()
+                current_page += 1
+
+        for position in layout.positions:
+            flush_to(position.page)
+            self.image_drawer.draw_image(c=c, cfg=position.icon)
+            draw_placed_flowables(c, position.boxes)
+            if position.divider is not None:
+                pending_lines.append(position.divider)
+            for part in position.continuation:
+                flush_to(part.page)
+                draw_placed_flowables(c, [part])
+        flush_to(layout.final_credit.page)
+        draw_placed_flowables(c, [layout.final_credit])
+        with stage("lines"):
+            draw_divider_lines(c, pending_lines, color=layout.divider_color, width=layout.divider_width)
+        return DrawPositionsResult(
+            divider_lines=layout.divider_lines,
+            line_anchor_x=layout.line_anchor_x,
+            pages=layout.pages,
         )
-        y_cursor = layout.body_start_y
-        lines: list[DividerLine] = []
-
-        for idx, position in enumerate(cfg.linkedin_data.positions):
-            y_icon = self._draw_position_title(
-                c=c,
-                cfg=cfg,
-                draw_config=draw_config,
-                position_title=position.text_title,
-                x=layout.body_x,
-                y_cursor=y_cursor,
-                width=layout.body_width,
-                usable_height=layout.usable_height,
-                icon_size=layout.icon_size_pt,
-            )
-            y_cursor = self._draw_subtitle_and_description(
-                c=c,
-                cfg=cfg,
-                draw_config=draw_config,
-                subtitle_text=position.text_sub_title,
-                description_text=position.description,
-                x=layout.body_x,
-                y_icon=y_icon,
-                width=layout.body_width,
-                usable_height=layout.usable_height,
-            )
-
-            if idx < len(cfg.linkedin_data.positions) - 1:
-                # FIXME: Estas líneas son el input que luego consume BuildCVService.draw_lines()
-                # para dibujar divisores con fitz sobre el PDF final.
-                lines.append(self._build_divider_line(cfg=cfg, draw_config=draw_config, x=layout.body_x, y_line=y_icon))
-
-        self._draw_final_credit(
-            c=c,
-            cfg=cfg,
-            x=layout.body_x,
-            y_cursor=y_cursor,
-            width=layout.body_width,
-            usable_height=layout.usable_height,
-        )
-
-        return DrawPositionsResult(divider_lines=lines, line_anchor_x=layout.line_anchor_x)
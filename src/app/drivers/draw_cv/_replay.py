@@ -0,0 +1,27 @@
+"""Reproduce sobre el canvas las cajas ya ubicadas por el layout."""
+
+from typing import Iterable
+
+from reportlab.lib.colors import Color
+from reportlab.pdfgen.canvas import Canvas
+
+from src.core.entities import DividerLine, PlacedFlowable, PlacedRect
+
+
+def draw_placed_flowables(c: Canvas, boxes: Iterable[PlacedFlowable]) -> None:
+    for box in boxes:
+        box.flowable.drawOn(c, box.x, box.y)
+
+
+def draw_placed_rect(c: Canvas, rect: PlacedRect) -> None:
+    c.setFillColor(rect.color)
+    c.rect(rect.x, rect.y, rect.width, rect.height, fill=True, stroke=0)
+
+
+def draw_divider_lines(c: Canvas, lines: Iterable[DividerLine], *, color: Color, width: float) -> None:
+    c.saveState()
+    c.setStrokeColor(color)
+    c.setLineWidth(width)
+    for line in lines:
+        c.line(line.x_start, line.y_start, line.x_end, line.y_end)
+    c.restoreState()
@@ -0,0 +1,97 @@
+"""Caché de imágenes ya decodificadas, compartido por todos los documentos del proceso.
+
+`Canvas.drawImage` con una ruta reutiliza el XObject dentro de un mismo PDF, pero en cada documento
+nuevo vuelve a abrir el archivo y decodificar la imagen (y su alfa con `mask="auto"`). Acá se guarda un
+`ImageReader` por `(ruta, mtime)` y se le pasa a `drawImage`, que sigue armando el XObject con su API
+pública: el `ImageReader` conserva los píxeles decodificados entre documentos y `drawImage` lo nombra
+por su contenido, así que dentro de un PDF también se reutiliza.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Tuple
+import logging
+
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen.canvas import Canvas
+
+from src.core.entities import ImageCacheInfo
+
+logger = logging.getLogger(__name__)
+
+_ImageKey = Tuple[str, int]
+
+
+def _reader_nbytes(reader: ImageReader) -> int:
+    alpha = getattr(reader, "_dataA", None)
+    return len(reader.getRGBData()) + (len(alpha.getRGBData()) if alpha is not None else 0)
+
+
+class ImageResourceCache:
+    def __init__(self, *, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """`max_bytes` acota la suma de píxeles decodificados retenidos; `max_bytes=0` desactiva el caché."""
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries: "OrderedDict[_ImageKey, ImageReader]" = OrderedDict()
+
+    @staticmethod
+    def _key(path: Path) -> _ImageKey:
+        resolved = path.resolve()
+        return (str(resolved), resolved.stat().st_mtime_ns)
+
+    def reader(self, path: Path) -> ImageReader:
+        """`ImageReader` de `path` con los píxeles ya decodificados; sólo se lee el archivo en un miss."""
+        key = self._key(path)
+        reader = self._entries.get(key)
+        if reader is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return reader
+
+        self.misses += 1
+        reader = ImageReader(str(path))
+        nbytes = _reader_nbytes(reader)
+        if 0 < nbytes <= self.max_bytes:
+            self._entries[key] = reader
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= _reader_nbytes(evicted)
+        return reader
+
+    def draw(
+        self,
+        c: Canvas,
+        path: Path,
+        x: float,
+        y: float,
+        *,
+        width: float,
+        height: float,
+        mask: Any = "auto",
+        preserve_aspect_ratio: bool = True,
+    ) -> None:
+        """Reemplazo de `c.drawImage(str(path), ...)` que toma la imagen del caché."""
+        c.drawImage(
+            self.reader(path), x, y, width=width, height=height, mask=mask, preserveAspectRatio=preserve_aspect_ratio
+        )
+
+    def info(self) -> ImageCacheInfo:
+        return ImageCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            size=len(self._entries),
+            nbytes=self.nbytes,
+            max_bytes=self.max_bytes,
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+IMAGE_RESOURCE_CACHE = ImageResourceCache()
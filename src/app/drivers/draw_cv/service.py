@@ -1,21 +1,23 @@
 """Servicio principal de dibujo de CV, compuesto por sub-servicios."""
 
+from typing import Callable, Optional
+
 from reportlab.pdfgen.canvas import Canvas
 
 from src.app.drivers.draw_cv._background import BackgroundDrawer
 from src.app.drivers.draw_cv._image import ImageDrawer
-from src.app.drivers.draw_cv._image_title import ImageTitleDrawer
 from src.app.drivers.draw_cv._positions import PositionsDrawer
-from src.app.drivers.draw_cv._shared import SharedDrawUtils
 from src.app.drivers.draw_cv._sidebar import SidebarDrawer
+from src.app.drivers.draw_cv.image_cache import ImageResourceCache
 from src.core.drivers.draw import CoreDrawCVService
 from src.core.entities import (
     BackgroundDrawCfg,
+    BodyLayout,
     DrawCVConfig,
     DrawPositionsResult,
+    ImageCacheInfo,
     PhotoDrawCfg,
-    PositionsDrawCfg,
-    SidebarDrawCfg,
+    SidebarLayout,
 )
 
 
@@ -27,13 +29,16 @@ class DrawCVService(CoreDrawCVService):
         background_drawer: BackgroundDrawer | None = None,
         sidebar_drawer: SidebarDrawer | None = None,
         positions_drawer: PositionsDrawer | None = None,
+        image_cache: ImageResourceCache | None = None,
     ) -> None:
-        image_drawer = ImageDrawer()
-        shared_utils = SharedDrawUtils()
-        image_title_drawer = ImageTitleDrawer(image_drawer=image_drawer)
+        image_drawer = ImageDrawer(image_cache=image_cache)
+        self.image_cache = image_drawer.image_cache
         self.background_drawer = background_drawer or BackgroundDrawer()
-        self.sidebar_drawer = sidebar_drawer or SidebarDrawer(shared_utils=shared_utils, image_drawer=image_drawer)
-        self.positions_drawer = positions_drawer or PositionsDrawer(image_title_drawer=image_title_drawer)
+        self.sidebar_drawer = sidebar_drawer or SidebarDrawer(image_drawer=image_drawer)
+        self.positions_drawer = positions_drawer or PositionsDrawer(image_drawer=image_drawer)
+
+    def image_cache_info(self) -> ImageCacheInfo:
+        return self.image_cache.info()
 
     def draw_background(self, *, c: Canvas, cfg: BackgroundDrawCfg) -> None:
         self.background_drawer.draw_background(c=c, cfg=cfg)
@@ -41,8 +46,17 @@ class DrawCVService(CoreDrawCVService):
     def draw_photo(self, *, c: Canvas, cfg: PhotoDrawCfg, draw_config: DrawCVConfig) -> None:
         self.sidebar_drawer.draw_photo(c=c, cfg=cfg, draw_config=draw_config)
 
-    def draw_sidebar(self, *, c: Canvas, cfg: SidebarDrawCfg, draw_config: DrawCVConfig) -> None:
-        self.sidebar_drawer.draw_sidebar(c=c, cfg=cfg, draw_config=draw_config)
+    def draw_sidebar(self, *, c: Canvas, layout: SidebarLayout) -> None:
+        self.sidebar_drawer.draw_sidebar(c=c, layout=layout)
 
-    def draw_positions(self, *, c: Canvas, cfg: PositionsDrawCfg, draw_config: DrawCVConfig) -> DrawPositionsResult:
-        return self.positions_drawer.draw_positions(c=c, cfg=cfg, draw_config=draw_config)
+    def draw_sidebar_panel(self, *, c: Canvas, layout: SidebarLayout) -> None:
+        self.sidebar_drawer.draw_sidebar_panel(c=c, layout=layout)
+
+    def draw_positions(
+        self,
+        *,
+        c: Canvas,
+        layout: BodyLayout,
+        new_page: Optional[Callable[[], None]] = None,
+    ) -> DrawPositionsResult:
+        return self.positions_drawer.draw_positions(c=c, layout=layout, new_page=new_page)
@@ -2,18 +2,25 @@
 
 import os
 import logging
-from typing import List
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 from enum import Enum
 
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase.pdfmetrics import registerFontFamily
+import reportlab
 
 from src.core.constants import PATH_FONTS
 from src.core.drivers.font_loader import CoreFontLoader, FontLoaderConfig, PairNamePathFont
 
+if TYPE_CHECKING:
+    from reportlab.pdfbase.pdfmetrics import Font
+
+    from src.app.drivers.font_metrics_cache import FontMetricsCache
+
 logger = logging.getLogger(__name__)
 
+# Versiones de reportlab cuyos internals usa `_LazyFontRegistry`; con otra se registra todo al cargar.
+_VERIFIED_REPORTLAB_VERSIONS = frozenset({"4.3.1"})
+
 class FontType(Enum):
     FAMILY = "family"
     NORMAL = "normal"
@@ -22,8 +29,67 @@ class FontType(Enum):
     BOLD_ITALIC = "boldItalic"
 
 
+class _LazyFontRegistry(dict):
+    """Reemplazo de `pdfmetrics._fonts`: una fuente pendiente se construye y registra en su primer lookup.
+
+    Todo acceso de reportlab a una fuente (`getFont`, `stringWidth`, `setFont`, tags `<b>`/`<i>`
+    resueltos por `registerFontFamily`) pasa por `_fonts[name]`, así que las caras que el documento
+    no usa nunca se parsean.
+
+    Depende de internals de reportlab 4.3 (fijado en `requirements.txt`): que `pdfmetrics._fonts` sea el
+    dict del módulo que consultan `getFont`/`stringWidth`, y que `pdfmetrics._reset` lo limpie en el lugar
+    con `clear()`. Sólo se instala con las versiones de `_VERIFIED_REPORTLAB_VERSIONS`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending: Dict[str, Callable[[], None]] = {}
+
+    def __missing__(self, name: str) -> "Font":
+        register_font = self.pending.pop(name, None)
+        if register_font is None:
+            raise KeyError(name)
+        logger.debug(f"~ Registrando fuente '{name}' (primer uso).")
+        register_font()
+        return dict.__getitem__(self, name)
+
+    def clear(self) -> None:
+        """`pdfmetrics._reset` olvida las fuentes registradas; las pendientes tampoco sobreviven."""
+        super().clear()
+        self.pending.clear()
+
+    @staticmethod
+    def supported() -> bool:
+        return reportlab.Version in _VERIFIED_REPORTLAB_VERSIONS
+
+    @classmethod
+    def install(cls) -> "_LazyFontRegistry":
+        from reportlab.pdfbase import pdfmetrics
+
+        # `_reset` de reportlab limpia el dict en el lugar (ver `clear`), así que el reemplazo es estable.
+        if not isinstance(pdfmetrics._fonts, cls):
+            pdfmetrics._fonts = cls(pdfmetrics._fonts)
+        return pdfmetrics._fonts
+
+
 class FontLoader(CoreFontLoader):
-    """Carga fuentes usando la configuración central del core."""
+    """Carga fuentes usando la configuración central del core.
+
+    Las métricas parseadas de cada `.ttf` se reutilizan entre ejecuciones vía `FontMetricsCache`, que
+    se importa recién al registrar la primera cara: trae `reportlab.pdfbase.ttfonts` (~200 ms), y con
+    `lazy=True` cargar la configuración no registra nada todavía.
+    """
+
+    def __init__(self, *, metrics_cache: Optional["FontMetricsCache"] = None) -> None:
+        self._metrics_cache = metrics_cache
+
+    @property
+    def metrics_cache(self) -> "FontMetricsCache":
+        if self._metrics_cache is None:
+            from src.app.drivers.font_metrics_cache import FontMetricsCache
+
+            self._metrics_cache = FontMetricsCache()
+        return self._metrics_cache
 
     @staticmethod
     def load_font_from_env() -> None:
@@ -46,20 +112,46 @@ class FontLoader(CoreFontLoader):
             PairNamePathFont(name=f"{cfg.base_name}-BoldItalic", path=folder / f"{cfg.base_name}-BoldItalic.ttf", font_type=FontType.BOLD_ITALIC.value),
         ]
 
-    def _font_family_kwargs(self, cfg: FontLoaderConfig) -> dict:
-        return {pair.font_type: pair.name for pair in self._font_pairs(cfg)}
+    def _font_family_kwargs(self, font_pairs: List[PairNamePathFont]) -> dict:
+        return {pair.font_type: pair.name for pair in font_pairs}
 
     def _register_font_family(self, cfg: FontLoaderConfig) -> None:
+        # Diferido, como las métricas: `pdfmetrics` trae buena parte de reportlab y sólo hace falta al registrar.
+        from reportlab.pdfbase import pdfmetrics
+
         font_pairs = self._font_pairs(cfg)
         self._raise_if_missing_files(cfg, font_pairs)
+        faces = [pair for pair in font_pairs if pair.path]
+        family_kwargs = self._font_family_kwargs(font_pairs)
+
+        lazy = cfg.lazy and _LazyFontRegistry.supported()
+        if cfg.lazy and not lazy:
+            logger.warning(
+                f"~ reportlab {reportlab.Version} no está verificado para el registro diferido; se registran todas las caras."
+            )
+        if lazy:
+            registry = _LazyFontRegistry.install()
+            for pair in faces:
+                if pair.name not in registry:
+                    registry.pending[pair.name] = self._font_registerer(pair.name, pair.path, family_kwargs)
+        else:
+            for pair in faces:
+                pdfmetrics.registerFont(self.metrics_cache.load_font(pair.name, pair.path))
+
+        pdfmetrics.registerFontFamily(**family_kwargs)
+
+    def _font_registerer(self, name: str, path: Path, family_kwargs: dict) -> Callable[[], None]:
+        def register_font() -> None:
+            from reportlab.pdfbase import pdfmetrics
 
-        for pair in font_pairs:
-            if pair.path:
-                pdfmetrics.registerFont(TTFont(pair.name, str(pair.path)))
+            pdfmetrics.registerFont(self.metrics_cache.load_font(name, path))
+            # `registerFont` pisa el mapeo bold/italic del nombre de la fuente, que para la Regular es el de la familia.
+            pdfmetrics.registerFontFamily(**family_kwargs)
 
-        registerFontFamily(**self._font_family_kwargs(cfg))
+        return register_font
 
     def _raise_if_missing_files(self, cfg: FontLoaderConfig, font_pairs: List[PairNamePathFont]) -> None:
+        """Se valida al cargar, aunque el registro sea diferido: una cara faltante no debe aparecer recién al dibujar."""
         missing_files = [pair.path.name for pair in font_pairs if pair.path and not pair.path.exists()]
         if missing_files:
             raise FileNotFoundError(
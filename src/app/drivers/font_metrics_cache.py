@@ -0,0 +1,109 @@
+"""Caché en disco de las métricas ya parseadas de fuentes TrueType.
+
+Parsear las tablas de una Nerd Font (~10k glifos) es buena parte del arranque en frío. El snapshot
+guarda el estado de `TTFontFace` (anchos, cmap, posiciones de glifos) con clave en el hash del
+`.ttf` y la versión de reportlab. En un hit se lee con `mmap` y los bytes del `.ttf`, que sólo
+hacen falta para armar el subset al guardar el PDF, se sirven desde un `mmap` del archivo original.
+"""
+
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, Optional
+from weakref import WeakKeyDictionary
+import hashlib
+import logging
+import mmap
+import pickle
+import tempfile
+
+import reportlab
+from reportlab import rl_config
+from reportlab.pdfbase import ttfonts
+from reportlab.pdfbase.ttfonts import TTEncoding, TTFont, TTFontFace
+
+from src.core.constants import PATH_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SUFFIX = ".pkl"
+# `_pdfScale` es una lambda (no serializable) y `_ttf_data` se sirve desde el `.ttf`.
+_UNCACHED_ATTRS = ("_ttf_data", "_pdfScale")
+
+
+def _pdf_scale(units_per_em: int):
+    """Replica la escala que arma `TTFontFile.extractInfo` a partir de `unitsPerEm`."""
+    if units_per_em == 1000:
+        return lambda x: x
+    mult = 1000 / units_per_em
+    return lambda x: x * mult
+
+
+def _map_file(path: Path) -> mmap.mmap:
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class CachedTTFont(TTFont):
+    """`TTFont` armado con una `TTFontFace` ya construida, sin volver a parsear el archivo."""
+
+    def __init__(self, name: str, face: TTFontFace) -> None:
+        # Mismo estado que deja `TTFont.__init__`; la versión de reportlab es parte de la clave del caché.
+        self.fontName = name
+        self.face = face
+        self.encoding = TTEncoding()
+        self.state = WeakKeyDictionary()
+        self._asciiReadable = rl_config.ttfAsciiReadable
+        self._shaped = bool(any(fnmatch(name, glob) for glob in ttfonts.shapedFontGlob) and ttfonts.uharfbuzz)
+
+
+class FontMetricsCache:
+    def __init__(self, *, path_dir: Path = PATH_CACHE_DIR / "fonts") -> None:
+        self.path_dir = Path(path_dir)
+
+    @staticmethod
+    def build_key(ttf_data: mmap.mmap) -> str:
+        digest = hashlib.sha256(ttf_data)
+        digest.update(reportlab.Version.encode())
+        return digest.hexdigest()[:32]
+
+    def _path_entry(self, path_ttf: Path, key: str) -> Path:
+        return self.path_dir / f"{path_ttf.stem}-{key}{_CACHE_SUFFIX}"
+
+    def _read(self, path_entry: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path_entry, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"~ Caché de fuente inválido, se descarta: {path_entry.name} ({e})")
+            path_entry.unlink(missing_ok=True)
+            return None
+
+    def _write(self, path_entry: Path, face: TTFontFace) -> None:
+        state = {k: v for k, v in face.__dict__.items() if k not in _UNCACHED_ATTRS}
+        self.path_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path_dir, suffix=".tmp", delete=False) as tmp:
+            pickle.dump(state, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp.name).replace(path_entry)
+        # Snapshots de versiones anteriores del mismo archivo.
+        for path_old in self.path_dir.glob(f"{path_entry.name.rsplit('-', 1)[0]}-*{_CACHE_SUFFIX}"):
+            if path_old != path_entry:
+                path_old.unlink(missing_ok=True)
+
+    def load_font(self, name: str, path_ttf: Path) -> TTFont:
+        ttf_data = _map_file(path_ttf)
+        path_entry = self._path_entry(path_ttf, self.build_key(ttf_data))
+        state = self._read(path_entry)
+        if state is None:
+            logger.debug(f"~ Cache miss métricas de fuente: {path_ttf.name}")
+            font = TTFont(name, str(path_ttf))
+            self._write(path_entry, font.face)
+            ttf_data.close()
+            return font
+
+        face = TTFontFace.__new__(TTFontFace)
+        face.__dict__.update(state)
+        face._ttf_data = ttf_data
+        face._pdfScale = _pdf_scale(face.unitsPerEm)
+        return CachedTTFont(name, face)
@@ -1,13 +1,12 @@
 """Compresión de PDFs con Ghostscript. Reduce tamaño de currículos generados."""
 
+from typing import Optional
 import subprocess
 import shutil
 import logging
-import tempfile
-from pathlib import Path
-from typing import Union
 
 from src.core.drivers.ghostscript import CoreGhostScript
+from src.core.entities import CompressedPDF
 
 logger = logging.getLogger(__name__)
 
@@ -16,43 +15,44 @@ class GhostScript(CoreGhostScript):
     """Compresión de PDFs mediante Ghostscript."""
     
     _GS_COMMAND = "gs"
+    # Parámetros de compresión de pdfwrite.
+    _PDFWRITE_ARGS = (
+        "-sDEVICE=pdfwrite",
+        "-dCompatibilityLevel=1.4",
+        "-dPDFSETTINGS=/printer",  # Mejor calidad, ideal para imágenes
+        "-dNOPAUSE",
+        "-dQUIET",
+        "-dDownsampleColorImages=true",  # Habilitar submuestreo de imágenes
+        "-dColorImageResolution=300",  # Resolución de imágenes (ajusta según lo necesites)
+    )
     
-    def _is_available(self) -> bool:
+    def __init__(self, *, timeout_s: Optional[float] = None) -> None:
+        """Con `timeout_s`, un `gs` que tarda más se mata y se propaga `subprocess.TimeoutExpired`."""
+        self.timeout_s = timeout_s
+
+    @classmethod
+    def is_available(cls) -> bool:
         """Verifica que Ghostscript esté en el PATH."""
-        return shutil.which(self._GS_COMMAND) is not None
+        return shutil.which(cls._GS_COMMAND) is not None
     
-    def compress_pdf(self, path_pdf: Union[str, Path]) -> None:
-        """Comprime un PDF reduciendo su tamaño.
+    def compress_pdf_bytes(self, pdf: bytes) -> CompressedPDF:
+        """Comprime un PDF en memoria: entra por stdin y sale por stdout, sin archivos temporales propios.
         
         Args:
-            path_pdf: Ruta al PDF (string o Path).
+            pdf: Contenido del PDF.
         """
-        if not self._is_available():
+        if not self.is_available():
             logger.warning(
                 "Ghostscript no está instalado; se omite la compresión del PDF final."
             )
-            return
+            return CompressedPDF(pdf=pdf, backend="none", size_before=len(pdf), size_after=len(pdf))
 
-        path_pdf = Path(path_pdf)
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf",
-            prefix=f"{path_pdf.stem}_",
-            dir=path_pdf.parent,
-            delete=False,
-        ) as tmp:
-            path_tmp = Path(tmp.name)
-        
-        subprocess.run([
+        result = subprocess.run([
             self._GS_COMMAND,
-            "-sDEVICE=pdfwrite",
-            "-dCompatibilityLevel=1.4",
-            "-dPDFSETTINGS=/printer",  # Mejor calidad, ideal para imágenes
-            "-dNOPAUSE",
-            "-dQUIET",
+            *self._PDFWRITE_ARGS,
             "-dBATCH",
-            "-dDownsampleColorImages=true",  # Habilitar submuestreo de imágenes
-            "-dColorImageResolution=300",  # Resolución de imágenes (ajusta según lo necesites)
-            f"-sOutputFile={path_tmp}",
-            str(path_pdf)
-        ], check=True)
-        path_tmp.replace(path_pdf)
+            "-sstdout=%stderr",  # Mensajes de PostScript fuera de stdout, que lleva el PDF
+            "-sOutputFile=-",
+            "-",
+        ], input=pdf, stdout=subprocess.PIPE, check=True, timeout=self.timeout_s)
+        return CompressedPDF(pdf=result.stdout, backend="ghostscript", size_before=len(pdf), size_after=len(result.stdout))
@@ -0,0 +1,54 @@
+"""Compresión con Ghostscript en paralelo, fuera del hilo que renderiza."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import time
+
+from src.app.drivers.ghostscript import GhostScript
+from src.core.drivers.ghostscript import CoreGhostScript
+from src.core.entities import CompressedPDF
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelGhostScript(CoreGhostScript):
+    """Hasta `workers` llamadas `gs` a la vez, cada una de un solo PDF.
+
+    `submit` encola el PDF y devuelve un `Future` enseguida, así el render puede seguir mientras se
+    comprime. Cada trabajo es una llamada `gs` de stdin a stdout con los mismos flags que `GhostScript`;
+    la que supera `timeout_s` se mata y su `Future` termina con `subprocess.TimeoutExpired`.
+
+    Cada PDF sigue pagando el arranque del intérprete (~50-100 ms); sólo queda solapado con el render.
+    Reutilizar un intérprete para varios archivos no está resuelto: con `-dSAFER` el device queda con
+    `LockSafetyParams` y Ghostscript rechaza tanto cambiarle `/OutputFile` como pasar a otro device.
+    """
+
+    def __init__(self, *, workers: int = 2, timeout_s: float = 120.0) -> None:
+        if not GhostScript.is_available():
+            raise RuntimeError("Ghostscript no está instalado; no se puede comprimir en paralelo.")
+        self.workers = workers
+        self.timeout_s = timeout_s
+        self._ghostscript = GhostScript(timeout_s=timeout_s)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gs_parallel")
+
+    def _compress(self, pdf: bytes) -> CompressedPDF:
+        t_start = time.perf_counter()
+        compressed = self._ghostscript.compress_pdf_bytes(pdf)
+        return compressed.model_copy(
+            update={"backend": "ghostscript-parallel", "duration_s": time.perf_counter() - t_start}
+        )
+
+    def submit(self, pdf: bytes) -> "Future[CompressedPDF]":
+        return self._executor.submit(self._compress, pdf)
+
+    def compress_pdf_bytes(self, pdf: bytes) -> CompressedPDF:
+        return self.submit(pdf).result()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ParallelGhostScript":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
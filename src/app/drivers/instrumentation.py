@@ -0,0 +1,134 @@
+"""Medición por etapa del pipeline: tiempo de reloj y de CPU, o pico de memoria.
+
+Los servicios marcan sus etapas con `stage("nombre")`, que no hace nada si no hay una medición ni
+un perfilado (`src.app.drivers.profiling`) activos. `recording()` activa una medición para el
+contexto actual (un render, un job de batch) y devuelve el `StageRecorder` del que sale el `RunReport`.
+
+Tiempos y memoria se miden en corridas separadas: con `tracemalloc` prendido cada asignación pasa por
+el hook y los tiempos se inflan varias veces (la compresión con PyMuPDF, x40), así que una medición con
+`trace_memory=True` reporta sólo picos y deja `wall_s`/`cpu_s` en `None`.
+"""
+
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+import time
+import tracemalloc
+
+from src.app.drivers.profiling import current_profiler
+from src.core.entities import RunReport, StageMetrics
+
+_CURRENT_RECORDER: ContextVar[Optional["StageRecorder"]] = ContextVar("stage_recorder", default=None)
+
+
+class _OpenStage:
+    __slots__ = ("metrics", "start_current", "peak")
+
+    def __init__(self, metrics: StageMetrics, start_current: int) -> None:
+        self.metrics = metrics
+        self.start_current = start_current
+        self.peak = start_current
+
+
+class StageRecorder:
+    def __init__(self, *, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self._stages: Dict[str, StageMetrics] = {}
+        self._open: List[_OpenStage] = []
+        self._root: Optional[_OpenStage] = None
+        self._t_wall = 0.0
+        self._t_cpu = 0.0
+        self._started_tracemalloc = False
+        self.report: Optional[RunReport] = None
+
+    def _sample_peak(self) -> int:
+        """Lleva el pico desde el último reset a todas las etapas abiertas y reinicia el contador.
+
+        `tracemalloc` tiene un único pico global; así cada etapa anidada mide el suyo sin perder el de las de afuera.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        for open_stage in self._open:
+            open_stage.peak = max(open_stage.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._root = _OpenStage(StageMetrics(name="total"), self._sample_peak() if self.trace_memory else 0)
+        self._open = [self._root]
+        self._t_wall = time.perf_counter()
+        self._t_cpu = time.process_time()
+
+    def stop(self) -> RunReport:
+        wall_s = time.perf_counter() - self._t_wall
+        cpu_s = time.process_time() - self._t_cpu
+        if self.trace_memory:
+            self._sample_peak()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        root, self._open = self._root, []
+        if self.trace_memory:
+            # Tiempos tomados con tracemalloc prendido: no se publican.
+            return RunReport(
+                wall_s=None,
+                cpu_s=None,
+                peak_bytes=root.peak - root.start_current,
+                stages=[metrics.model_copy(update={"wall_s": None, "cpu_s": None}) for metrics in self._stages.values()],
+            )
+        return RunReport(wall_s=wall_s, cpu_s=cpu_s, stages=list(self._stages.values()))
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        metrics = self._stages.get(name)
+        if metrics is None:
+            metrics = self._stages[name] = StageMetrics(name=name)
+        open_stage = _OpenStage(metrics, self._sample_peak() if self.trace_memory else 0)
+        self._open.append(open_stage)
+        t_wall = time.perf_counter()
+        t_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            metrics.calls += 1
+            metrics.wall_s += time.perf_counter() - t_wall
+            metrics.cpu_s += time.process_time() - t_cpu
+            if self.trace_memory:
+                self._sample_peak()
+                peak_bytes = open_stage.peak - open_stage.start_current
+                metrics.peak_bytes = max(metrics.peak_bytes or 0, peak_bytes)
+            self._open.remove(open_stage)
+
+
+@contextmanager
+def recording(*, trace_memory: bool = False) -> Iterator[StageRecorder]:
+    """Mide las etapas que corren dentro del bloque; el reporte queda en `recorder.report` al salir.
+
+    Con `trace_memory`, el reporte trae picos de memoria en vez de tiempos.
+    """
+    recorder = StageRecorder(trace_memory=trace_memory)
+    token = _CURRENT_RECORDER.set(recorder)
+    recorder.start()
+    try:
+        yield recorder
+    finally:
+        recorder.report = recorder.stop()
+        _CURRENT_RECORDER.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mide la etapa si hay una medición activa y la perfila si es una de las etapas del perfilado activo."""
+    recorder = _CURRENT_RECORDER.get()
+    profiler = current_profiler(name)
+    if recorder is None and profiler is None:
+        yield
+        return
+    with ExitStack() as stack:
+        if recorder is not None:
+            stack.enter_context(recorder.stage(name))
+        if profiler is not None:
+            stack.enter_context(profiler.active())
+        yield
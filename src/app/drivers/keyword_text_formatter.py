@@ -2,32 +2,81 @@
 
 import json
 import re
-from typing import Literal
+from functools import lru_cache
+from typing import Dict, Literal, Optional, Tuple
 
-from src.core.constants import PATH_KEYWORDS
 from src.core.drivers.keyword_text_formatter import (
     CoreKeywordTextFormatter,
     KeywordsConfig,
 )
+from src.core.entities.cv_settings import CVSettings
+
+_FORMAT_TEMPLATES = {"bold": "<b>{}</b>"}
+
+KeywordsKey = Tuple[Tuple[str, str], ...]
+
+
+def _build_trie(words: list[str]) -> dict:
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return trie
+
+
+def _trie_to_pattern(node: dict) -> str:
+    """Regex equivalente al trie; el `?` greedy prueba primero la coincidencia más larga."""
+    branches = [re.escape(char) + _trie_to_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{body})?" if "" in node else body
+
+
+@lru_cache(maxsize=32)
+def _compile_keywords(keywords: KeywordsKey) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compila todas las keywords en un único patrón con prefijos compartidos.
+
+    Un solo recorrido del texto marca la coincidencia más larga en cada posición, con los
+    mismos límites de palabra que el reemplazo keyword por keyword.
+    """
+    templates: Dict[str, str] = {}
+    for keyword, formatter in keywords:
+        if keyword and formatter in _FORMAT_TEMPLATES:
+            templates.setdefault(keyword, _FORMAT_TEMPLATES[formatter])
+    pattern = re.compile(rf"(?<!\w)(?:{_trie_to_pattern(_build_trie(list(templates)))})(?!\w)")
+    return pattern, templates
 
 
 class KeywordTextFormatter(CoreKeywordTextFormatter):
+    def __init__(self, settings: Optional[CVSettings] = None) -> None:
+        self.settings = settings or CVSettings()
+        self._last_keywords: Optional[KeywordsConfig] = None
+        self._last_compiled: Optional[Tuple[re.Pattern, Dict[str, str]]] = None
+
+    def _compiled(self, keywords: KeywordsConfig) -> Tuple[re.Pattern, Dict[str, str]]:
+        # Los fixes reusan la misma instancia de `KeywordsConfig` para todos los textos.
+        if keywords is not self._last_keywords:
+            self._last_compiled = _compile_keywords(
+                tuple((keyword_cfg.keyword, keyword_cfg.formatter) for keyword_cfg in keywords.keywords)
+            )
+            self._last_keywords = keywords
+        return self._last_compiled
+
     def load_keywords(self) -> KeywordsConfig:
-        raw = json.loads(PATH_KEYWORDS.read_text(encoding="utf-8"))
+        raw = json.loads(self.settings.path_keywords.read_text(encoding="utf-8"))
         return KeywordsConfig.model_validate(raw)
 
     def format_text(self, text: str, keywords: KeywordsConfig) -> str:
         if not text or not keywords.keywords:
             return text
 
-        out = text
-        for keyword_cfg in sorted(keywords.keywords, key=lambda item: len(item.keyword), reverse=True):
-            pattern = re.compile(rf"(?<!\w)({re.escape(keyword_cfg.keyword)})(?!\w)")
-
-            if keyword_cfg.formatter == "bold":
-                out = pattern.sub(lambda m: f"<b>{m.group(1)}</b>", out)
-
-        return out
+        pattern, templates = self._compiled(keywords)
+        if not templates:
+            return text
+        return pattern.sub(lambda m: templates[m.group(0)].format(m.group(0)), text)
 
     def format_bracketed(self, text: str, formatter: Literal["bold"]) -> str:
         if formatter != "bold":
@@ -0,0 +1,5 @@
+"""Layout del CV: mide y ubica el contenido sin tocar un canvas."""
+
+from src.app.drivers.layout_cv.service import LayoutCVService
+
+__all__ = ["LayoutCVService"]
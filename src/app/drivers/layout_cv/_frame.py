@@ -0,0 +1,66 @@
+"""Apilado de flowables con la misma semántica que `reportlab.platypus.Frame`, sin canvas."""
+
+from typing import Iterable, List
+
+from reportlab import rl_config
+from reportlab.platypus import Flowable
+
+from src.core.entities import PlacedFlowable
+
+# Mismo padding por defecto que `Frame` (left/right/top/bottom).
+FRAME_PADDING = 6
+
+
+class FrameStacker:
+    """Replica `Frame.addFromList`: ubica de arriba hacia abajo hasta el primer flowable que no entra.
+
+    Los flowables restantes se siguen apilando (sin límite inferior) y quedan con `overflow=True`.
+    """
+
+    def __init__(self, *, x: float, y: float, width: float, height: float, padding: float = FRAME_PADDING) -> None:
+        self.x = x + padding
+        self.top = y + height - padding
+        self.bottom = y + padding
+        self.available_width = width - 2 * padding
+        self.available_height = height - 2 * padding
+
+    @staticmethod
+    def _space_before(flowable: Flowable, prev_space_after: float) -> float:
+        space_before = flowable.getSpaceBefore()
+        if rl_config.overlapAttachedSpace:
+            if getattr(flowable, "_SPACETRANSFER", False) or getattr(flowable, "_ZEROSIZE", False):
+                space_before = prev_space_after
+            space_before = max(space_before - prev_space_after, 0)
+        return space_before
+
+    def stack(self, flowables: Iterable[Flowable]) -> List[PlacedFlowable]:
+        placed: List[PlacedFlowable] = []
+        y = self.top
+        at_top = True
+        prev_space_after = 0.0
+        overflow = False
+
+        for flowable in flowables:
+            space_before = 0.0 if at_top else self._space_before(flowable, prev_space_after)
+            h_available = y - self.bottom - space_before
+            if not overflow and h_available <= 0 and not getattr(flowable, "_ZEROSIZE", False):
+                overflow = True
+            w, h = flowable.wrap(self.available_width, self.available_height if overflow else h_available)
+
+            y_next = y - h - space_before
+            if not overflow and y_next < self.bottom - rl_config._FUZZ:
+                overflow = True
+            placed.append(
+                PlacedFlowable(flowable=flowable, x=self.x, y=y_next, width=w, height=h, overflow=overflow)
+            )
+
+            space_after = flowable.getSpaceAfter()
+            y_next -= space_after
+            if rl_config.overlapAttachedSpace:
+                if getattr(flowable, "_SPACETRANSFER", False):
+                    space_after = prev_space_after
+                prev_space_after = space_after
+            if y_next != y:
+                at_top = False
+            y = y_next
+        return placed
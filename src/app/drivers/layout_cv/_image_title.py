@@ -0,0 +1,49 @@
+"""Ubica una imagen y un titulo a la misma altura, centrado."""
+
+from typing import Tuple
+
+from reportlab.lib.styles import ParagraphStyle
+
+from src.app.drivers.layout_cv.paragraph_cache import PARAGRAPH_MEASURE_CACHE, ParagraphMeasureCache
+from src.core.entities import ImageDrawCfg, ImageTitleDrawCfg, PlacedFlowable
+
+
+class ImageTitleLayouter:
+    def __init__(self, paragraph_cache: ParagraphMeasureCache | None = None) -> None:
+        self.paragraph_cache = paragraph_cache or PARAGRAPH_MEASURE_CACHE
+
+    def layout_title_row(
+        self,
+        *,
+        cfg: ImageTitleDrawCfg,
+        style: ParagraphStyle,
+        x: float,
+        y_top: float,
+        available_width: float,
+        available_height: float,
+    ) -> Tuple[ImageDrawCfg, PlacedFlowable, float]:
+        """Devuelve la imagen, el título y el alto de la fila que empieza en `y_top`."""
+        measured = self.paragraph_cache.measure(
+            cfg.title_html,
+            style,
+            available_width - cfg.img_size - cfg.image_to_title_dist,
+            available_height,
+        )
+        text_width, text_height = measured.width, measured.height
+        row_height = max(text_height, cfg.img_size)
+        y_row = y_top - row_height
+        image = ImageDrawCfg(
+            path_img=cfg.path_img,
+            x=x,
+            y=y_row + (row_height - cfg.img_size) / 2,
+            width=cfg.img_size,
+            height=cfg.img_size,
+        )
+        title = PlacedFlowable(
+            flowable=measured.paragraph,
+            x=x + cfg.img_size + cfg.image_to_title_dist,
+            y=y_row + (row_height - text_height) / 2,
+            width=text_width,
+            height=text_height,
+        )
+        return image, title, row_height
@@ -0,0 +1,293 @@
+"""Layout de posiciones/experiencia del CV."""
+
+from copy import copy
+
+from reportlab import rl_config
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+
+from src.app.drivers.layout_cv._image_title import ImageTitleLayouter
+from src.app.drivers.layout_cv.paragraph_cache import PARAGRAPH_MEASURE_CACHE, ParagraphMeasureCache
+from src.core.constants import PATH_PYTHON_ICON
+from src.core.entities import (
+    BodyLayout,
+    DividerLine,
+    DrawCVConfig,
+    ImageTitleDrawCfg,
+    PlacedFlowable,
+    PositionLayout,
+    PositionsDrawCfg,
+    PositionsLayoutDTO,
+)
+from src.core.hardcoded_config import (
+    JOB_DESCRIPTION_FALLBACK,
+    format_final_credit_html,
+    format_job_subtitle_html,
+    format_job_title_html,
+)
+
+
+class PositionsLayouter:
+    def __init__(
+        self,
+        image_title_layouter: ImageTitleLayouter,
+        paragraph_cache: ParagraphMeasureCache | None = None,
+    ) -> None:
+        self.image_title_layouter = image_title_layouter
+        self.paragraph_cache = paragraph_cache or PARAGRAPH_MEASURE_CACHE
+
+    def _place_below(
+        self,
+        *,
+        text: str,
+        style: ParagraphStyle,
+        x: float,
+        y_top: float,
+        width: float,
+        usable_height: float,
+        bottom_limit: float,
+        page: int = 0,
+    ) -> PlacedFlowable:
+        measured = self.paragraph_cache.measure(text, style, width, usable_height)
+        y = y_top - measured.height
+        return PlacedFlowable(
+            flowable=measured.paragraph,
+            x=x,
+            y=y,
+            width=measured.width,
+            height=measured.height,
+            overflow=y < bottom_limit - rl_config._FUZZ,
+            page=page,
+        )
+
+    def _build_divider_line(self, *, cfg: PositionsDrawCfg, draw_config: DrawCVConfig, x: float, y_line: float) -> DividerLine:
+        return DividerLine(
+            x_start=x + draw_config.dist_line_spacing_left_mm * mm,
+            y_start=y_line,
+            x_end=cfg.page_width - cfg.sizes_cv.margin_pt - draw_config.dist_line_spacing_right_mm * mm,
+            y_end=y_line,
+        )
+
+    def _layout_position(
+        self,
+        *,
+        cfg: PositionsDrawCfg,
+        draw_config: DrawCVConfig,
+        layout: PositionsLayoutDTO,
+        position_title: str,
+        subtitle_text: str,
+        description_text: str,
+        y_cursor: float,
+        page: int = 0,
+    ) -> PositionLayout:
+        icon, title, h_icon = self.image_title_layouter.layout_title_row(
+            cfg=ImageTitleDrawCfg(
+                path_img=PATH_PYTHON_ICON,
+                title_html=format_job_title_html(title=position_title),
+                img_size=layout.icon_size_pt,
+                image_to_title_dist=draw_config.dist_python_icon_to_title,
+            ),
+            style=cfg.styles["JobTitle"],
+            x=layout.body_x,
+            y_top=y_cursor,
+            available_width=layout.body_width,
+            available_height=layout.usable_height,
+        )
+        y_icon = y_cursor - h_icon
+        title.overflow = y_icon < cfg.sizes_cv.margin_pt - rl_config._FUZZ
+        title.page = page
+
+        subtitle = self._place_below(
+            text=format_job_subtitle_html(subtitle=subtitle_text),
+            style=cfg.styles["JobSubTitle"],
+            x=layout.body_x,
+            y_top=y_icon - draw_config.line_thickness,
+            width=layout.body_width,
+            usable_height=layout.usable_height,
+            bottom_limit=cfg.sizes_cv.margin_pt,
+            page=page,
+        )
+        description = self._place_below(
+            text=description_text or JOB_DESCRIPTION_FALLBACK,
+            style=cfg.styles["JobDesc"],
+            x=layout.body_x,
+            y_top=subtitle.y - draw_config.line_thickness,
+            width=layout.body_width,
+            usable_height=layout.usable_height,
+            bottom_limit=cfg.sizes_cv.margin_pt,
+            page=page,
+        )
+        return PositionLayout(
+            icon=icon,
+            title=title,
+            subtitle=subtitle,
+            description=description,
+            top=y_cursor,
+            title_row_bottom=y_icon,
+            bottom=description.y - draw_config.spacer_height,
+            page=page,
+        )
+
+    def _split_description(
+        self,
+        *,
+        position_layout: PositionLayout,
+        layout: PositionsLayoutDTO,
+        draw_config: DrawCVConfig,
+        bottom_limit: float,
+    ) -> bool:
+        """Deja en la página lo que entra de la descripción y sigue el resto en las páginas siguientes.
+
+        Devuelve `False` si no entran las líneas mínimas que pide el estilo (huérfanas y viudas de `Paragraph.split`).
+        """
+        description = position_layout.description
+        # Sobre una copia: `split` borra `blPara` si no puede cortar, y el párrafo medido es del caché.
+        parts = copy(description.flowable).split(layout.body_width, description.top - bottom_limit)
+        if len(parts) != 2:
+            return False
+        head, rest = parts
+        position_layout.description = PlacedFlowable(
+            flowable=head,
+            x=description.x,
+            y=description.top - head.height,
+            width=layout.body_width,
+            height=head.height,
+            page=position_layout.page,
+        )
+        page = position_layout.page
+        while True:
+            page += 1
+            _, height = rest.wrap(layout.body_width, layout.usable_height)
+            parts = rest.split(layout.body_width, layout.usable_height) if height > layout.usable_height else []
+            part = rest
+            if len(parts) == 2:
+                part, rest = parts
+                height = part.height
+            y = layout.body_start_y - height
+            position_layout.continuation.append(
+                PlacedFlowable(
+                    flowable=part,
+                    x=description.x,
+                    y=y,
+                    width=layout.body_width,
+                    height=height,
+                    overflow=y < bottom_limit - rl_config._FUZZ,
+                    page=page,
+                )
+            )
+            if part is rest:
+                break
+        position_layout.bottom = y - draw_config.spacer_height
+        return True
+
+    def _layout_paginated_position(
+        self,
+        *,
+        cfg: PositionsDrawCfg,
+        draw_config: DrawCVConfig,
+        layout: PositionsLayoutDTO,
+        position_title: str,
+        subtitle_text: str,
+        description_text: str,
+        y_cursor: float,
+        page: int,
+    ) -> PositionLayout:
+        """Si la posición no entra: corta la descripción, o la pasa entera al tope de la página siguiente."""
+        position_layout = self._layout_position(
+            cfg=cfg,
+            draw_config=draw_config,
+            layout=layout,
+            position_title=position_title,
+            subtitle_text=subtitle_text,
+            description_text=description_text,
+            y_cursor=y_cursor,
+            page=page,
+        )
+        if not position_layout.overflow:
+            return position_layout
+        head_fits = not position_layout.title.overflow and not position_layout.subtitle.overflow
+        if head_fits and self._split_description(
+            position_layout=position_layout,
+            layout=layout,
+            draw_config=draw_config,
+            bottom_limit=cfg.sizes_cv.margin_pt,
+        ):
+            return position_layout
+        if y_cursor < layout.body_start_y - rl_config._FUZZ:
+            return self._layout_paginated_position(
+                cfg=cfg,
+                draw_config=draw_config,
+                layout=layout,
+                position_title=position_title,
+                subtitle_text=subtitle_text,
+                description_text=description_text,
+                y_cursor=layout.body_start_y,
+                page=page + 1,
+            )
+        # Ni en una página vacía entra el encabezado: queda en overflow, como sin paginar.
+        return position_layout
+
+    def layout_positions(self, *, cfg: PositionsDrawCfg, draw_config: DrawCVConfig) -> BodyLayout:
+        layout = PositionsLayoutDTO.from_positions_and_draw_config(
+            positions_cfg=cfg,
+            draw_config=draw_config,
+        )
+        y_cursor = layout.body_start_y
+        page = 0
+        positions: list[PositionLayout] = []
+        layout_position = self._layout_paginated_position if cfg.paginate else self._layout_position
+
+        for idx, position in enumerate(cfg.linkedin_data.positions):
+            position_layout = layout_position(
+                cfg=cfg,
+                draw_config=draw_config,
+                layout=layout,
+                position_title=position.text_title,
+                subtitle_text=position.text_sub_title,
+                description_text=position.description,
+                y_cursor=y_cursor,
+                page=page,
+            )
+            if idx < len(cfg.linkedin_data.positions) - 1:
+                position_layout.divider = self._build_divider_line(
+                    cfg=cfg,
+                    draw_config=draw_config,
+                    x=layout.body_x,
+                    y_line=position_layout.title_row_bottom,
+                )
+            positions.append(position_layout)
+            y_cursor = position_layout.bottom
+            page = position_layout.end_page
+
+        final_credit = self._place_below(
+            text=format_final_credit_html(),
+            style=cfg.styles["JobDesc"],
+            x=layout.body_x,
+            y_top=y_cursor,
+            width=layout.body_width,
+            usable_height=layout.usable_height,
+            bottom_limit=cfg.sizes_cv.margin_pt,
+            page=page,
+        )
+        if cfg.paginate and final_credit.overflow:
+            final_credit = self._place_below(
+                text=format_final_credit_html(),
+                style=cfg.styles["JobDesc"],
+                x=layout.body_x,
+                y_top=layout.body_start_y,
+                width=layout.body_width,
+                usable_height=layout.usable_height,
+                bottom_limit=cfg.sizes_cv.margin_pt,
+                page=page + 1,
+            )
+        return BodyLayout(
+            x=layout.body_x,
+            width=layout.body_width,
+            top=layout.body_start_y,
+            bottom_limit=cfg.sizes_cv.margin_pt,
+            line_anchor_x=layout.line_anchor_x,
+            divider_color=cfg.style_cv.accent,
+            divider_width=draw_config.line_thickness,
+            positions=positions,
+            final_credit=final_credit,
+        )
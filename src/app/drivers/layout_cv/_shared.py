@@ -1,13 +1,18 @@
-"""Funciones y utilidades compartidas del servicio de dibujo."""
+"""Funciones y utilidades compartidas para armar el contenido del CV."""
 
 import re
 from typing import List
 
-from reportlab.platypus import Paragraph, Spacer
+from reportlab.platypus import Flowable, Spacer
 from reportlab.lib.styles import StyleSheet1
 
+from src.app.drivers.layout_cv.paragraph_cache import PARAGRAPH_MEASURE_CACHE, ParagraphMeasureCache
+
 
 class SharedDrawUtils:
+    def __init__(self, paragraph_cache: ParagraphMeasureCache | None = None) -> None:
+        self.paragraph_cache = paragraph_cache or PARAGRAPH_MEASURE_CACHE
+
     def clean_text(self, text: str) -> str:
         cleaned_text = text.strip()
         cleaned_text = re.sub(r"^<br/>|<br/>$", "", cleaned_text)
@@ -37,9 +42,9 @@ class SharedDrawUtils:
         text: str,
         styles: StyleSheet1,
         dist_between_title_sidebar_to_text: int,
-    ) -> List[Paragraph | Spacer]:
+    ) -> List[Flowable]:
         return [
-            Paragraph(f"<b>{title}</b>", styles["SidebarTitle"]),
+            self.paragraph_cache.paragraph(f"<b>{title}</b>", styles["SidebarTitle"]),
             Spacer(1, dist_between_title_sidebar_to_text),
-            Paragraph(self.clean_text(text), styles["SidebarText"]),
+            self.paragraph_cache.paragraph(self.clean_text(text), styles["SidebarText"]),
         ]
@@ -0,0 +1,144 @@
+"""Layout de la barra lateral del CV."""
+
+from typing import List
+
+from reportlab.lib.units import mm
+from reportlab.platypus import Flowable, Spacer
+
+from src.app.drivers.layout_cv._frame import FrameStacker
+from src.app.drivers.layout_cv._shared import SharedDrawUtils
+from src.core.entities import DrawCVConfig, PlacedRect, SidebarDrawCfg, SidebarLayout
+from src.core.hardcoded_config import (
+    LABEL_AGE,
+    LABEL_GITHUB,
+    LABEL_LINKEDIN,
+    LABEL_LOCATION,
+    LABEL_MAIL,
+    SECTION_ABOUT_ME_TEXT,
+    SECTION_ABOUT_ME_TITLE,
+    SECTION_GOAL_TEXT,
+    SECTION_GOAL_TITLE,
+    SECTION_PROJECTS_TEXT,
+    SECTION_PROJECTS_TITLE,
+    SECTION_STACK_TITLE,
+    SECTION_TECH_SUMMARY_TITLE,
+    SUMMARY_TECH_STACK_LABEL,
+    format_link_line,
+    format_sidebar_info_line,
+    format_website_line,
+)
+
+
+class SidebarLayouter:
+    def __init__(self, shared_utils: SharedDrawUtils) -> None:
+        self.shared_utils = shared_utils
+
+    def _build_sidebar_header_content(self, *, cfg: SidebarDrawCfg, draw_config: DrawCVConfig) -> List[Flowable]:
+        paragraph = self.shared_utils.paragraph_cache.paragraph
+        content: List[Flowable] = []
+        content.append(paragraph(cfg.linkedin_data.profile.full_name, cfg.styles["SidebarName"]))
+        content.append(Spacer(1, draw_config.dist_full_name_to_headline))
+        content.append(paragraph(cfg.linkedin_data.profile.headline, cfg.styles["SidebarHeadline"]))
+        content.append(Spacer(1, draw_config.dist_headline_to_links))
+        return content
+
+    @staticmethod
+    def _build_sidebar_info_lines(*, cfg: SidebarDrawCfg) -> list[str]:
+        info_lines: list[str] = []
+        if cfg.personal_information.age:
+            info_lines.append(format_sidebar_info_line(LABEL_AGE, str(cfg.personal_information.age)))
+        if cfg.personal_information.location:
+            info_lines.append(format_sidebar_info_line(LABEL_LOCATION, cfg.personal_information.location))
+
+        info_lines.append(format_sidebar_info_line(LABEL_MAIL, str(cfg.personal_information.email)))
+
+        if cfg.personal_information.url_web_es and cfg.personal_information.url_web_en:
+            info_lines.append(
+                format_website_line(
+                    url_es=cfg.personal_information.url_web_es,
+                    url_en=cfg.personal_information.url_web_en,
+                )
+            )
+        else:
+            raise ValueError(
+                f"Falta una url - {cfg.personal_information.url_web_es} - {cfg.personal_information.url_web_en}"
+            )
+
+        if cfg.personal_information.url_github:
+            info_lines.append(format_link_line(label=LABEL_GITHUB, url=cfg.personal_information.url_github))
+        if cfg.personal_information.url_linkedin:
+            info_lines.append(format_link_line(label=LABEL_LINKEDIN, url=cfg.personal_information.url_linkedin))
+        return info_lines
+
+    def _append_sidebar_info_content(
+        self,
+        *,
+        content: List[Flowable],
+        cfg: SidebarDrawCfg,
+        draw_config: DrawCVConfig,
+    ) -> None:
+        for line in self._build_sidebar_info_lines(cfg=cfg):
+            content.append(self.shared_utils.paragraph_cache.paragraph(line, cfg.styles["SidebarLinks"]))
+            content.append(Spacer(1, draw_config.dist_between_links))
+
+    def _build_sidebar_sections(self, *, cfg: SidebarDrawCfg) -> list[tuple[str, str]]:
+        if SUMMARY_TECH_STACK_LABEL not in cfg.linkedin_data.profile.summary:
+            raise ValueError(f"El texto '{SUMMARY_TECH_STACK_LABEL}' no está en summary.")
+
+        summary_parts = cfg.linkedin_data.profile.summary.split(SUMMARY_TECH_STACK_LABEL)
+        summary_parts = [p.strip() for p in summary_parts]
+        return [
+            (SECTION_ABOUT_ME_TITLE, SECTION_ABOUT_ME_TEXT),
+            (SECTION_GOAL_TITLE, SECTION_GOAL_TEXT),
+            (SECTION_TECH_SUMMARY_TITLE, self.shared_utils.sanitize_tech_summary(summary_parts[0])),
+            (SECTION_PROJECTS_TITLE, SECTION_PROJECTS_TEXT),
+            (SECTION_STACK_TITLE, summary_parts[1]),
+        ]
+
+    def _append_sidebar_sections_content(
+        self,
+        *,
+        content: List[Flowable],
+        cfg: SidebarDrawCfg,
+        draw_config: DrawCVConfig,
+    ) -> None:
+        for title, text in self._build_sidebar_sections(cfg=cfg):
+            content.append(Spacer(1, draw_config.dist_between_title_text_sidebar))
+            content.extend(
+                self.shared_utils.draw_title_text_sidebar(
+                    title=title,
+                    text=text,
+                    styles=cfg.styles,
+                    dist_between_title_sidebar_to_text=draw_config.dist_between_title_sidebar_to_text,
+                )
+            )
+
+    def layout_sidebar(self, *, cfg: SidebarDrawCfg, draw_config: DrawCVConfig) -> SidebarLayout:
+        photo_bottom = cfg.page_height - cfg.sizes_cv.photo_size_pt - draw_config.photo_top_padding_mm * mm
+        sidebar_text_bottom = cfg.sizes_cv.margin_pt + 5 * mm
+        sidebar_height = photo_bottom - sidebar_text_bottom
+        frame_x = cfg.sizes_cv.margin_left_pt + draw_config.frame_margin_left_mm * mm
+        frame_width = (
+            cfg.sizes_cv.column_left_width_pt
+            - (draw_config.frame_margin_left_mm + draw_config.frame_margin_right_mm) * mm
+        )
+
+        content = self._build_sidebar_header_content(cfg=cfg, draw_config=draw_config)
+        self._append_sidebar_info_content(content=content, cfg=cfg, draw_config=draw_config)
+        self._append_sidebar_sections_content(content=content, cfg=cfg, draw_config=draw_config)
+
+        stacker = FrameStacker(x=frame_x, y=sidebar_text_bottom, width=frame_width, height=sidebar_height)
+        return SidebarLayout(
+            panel=PlacedRect(
+                x=cfg.sizes_cv.margin_left_pt,
+                y=0,
+                width=cfg.sizes_cv.column_left_width_pt,
+                height=cfg.page_height,
+                color=cfg.style_cv.sidebar_panel,
+            ),
+            frame_x=frame_x,
+            frame_y=sidebar_text_bottom,
+            frame_width=frame_width,
+            frame_height=sidebar_height,
+            boxes=stacker.stack(content),
+        )
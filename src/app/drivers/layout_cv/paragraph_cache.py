@@ -0,0 +1,108 @@
+"""Caché LRU de párrafos medidos, compartido por todos los layouts del proceso.
+
+Temas, iteraciones de auto-fit y perfiles de un batch vuelven a medir los mismos textos con los
+mismos estilos y anchos. La clave es `(markup, huella del ParagraphStyle, ancho)`; el valor es el
+`Paragraph` ya parseado con sus líneas cortadas, que se dibuja tal cual desde cualquier layout.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Flowable, Paragraph
+
+from src.core.entities import ParagraphCacheInfo, ParagraphMeasure
+
+# No cambian el resultado del parseo ni del corte de líneas.
+_STYLE_IGNORED_ATTRS = ("name", "parent")
+
+
+def _freeze(value: Any) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class ParagraphMeasureCache:
+    def __init__(self, *, maxsize: int = 2048) -> None:
+        """`maxsize=0` desactiva el caché: cada medición parsea y corta líneas de nuevo."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable, float], ParagraphMeasure]" = OrderedDict()
+        self._fingerprints: "WeakKeyDictionary[ParagraphStyle, Hashable]" = WeakKeyDictionary()
+
+    def style_fingerprint(self, style: ParagraphStyle) -> Hashable:
+        """Huella por valor: estilos equivalentes de distintos `get_styles()` comparten entradas."""
+        fingerprint = self._fingerprints.get(style)
+        if fingerprint is None:
+            fingerprint = tuple(
+                (key, _freeze(value))
+                for key, value in sorted(style.__dict__.items())
+                if key not in _STYLE_IGNORED_ATTRS
+            )
+            self._fingerprints[style] = fingerprint
+        return fingerprint
+
+    def measure(self, text: str, style: ParagraphStyle, width: float, height: float) -> ParagraphMeasure:
+        """`height` no es parte de la clave: `Paragraph.wrap` sólo lo usa para imágenes inline."""
+        key = (text, self.style_fingerprint(style), width)
+        measured = self._entries.get(key)
+        if measured is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return measured
+
+        self.misses += 1
+        paragraph = Paragraph(text, style)
+        w, h = paragraph.wrap(width, height)
+        measured = ParagraphMeasure(paragraph=paragraph, width=w, height=h)
+        if self.maxsize > 0:
+            self._entries[key] = measured
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return measured
+
+    def paragraph(self, text: str, style: ParagraphStyle) -> "CachedParagraph":
+        return CachedParagraph(text, style, cache=self)
+
+    def info(self) -> ParagraphCacheInfo:
+        return ParagraphCacheInfo(hits=self.hits, misses=self.misses, size=len(self._entries), maxsize=self.maxsize)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class CachedParagraph(Flowable):
+    """Reemplazo de `Paragraph` para el layout: `wrap` sale del caché y `drawOn` dibuja el párrafo medido."""
+
+    def __init__(self, text: str, style: ParagraphStyle, *, cache: ParagraphMeasureCache) -> None:
+        super().__init__()
+        self.text = text
+        self.style = style
+        self.cache = cache
+        self.measured: Optional[ParagraphMeasure] = None
+
+    def wrap(self, availWidth: float, availHeight: float) -> Tuple[float, float]:
+        self.measured = self.cache.measure(self.text, self.style, availWidth, availHeight)
+        self.width, self.height = self.measured.width, self.measured.height
+        return self.width, self.height
+
+    def getSpaceBefore(self) -> float:
+        return self.style.spaceBefore
+
+    def getSpaceAfter(self) -> float:
+        return self.style.spaceAfter
+
+    def drawOn(self, canvas, x: float, y: float, _sW: float = 0) -> None:
+        if self.measured is None:
+            raise RuntimeError("CachedParagraph.drawOn antes de wrap()")
+        self.measured.paragraph.drawOn(canvas, x, y, _sW)
+
+
+PARAGRAPH_MEASURE_CACHE = ParagraphMeasureCache()
@@ -0,0 +1,106 @@
+"""Servicio de layout del CV, compuesto por sub-servicios."""
+
+from typing import Optional
+
+from src.app.drivers.instrumentation import stage
+from src.app.drivers.layout_cv._image_title import ImageTitleLayouter
+from src.app.drivers.layout_cv._positions import PositionsLayouter
+from src.app.drivers.layout_cv._shared import SharedDrawUtils
+from src.app.drivers.layout_cv._sidebar import SidebarLayouter
+from src.app.drivers.layout_cv.paragraph_cache import PARAGRAPH_MEASURE_CACHE, ParagraphMeasureCache
+from src.core.drivers.layout import CoreLayoutCVService
+from src.core.entities import (
+    BodyLayout,
+    BuilderCVConfig,
+    CVLayout,
+    DrawCVConfig,
+    LinkedinData,
+    ParagraphCacheInfo,
+    PersonalInformation,
+    PositionsDrawCfg,
+    SidebarDrawCfg,
+    SidebarLayout,
+    SizesCV,
+    StyleCV,
+)
+
+
+class LayoutCVService(CoreLayoutCVService):
+    """Calcula el árbol de ubicación (`CVLayout`) que después se reproduce sobre el canvas."""
+
+    def __init__(
+        self,
+        sidebar_layouter: SidebarLayouter | None = None,
+        positions_layouter: PositionsLayouter | None = None,
+        paragraph_cache: ParagraphMeasureCache | None = None,
+    ) -> None:
+        """`paragraph_cache` es compartido por defecto: temas, auto-fit y batch reutilizan las mediciones."""
+        self.paragraph_cache = paragraph_cache or PARAGRAPH_MEASURE_CACHE
+        self.sidebar_layouter = sidebar_layouter or SidebarLayouter(
+            shared_utils=SharedDrawUtils(paragraph_cache=self.paragraph_cache),
+        )
+        self.positions_layouter = positions_layouter or PositionsLayouter(
+            image_title_layouter=ImageTitleLayouter(paragraph_cache=self.paragraph_cache),
+            paragraph_cache=self.paragraph_cache,
+        )
+
+    def paragraph_cache_info(self) -> ParagraphCacheInfo:
+        return self.paragraph_cache.info()
+
+    def layout_sidebar(self, *, cfg: SidebarDrawCfg, draw_config: DrawCVConfig) -> SidebarLayout:
+        return self.sidebar_layouter.layout_sidebar(cfg=cfg, draw_config=draw_config)
+
+    def layout_positions(self, *, cfg: PositionsDrawCfg, draw_config: DrawCVConfig) -> BodyLayout:
+        return self.positions_layouter.layout_positions(cfg=cfg, draw_config=draw_config)
+
+    def layout(
+        self,
+        *,
+        personal_information: PersonalInformation,
+        linkedin_data: LinkedinData,
+        style_cv: Optional[StyleCV] = None,
+        sizes_cv: Optional[SizesCV] = None,
+        cfg_builder: Optional[BuilderCVConfig] = None,
+        draw_config: Optional[DrawCVConfig] = None,
+        scale: float = 1.0,
+    ) -> CVLayout:
+        style_cv = style_cv or StyleCV()
+        sizes_cv = sizes_cv or SizesCV()
+        cfg_builder = cfg_builder or BuilderCVConfig()
+        draw_config = (draw_config or DrawCVConfig()).scaled(scale)
+        page_width, page_height = cfg_builder.page_size
+        with stage("styles"):
+            styles = style_cv.get_styles(scale)
+
+        sidebar = self.layout_sidebar(
+            cfg=SidebarDrawCfg(
+                linkedin_data=linkedin_data,
+                personal_information=personal_information,
+                sizes_cv=sizes_cv,
+                style_cv=style_cv,
+                styles=styles,
+                page_height=page_height,
+            ),
+            draw_config=draw_config,
+        )
+        body = self.layout_positions(
+            cfg=PositionsDrawCfg(
+                linkedin_data=linkedin_data,
+                sizes_cv=sizes_cv,
+                style_cv=style_cv,
+                styles=styles,
+                page_width=page_width,
+                page_height=page_height,
+                paginate=cfg_builder.paginate,
+            ),
+            draw_config=draw_config,
+        )
+        return CVLayout(
+            page_width=page_width,
+            page_height=page_height,
+            scale=scale,
+            draw_config=draw_config,
+            styles=styles,
+            sidebar=sidebar,
+            body=body,
+        )
@@ -0,0 +1,33 @@
+"""Utilidades compartidas por los repositorios de LinkedIn (sin dependencias pesadas)."""
+
+from typing import Any, Dict, Optional, Type
+
+from src.core.hardcoded_config import (
+    REPLACE_BULLET_ARROW,
+    REPLACE_BULLET_DOT,
+    REPLACE_BULLET_SQUARE,
+)
+
+# Mismos valores que `pandas.read_csv` interpreta como NaN por defecto.
+CSV_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+
+def format_key(key: str) -> str:
+    return key.lower().replace(" ", "_")
+
+
+def apply_visible_text_replacements(value: Optional[str]) -> Optional[str]:
+    if not isinstance(value, str):
+        return value
+    value = value.replace(*REPLACE_BULLET_ARROW)
+    value = value.replace(*REPLACE_BULLET_DOT)
+    value = value.replace(*REPLACE_BULLET_SQUARE)
+    return value
+
+
+def pick_model_fields(data: Dict[str, Any], model_cls: Type) -> Dict[str, Any]:
+    return {k: v for k, v in data.items() if k in model_cls.model_fields}
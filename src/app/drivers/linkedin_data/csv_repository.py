@@ -1,20 +1,16 @@
-from typing import Optional, List, Dict, Any, Type
+from typing import Optional, List, Dict, Any
 import logging
 
 import pandas as pd
 
-from src.core.entities.linkedin_data import Profile, Position, Education, LinkedinData
-from src.core.constants import (
-    PATH_LINKEDIN_PROFILE,
-    PATH_LINKEDIN_POSITIONS,
-    PATH_LINKEDIN_EDUCATION,
+from src.app.drivers.linkedin_data._shared import (
+    apply_visible_text_replacements,
+    format_key,
+    pick_model_fields,
 )
+from src.core.entities.linkedin_data import Profile, Position, Education, LinkedinData
+from src.core.entities.cv_settings import CVSettings
 from src.core.drivers.linkedin_csv_repository import CoreLinkedinCSVRepository
-from src.core.hardcoded_config import (
-    REPLACE_BULLET_ARROW,
-    REPLACE_BULLET_DOT,
-    REPLACE_BULLET_SQUARE,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -27,24 +23,15 @@ def _read_dataframe(path_csv):
     return pd.read_csv(path_csv)
 
 
-def _apply_visible_text_replacements(value: Optional[str]) -> Optional[str]:
-    if not isinstance(value, str):
-        return value
-    value = value.replace(*REPLACE_BULLET_ARROW)
-    value = value.replace(*REPLACE_BULLET_DOT)
-    value = value.replace(*REPLACE_BULLET_SQUARE)
-    return value
-
-
 class _LinkedinRowFormatter:
     @staticmethod
     def format_key(key: str) -> str:
-        return key.lower().replace(" ", "_")
+        return format_key(key)
 
     @staticmethod
     def format_value(v: Optional[str]) -> Optional[str]:
         v = _nan2none(v)
-        return _apply_visible_text_replacements(v)
+        return apply_visible_text_replacements(v)
 
     @staticmethod
     def format_row(*, row: pd.Series) -> Dict[str, Any]:
@@ -55,32 +42,28 @@ class _LinkedinRowFormatter:
         }
 
 
-def _pick_model_fields(data: Dict[str, Any], model_cls: Type) -> Dict[str, Any]:
-    return {k: v for k, v in data.items() if k in model_cls.model_fields}
-
-
 class LinkedinCSVRepository(CoreLinkedinCSVRepository):
-    def __init__(self) -> None:
-        ...
+    def __init__(self, settings: Optional[CVSettings] = None) -> None:
+        self.settings = settings or CVSettings()
 
     def _load_profile(self) -> Profile:
-        row = _read_dataframe(PATH_LINKEDIN_PROFILE).iloc[0]
+        row = _read_dataframe(self.settings.path_linkedin_profile).iloc[0]
         data = _LinkedinRowFormatter.format_row(row=row)
-        return Profile(**_pick_model_fields(data, Profile))
+        return Profile(**pick_model_fields(data, Profile))
 
     def _load_positions(self) -> List[Position]:
-        df = _read_dataframe(PATH_LINKEDIN_POSITIONS)
+        df = _read_dataframe(self.settings.path_linkedin_positions)
         return [
-            Position(**_pick_model_fields(_LinkedinRowFormatter.format_row(row=row), Position))
+            Position(**pick_model_fields(_LinkedinRowFormatter.format_row(row=row), Position))
             for _, row in df.iterrows()
         ]
 
     def _load_educations(self) -> List[Education]:
-        df = _read_dataframe(PATH_LINKEDIN_EDUCATION)
+        df = _read_dataframe(self.settings.path_linkedin_education)
         df["Start Date"] = df["Start Date"].apply(lambda t: None if pd.isna(t) else str(int(t)))
         df["End Date"] = df["End Date"].apply(lambda t: None if pd.isna(t) else str(int(t)))
         return [
-            Education(**_pick_model_fields(_LinkedinRowFormatter.format_row(row=row), Education))
+            Education(**pick_model_fields(_LinkedinRowFormatter.format_row(row=row), Education))
             for _, row in df.iterrows()
         ]
 
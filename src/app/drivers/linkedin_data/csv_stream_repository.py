@@ -0,0 +1,102 @@
+"""Repositorio de LinkedIn CSV sin pandas: lee las filas en streaming con `csv`."""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple, Type
+import csv
+import logging
+
+from src.app.drivers.linkedin_data._shared import (
+    CSV_NA_VALUES,
+    apply_visible_text_replacements,
+    format_key,
+)
+from src.core.constants import (
+    LINKEDIN_EDUCATION_CSV,
+    LINKEDIN_POSITIONS_CSV,
+    LINKEDIN_PROFILE_CSV,
+)
+from src.core.drivers.linkedin_csv_repository import CoreLinkedinCSVRepository
+from src.core.entities.linkedin_data import Profile, Position, Education, LinkedinData
+from src.core.entities.cv_settings import CVSettings
+
+logger = logging.getLogger(__name__)
+
+_EDUCATION_YEAR_KEYS = ("start_date", "end_date")
+
+
+def _format_value(v: str) -> Optional[str]:
+    if v in CSV_NA_VALUES:
+        return None
+    return apply_visible_text_replacements(v)
+
+
+def _format_year(v: Optional[str]) -> Optional[str]:
+    """Replica `str(int(t))` del camino pandas, donde la columna llega como float."""
+    return None if v is None else str(int(float(v)))
+
+
+def _header_plan(header: List[str], model_cls: Type) -> List[Tuple[int, str]]:
+    """Normaliza el header una sola vez y devuelve `(índice, campo)` de las columnas útiles."""
+    plan: List[Tuple[int, str]] = []
+    for idx, key in enumerate(header):
+        field = format_key(key)
+        if field in model_cls.model_fields:
+            plan.append((idx, field))
+    return plan
+
+
+class LinkedinCSVStreamRepository(CoreLinkedinCSVRepository):
+    """Alternativa liviana a `LinkedinCSVRepository`: mismo `LinkedinData`, sin importar pandas."""
+
+    def __init__(self, settings: Optional[CVSettings] = None) -> None:
+        self.settings = settings or CVSettings()
+
+    @contextmanager
+    def _open_csv(self, name: str) -> Iterator[TextIO]:
+        """Abre el CSV `name` del export como texto. Subclases pueden cambiar el origen."""
+        with open(self.settings.path_export / name, encoding="utf-8-sig", newline="") as f:
+            yield f
+
+    def _iter_rows(self, name: str, model_cls: Type) -> Iterator[Dict[str, Any]]:
+        with self._open_csv(name) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            plan = _header_plan(header, model_cls)
+            for row in reader:
+                if not row:
+                    continue
+                yield {field: _format_value(row[idx]) if idx < len(row) else None for idx, field in plan}
+
+    def _load_profile(self) -> Profile:
+        rows = self._iter_rows(LINKEDIN_PROFILE_CSV, Profile)
+        try:
+            data = next(rows, None)
+        finally:
+            rows.close()
+        if data is None:
+            raise ValueError(f"El CSV de perfil está vacío: {LINKEDIN_PROFILE_CSV}")
+        return Profile(**data)
+
+    def iter_positions(self) -> Iterator[Position]:
+        for data in self._iter_rows(LINKEDIN_POSITIONS_CSV, Position):
+            yield Position(**data)
+
+    def iter_educations(self) -> Iterator[Education]:
+        for data in self._iter_rows(LINKEDIN_EDUCATION_CSV, Education):
+            for key in _EDUCATION_YEAR_KEYS:
+                if key in data:
+                    data[key] = _format_year(data[key])
+            yield Education(**data)
+
+    def load_linkedin_data(self) -> LinkedinData:
+        linkedin_data = LinkedinData(
+            profile=self._load_profile(),
+            positions=list(self.iter_positions()),
+            educations=list(self.iter_educations()),
+        )
+        logger.info("==================== LinkedIn Data ====================")
+        logger.info(f"~ positions={len(linkedin_data.positions)}")
+        logger.info(f"~ educations={len(linkedin_data.educations)}")
+        return linkedin_data
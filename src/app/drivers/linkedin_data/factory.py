@@ -0,0 +1,36 @@
+"""Selección del repositorio de LinkedIn a usar."""
+
+from typing import Literal, Optional, get_args
+import logging
+
+from src.core.drivers.linkedin_csv_repository import CoreLinkedinCSVRepository
+from src.core.entities import CVSettings
+
+logger = logging.getLogger(__name__)
+
+CSVEngine = Literal["pandas", "stream"]
+CSV_ENGINES: tuple[str, ...] = get_args(CSVEngine)
+
+
+def build_linkedin_csv_repository(
+    engine: CSVEngine = "pandas",
+    settings: Optional[CVSettings] = None,
+) -> CoreLinkedinCSVRepository:
+    """Construye el repositorio pedido.
+
+    Los imports son diferidos para que el motor `stream` no pague el import de pandas.
+    Si `settings.path_export` apunta a un `.zip`, se lee el archivo sin extraerlo (siempre en streaming).
+    """
+    settings = settings or CVSettings()
+    if settings.path_export.suffix.lower() == ".zip":
+        from src.app.drivers.linkedin_data.zip_repository import LinkedinZipRepository
+        if engine != "stream":
+            logger.info(f"~ Export comprimido; se ignora CSV_ENGINE='{engine}' y se usa lectura en streaming.")
+        return LinkedinZipRepository(settings)
+    if engine == "pandas":
+        from src.app.drivers.linkedin_data.csv_repository import LinkedinCSVRepository
+        return LinkedinCSVRepository(settings)
+    if engine == "stream":
+        from src.app.drivers.linkedin_data.csv_stream_repository import LinkedinCSVStreamRepository
+        return LinkedinCSVStreamRepository(settings)
+    raise ValueError(f"Motor CSV no soportado: {engine}. Opciones: {', '.join(CSV_ENGINES)}")
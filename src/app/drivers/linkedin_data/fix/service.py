@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass
 
+from src.app.drivers.instrumentation import stage
 from src.app.drivers.keyword_text_formatter import KeywordTextFormatter
 from src.app.drivers.linkedin_data.fix._core import CoreLinkedinDataFix
 from src.app.drivers.linkedin_data.fix._fix_freelance_adjustments_linkedin_data import (
@@ -48,5 +49,6 @@ class FixLinkedinDataService:
         logger.info("==================== FIX LinkedIn Data ====================")
         for fix_name, fix in self.pipeline.fixes.items():
             logger.info(f"===== fix.start={fix_name} =====")
-            fix.apply(linkedin_data)
+            with stage(f"fix:{fix_name}"):
+                fix.apply(linkedin_data)
         return linkedin_data
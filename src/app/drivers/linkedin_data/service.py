@@ -0,0 +1,46 @@
+"""Carga del `LinkedinData` listo para dibujar: repositorio + fixes + caché de snapshots."""
+
+from typing import Optional
+import logging
+
+from src.app.drivers.instrumentation import stage
+from src.app.drivers.keyword_text_formatter import KeywordTextFormatter
+from src.app.drivers.linkedin_data.factory import CSVEngine, build_linkedin_csv_repository
+from src.app.drivers.linkedin_data.fix.service import FixLinkedinDataService
+from src.app.drivers.linkedin_data.snapshot_cache import LinkedinDataSnapshotCache, read_export_sources
+from src.core.entities import CVSettings, LinkedinData
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedinDataService:
+    def __init__(
+        self,
+        *,
+        settings: Optional[CVSettings] = None,
+        csv_engine: CSVEngine = "pandas",
+        use_cache: bool = True,
+        fix_service: Optional[FixLinkedinDataService] = None,
+        cache: Optional[LinkedinDataSnapshotCache] = None,
+    ) -> None:
+        self.settings = settings or CVSettings()
+        self.csv_engine = csv_engine
+        self.fix_service = fix_service or FixLinkedinDataService(formatter=KeywordTextFormatter(self.settings))
+        self.cache = (cache or LinkedinDataSnapshotCache()) if use_cache else None
+
+    def _build(self) -> LinkedinData:
+        linkedin_data_repository = build_linkedin_csv_repository(self.csv_engine, self.settings)
+        with stage("csv_load"):
+            linkedin_data = linkedin_data_repository.load_linkedin_data()
+        return self.fix_service.fix(linkedin_data)
+
+    def load(self) -> LinkedinData:
+        if self.cache is None:
+            return self._build()
+
+        key = self.cache.build_key(
+            sources=read_export_sources(self.settings),
+            path_keywords=self.settings.path_keywords,
+            fix_names=self.fix_service.pipeline.fixes.keys(),
+        )
+        return self.cache.load_or_build(key, self._build)
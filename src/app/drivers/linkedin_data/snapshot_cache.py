@@ -0,0 +1,127 @@
+"""Caché persistente en disco del `LinkedinData` ya validado y corregido.
+
+La clave es el hash del contenido de los CSV de entrada, de `config/keywords.json`,
+de los nombres de los fixes activos y del esquema de los modelos. En un hit se
+deserializa el snapshot sin pasar por pandas ni por la validación de pydantic.
+"""
+
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+from src.core.constants import (
+    LINKEDIN_EDUCATION_CSV,
+    LINKEDIN_POSITIONS_CSV,
+    LINKEDIN_PROFILE_CSV,
+    PATH_CACHE_DIR,
+)
+from src.core.entities.cv_settings import CVSettings
+from src.core.entities.linkedin_data import Education, LinkedinData, Position, Profile
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_SUFFIX = ".pkl"
+_SCHEMA_MODELS = (LinkedinData, Profile, Position, Education)
+
+
+def read_export_sources(settings: CVSettings) -> Dict[str, bytes]:
+    """Contenido crudo de los CSV del export (carpeta o `.zip`), sin parsearlos."""
+    names = (LINKEDIN_PROFILE_CSV, LINKEDIN_POSITIONS_CSV, LINKEDIN_EDUCATION_CSV)
+    if settings.path_export.suffix.lower() == ".zip":
+        from src.app.drivers.linkedin_data.zip_repository import LinkedinZipRepository
+        return LinkedinZipRepository(settings).read_members(names)
+    return {name: (settings.path_export / name).read_bytes() for name in names}
+
+
+def _schema_fingerprint() -> str:
+    """Cambia si cambian los campos de los modelos, invalidando snapshots viejos."""
+    digest = hashlib.sha256()
+    for model_cls in _SCHEMA_MODELS:
+        digest.update(model_cls.__qualname__.encode())
+        for name, field in model_cls.model_fields.items():
+            digest.update(f"{name}:{field.annotation!r}:{field.is_required()}".encode())
+    return digest.hexdigest()
+
+
+class LinkedinDataSnapshotCache:
+    """Snapshots `pickle` con tamaño acotado y desalojo LRU (por `mtime`)."""
+
+    def __init__(
+        self,
+        *,
+        path_dir: Path = PATH_CACHE_DIR / "linkedin_data",
+        max_entries: int = 4096,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.path_dir = Path(path_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._schema = _schema_fingerprint()
+
+    def build_key(self, *, sources: Dict[str, bytes], path_keywords: Path, fix_names: Iterable[str]) -> str:
+        digest = hashlib.sha256()
+        digest.update(self._schema.encode())
+        for name in sorted(sources):
+            digest.update(name.encode())
+            digest.update(hashlib.sha256(sources[name]).digest())
+        digest.update(hashlib.sha256(path_keywords.read_bytes()).digest())
+        digest.update("\0".join(fix_names).encode())
+        return digest.hexdigest()
+
+    def _path_entry(self, key: str) -> Path:
+        return self.path_dir / f"{key}{_SNAPSHOT_SUFFIX}"
+
+    def get(self, key: str) -> Optional[LinkedinData]:
+        path_entry = self._path_entry(key)
+        try:
+            with open(path_entry, "rb") as f:
+                schema, linkedin_data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"~ Snapshot inválido, se descarta: {path_entry.name} ({e})")
+            path_entry.unlink(missing_ok=True)
+            return None
+
+        if schema != self._schema or not isinstance(linkedin_data, LinkedinData):
+            path_entry.unlink(missing_ok=True)
+            return None
+        os.utime(path_entry)
+        return linkedin_data
+
+    def put(self, key: str, linkedin_data: LinkedinData) -> None:
+        self.path_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path_dir, suffix=".tmp", delete=False) as tmp:
+            pickle.dump((self._schema, linkedin_data), tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp.name).replace(self._path_entry(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path_entry in self.path_dir.glob(f"*{_SNAPSHOT_SUFFIX}"):
+            try:
+                stat = path_entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path_entry))
+        entries.sort()
+
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path_entry = entries.pop(0)
+            path_entry.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def load_or_build(self, key: str, build: Callable[[], LinkedinData]) -> LinkedinData:
+        linkedin_data = self.get(key)
+        if linkedin_data is not None:
+            logger.info(f"~ Cache hit LinkedinData ({key[:12]})")
+            return linkedin_data
+        logger.info(f"~ Cache miss LinkedinData ({key[:12]})")
+        linkedin_data = build()
+        self.put(key, linkedin_data)
+        return linkedin_data
@@ -0,0 +1,76 @@
+"""Repositorio de LinkedIn que lee los CSV directamente desde el `.zip` del export."""
+
+from contextlib import contextmanager
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+import io
+import logging
+import zipfile
+
+from src.app.drivers.linkedin_data.csv_stream_repository import LinkedinCSVStreamRepository
+from src.core.entities.cv_settings import CVSettings
+from src.core.entities.linkedin_data import LinkedinData
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedinZipRepository(LinkedinCSVStreamRepository):
+    """Lee `Profile.csv`, `Positions.csv` y `Education.csv` sin extraer el archivo.
+
+    Sólo se consulta el directorio central del ZIP para ubicar los miembros necesarios;
+    el resto de las entradas (mensajes, media, etc.) nunca se descomprime.
+    """
+
+    def __init__(self, settings: Optional[CVSettings] = None) -> None:
+        super().__init__(settings)
+        self.path_zip = self.settings.path_export
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._members: Dict[str, zipfile.ZipInfo] = {}
+
+    @staticmethod
+    def _index_members(archive: zipfile.ZipFile) -> Dict[str, zipfile.ZipInfo]:
+        """Mapea nombre de archivo -> entrada, prefiriendo la más cercana a la raíz."""
+        members: Dict[str, zipfile.ZipInfo] = {}
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            name = PurePosixPath(info.filename).name
+            current = members.get(name)
+            if current is None or info.filename.count("/") < current.filename.count("/"):
+                members[name] = info
+        return members
+
+    def _find_member(self, name: str) -> zipfile.ZipInfo:
+        member = self._members.get(name)
+        if member is None:
+            raise FileNotFoundError(f"No existe '{name}' dentro de {self.path_zip}")
+        return member
+
+    @contextmanager
+    def _open_archive(self) -> Iterator[zipfile.ZipFile]:
+        """Un único open del ZIP, y un único índice de miembros, mientras el contexto esté abierto."""
+        if self._archive is not None:
+            yield self._archive
+            return
+        with zipfile.ZipFile(self.path_zip) as archive:
+            self._archive, self._members = archive, self._index_members(archive)
+            try:
+                yield archive
+            finally:
+                self._archive, self._members = None, {}
+
+    @contextmanager
+    def _open_csv(self, name: str) -> Iterator[TextIO]:
+        with self._open_archive() as archive:
+            with archive.open(self._find_member(name)) as raw:
+                yield io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+    def read_members(self, names: Iterable[str]) -> Dict[str, bytes]:
+        """Devuelve el contenido crudo de los miembros pedidos, sin tocar el resto."""
+        with self._open_archive() as archive:
+            return {name: archive.read(self._find_member(name)) for name in names}
+
+    def load_linkedin_data(self) -> LinkedinData:
+        # Un único open del ZIP (y una única lectura del directorio central) por carga.
+        with self._open_archive():
+            return super().load_linkedin_data()
@@ -0,0 +1,32 @@
+"""Selección del backend de compresión de PDFs."""
+
+from typing import Literal, get_args
+import logging
+
+from src.app.drivers.ghostscript import GhostScript
+from src.core.drivers.ghostscript import CoreGhostScript
+
+logger = logging.getLogger(__name__)
+
+PDFCompressor = Literal["auto", "ghostscript", "pymupdf"]
+PDF_COMPRESSORS: tuple[str, ...] = get_args(PDFCompressor)
+
+
+def build_pdf_compressor(backend: PDFCompressor = "auto") -> CoreGhostScript:
+    """`auto` usa Ghostscript si `gs` está en el PATH y si no PyMuPDF, en el mismo proceso.
+
+    Pedir `ghostscript` sin `gs` instalado también cae en PyMuPDF, con un warning, en vez de dejar el
+    PDF sin comprimir.
+    """
+    if backend == "auto":
+        backend = "ghostscript" if GhostScript.is_available() else "pymupdf"
+        logger.info(f"~ Compresión de PDF: {backend}")
+    if backend == "ghostscript":
+        if GhostScript.is_available():
+            return GhostScript()
+        logger.warning("~ Se pidió Ghostscript pero `gs` no está en el PATH; se comprime con PyMuPDF.")
+        backend = "pymupdf"
+    if backend == "pymupdf":
+        from src.app.drivers.pymupdf_compressor import PyMuPDFCompressor
+        return PyMuPDFCompressor()
+    raise ValueError(f"Compresor de PDF no soportado: {backend}. Opciones: {', '.join(PDF_COMPRESSORS)}")
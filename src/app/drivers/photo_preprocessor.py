@@ -0,0 +1,129 @@
+"""Preparación de la foto de perfil para el tamaño con el que se imprime.
+
+La foto se remuestrea a `SizesCV.photo_size` a los `dpi` pedidos (nunca se agranda), opcionalmente se
+rellena fuera del círculo con el color del panel (el clip del dibujo sigue igual, pero las esquinas
+planas comprimen mejor) y se re-codifica como JPEG optimizado. El resultado queda en disco con clave
+en el hash de la foto y de los parámetros, así el PDF sale chico sin depender de un compresor externo.
+Si la re-codificada no achica el archivo, se guarda bajo la misma clave un marcador vacío que indica
+usar el original, así no se vuelve a codificar en cada corrida.
+"""
+
+from pathlib import Path
+from typing import Tuple
+import hashlib
+import io
+import logging
+import tempfile
+
+from PIL import Image, ImageDraw
+from reportlab.lib.colors import Color
+from reportlab.lib.units import mm
+
+from src.core.constants import PATH_CACHE_DIR
+from src.core.entities import PhotoPreprocessConfig
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SUFFIX = ".jpg"
+_KEEP_ORIGINAL_SUFFIX = ".original"
+
+
+class PhotoPreprocessor:
+    def __init__(self, *, path_dir: Path = PATH_CACHE_DIR / "photos", max_entries: int = 256) -> None:
+        self.path_dir = Path(path_dir)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def target_pixels(*, size_pt: float, dpi: int) -> int:
+        return max(1, round(size_pt / mm / 25.4 * dpi))
+
+    @staticmethod
+    def build_key(*, data: bytes, target_px: int, cfg: PhotoPreprocessConfig, matte: Tuple[int, int, int]) -> str:
+        digest = hashlib.sha256(data)
+        digest.update(f"{target_px}:{cfg.jpeg_quality}:{cfg.precrop_circle}:{matte}".encode())
+        return digest.hexdigest()[:32]
+
+    @staticmethod
+    def _flatten(src: Image.Image, matte: Tuple[int, int, int]) -> Image.Image:
+        """JPEG no tiene alfa: lo transparente queda del color del panel, como se veía con `mask="auto"`."""
+        if src.mode in ("RGBA", "LA", "PA") or "transparency" in src.info:
+            im = src.convert("RGBA")
+            out = Image.new("RGB", im.size, matte)
+            out.paste(im, mask=im.getchannel("A"))
+            return out
+        return src.convert("RGB")
+
+    @staticmethod
+    def _precrop_circle(im: Image.Image, matte: Tuple[int, int, int]) -> Image.Image:
+        """Mismo círculo que el clip de `ImageDrawer`: centrado y con diámetro igual al lado mayor."""
+        w, h = im.size
+        r = max(w, h) / 2 + 1  # 1px de margen: el borde lo sigue definiendo el clip.
+        mask = Image.new("L", im.size, 0)
+        ImageDraw.Draw(mask).ellipse((w / 2 - r, h / 2 - r, w / 2 + r, h / 2 + r), fill=255)
+        out = Image.new("RGB", im.size, matte)
+        out.paste(im, mask=mask)
+        return out
+
+    def _encode(self, data: bytes, *, target_px: int, cfg: PhotoPreprocessConfig, matte: Tuple[int, int, int]) -> bytes:
+        with Image.open(io.BytesIO(data)) as src:
+            im = self._flatten(src, matte)
+        if max(im.size) > target_px:
+            im.thumbnail((target_px, target_px), Image.Resampling.LANCZOS)
+        if cfg.precrop_circle:
+            im = self._precrop_circle(im, matte)
+        out = io.BytesIO()
+        im.save(out, format="JPEG", quality=cfg.jpeg_quality, optimize=True)
+        return out.getvalue()
+
+    def _evict(self) -> None:
+        """Desaloja por antigüedad de escritura; no se toca el `mtime` en un hit (es clave del caché de imágenes)."""
+        entries = sorted(
+            (*self.path_dir.glob(f"*{_CACHE_SUFFIX}"), *self.path_dir.glob(f"*{_KEEP_ORIGINAL_SUFFIX}")),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for path_entry in entries[: max(0, len(entries) - self.max_entries)]:
+            path_entry.unlink(missing_ok=True)
+
+    def prepare(
+        self,
+        path_photo: Path,
+        *,
+        size_pt: float,
+        cfg: PhotoPreprocessConfig,
+        is_circle: bool,
+        matte: Color,
+    ) -> Path:
+        """Ruta de la foto lista para dibujar; si la preparada no achica el archivo se usa el original."""
+        if not cfg.enabled:
+            return path_photo
+        data = path_photo.read_bytes()
+        target_px = self.target_pixels(size_pt=size_pt, dpi=cfg.dpi)
+        cfg = cfg.model_copy(update={"precrop_circle": cfg.precrop_circle and is_circle})
+        matte_rgb = tuple(round(v * 255) for v in matte.rgb())
+        key = self.build_key(data=data, target_px=target_px, cfg=cfg, matte=matte_rgb)
+        path_entry = self.path_dir / f"{path_photo.stem}-{key}{_CACHE_SUFFIX}"
+        path_keep_original = path_entry.with_suffix(_KEEP_ORIGINAL_SUFFIX)
+
+        if path_entry.exists():
+            logger.debug(f"~ Cache hit foto: {path_entry.name}")
+            return path_entry
+        if path_keep_original.exists():
+            logger.debug(f"~ Cache hit foto (se usa el original): {path_keep_original.name}")
+            return path_photo
+
+        encoded = self._encode(data, target_px=target_px, cfg=cfg, matte=matte_rgb)
+        self.path_dir.mkdir(parents=True, exist_ok=True)
+        if len(encoded) >= len(data):
+            path_keep_original.touch()
+            self._evict()
+            logger.info(f"~ La foto preparada no achica el original ({len(data) / 1024:.1f}KB); se usa el original.")
+            return path_photo
+        with tempfile.NamedTemporaryFile(dir=self.path_dir, suffix=".tmp", delete=False) as tmp:
+            tmp.write(encoded)
+        Path(tmp.name).replace(path_entry)
+        self._evict()
+        logger.info(
+            f"~ Foto preparada a {target_px}px ({cfg.dpi} dpi): "
+            f"{len(data) / 1024:.1f}KB -> {len(encoded) / 1024:.1f}KB"
+        )
+        return path_entry
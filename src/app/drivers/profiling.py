@@ -0,0 +1,226 @@
+"""Perfilado opcional de un render, de toda la corrida o de etapas elegidas.
+
+`profiling(cfg, name=...)` activa un perfilado para el contexto actual y `stage()` de
+`src.app.drivers.instrumentation` lo prende alrededor de las etapas pedidas. Al salir quedan en
+`cfg.path_dir` `<nombre>_<timestamp>.pstats` (modo `cprofile`) y `<nombre>_<timestamp>.collapsed.txt`,
+una línea `marco;marco;... peso` por pila: el formato que leen flamegraph.pl, speedscope o inferno.
+
+En modo `cprofile` las pilas se reconstruyen del grafo de llamadores (cada función cuelga de su
+llamador más costoso) y el peso es el tiempo propio en µs. El modo `sampling` toma la pila real cada
+`sampling_interval_s` de CPU con `SIGPROF` (menos overhead, solo en el hilo principal) y el peso es la
+cantidad de muestras.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from fnmatch import fnmatch
+from pathlib import Path
+from types import FrameType
+from typing import Dict, Iterator, Optional, Tuple
+import cProfile
+import logging
+import os
+import pstats
+import re
+import signal
+import threading
+
+from src.core.entities import ProfileArtifacts, ProfilingConfig
+from src.core.entities.profiling import PROFILER_MODES
+
+logger = logging.getLogger(__name__)
+
+_CURRENT_PROFILER: ContextVar[Optional["StageProfiler"]] = ContextVar("stage_profiler", default=None)
+
+_Func = Tuple[str, int, str]
+
+
+def _label(filename: str, lineno: int, name: str) -> str:
+    if filename == "~":
+        return name
+    return f"{name} ({Path(filename).name}:{lineno})".replace(";", ",")
+
+
+def _write_collapsed(path_collapsed: Path, stacks: Counter) -> None:
+    path_collapsed.write_text(
+        "".join(f"{stack} {weight}\n" for stack, weight in stacks.most_common() if weight > 0),
+        encoding="utf-8",
+    )
+
+
+def collapse_pstats(stats: Dict[_Func, tuple]) -> Counter:
+    """Pilas colapsadas a partir de `pstats.Stats.stats`: tiempo propio de cada función, en µs."""
+    stacks: Counter = Counter()
+    for func, (_, _, tottime, _, _) in stats.items():
+        stack = [func]
+        current = func
+        while True:
+            callers = stats[current][4]
+            candidates = [caller for caller in callers if caller in stats and caller not in stack]
+            if not candidates:
+                break
+            current = max(candidates, key=lambda caller: callers[caller][3])
+            stack.append(current)
+        stacks[";".join(_label(*f) for f in reversed(stack))] += round(tottime * 1e6)
+    return stacks
+
+
+class _CProfileBackend:
+    def __init__(self) -> None:
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def enable(self) -> None:
+        self.profile.enable()
+
+    def disable(self) -> None:
+        self.profile.disable()
+
+    def write(self, path_base: Path) -> ProfileArtifacts:
+        path_pstats = path_base.with_name(f"{path_base.name}.pstats")
+        path_collapsed = path_base.with_name(f"{path_base.name}.collapsed.txt")
+        self.profile.dump_stats(path_pstats)
+        _write_collapsed(path_collapsed, collapse_pstats(pstats.Stats(self.profile).stats))
+        return ProfileArtifacts(path_pstats=path_pstats, path_collapsed=path_collapsed)
+
+
+class _SamplingBackend:
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self.stacks: Counter = Counter()
+        self._enabled = False
+        self._previous_handler = None
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        if not self._enabled:
+            return
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(_label(code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval_s, self.interval_s)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        self._enabled = False
+
+    def write(self, path_base: Path) -> ProfileArtifacts:
+        path_collapsed = path_base.with_name(f"{path_base.name}.collapsed.txt")
+        _write_collapsed(path_collapsed, self.stacks)
+        return ProfileArtifacts(path_collapsed=path_collapsed)
+
+
+class StageProfiler:
+    def __init__(self, cfg: ProfilingConfig, *, name: str) -> None:
+        self.cfg = cfg
+        self.name = name
+        mode = cfg.mode
+        if mode == "sampling" and threading.current_thread() is not threading.main_thread():
+            logger.warning("~ El perfilado por muestreo solo funciona en el hilo principal; se usa cProfile.")
+            mode = "cprofile"
+        self._backend = _SamplingBackend(cfg.sampling_interval_s) if mode == "sampling" else _CProfileBackend()
+        self._depth = 0
+        self.artifacts: Optional[ProfileArtifacts] = None
+
+    def matches(self, stage_name: str) -> bool:
+        """Sin `stages` la corrida entera ya está perfilada y ninguna etapa suma nada."""
+        return self.cfg.stages is not None and any(fnmatch(stage_name, pattern) for pattern in self.cfg.stages)
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        if self._depth == 0:
+            self._backend.enable()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._backend.disable()
+
+    def start(self) -> None:
+        self._backend.start()
+
+    def stop(self) -> None:
+        self._backend.stop()
+
+    def _path_base(self) -> Path:
+        slug = re.sub(r"[^\w.-]+", "_", self.name).strip("_") or "cv"
+        stem = f"{slug}_{datetime.now():%Y%m%d-%H%M%S}"
+        path_base, n = self.cfg.path_dir / stem, 1
+        # Dos perfilados del mismo perfil en el mismo segundo no se pisan.
+        while any(self.cfg.path_dir.glob(f"{path_base.name}.*")):
+            n += 1
+            path_base = self.cfg.path_dir / f"{stem}-{n}"
+        return path_base
+
+    def write(self) -> ProfileArtifacts:
+        self.cfg.path_dir.mkdir(parents=True, exist_ok=True)
+        self.artifacts = self._backend.write(self._path_base())
+        return self.artifacts
+
+
+def profiling_config_from_env() -> Optional[ProfilingConfig]:
+    """`PROFILE` (`cprofile`, `sampling`; vacío u `off` no perfila) y `PROFILE_STAGES` separados por coma.
+
+    Un modo desconocido no corta el render: se avisa y se corre sin perfilar.
+    """
+    mode = os.getenv("PROFILE", "").strip().lower()
+    if mode in ("", "off"):
+        return None
+    if mode not in PROFILER_MODES:
+        logger.warning(f"~ PROFILE='{mode}' no es un modo válido ({', '.join(PROFILER_MODES)}); no se perfila.")
+        return None
+    stages = [name.strip() for name in os.getenv("PROFILE_STAGES", "").split(",") if name.strip()]
+    return ProfilingConfig(mode=mode, stages=stages or None)
+
+
+def current_profiler(stage_name: str) -> Optional[StageProfiler]:
+    """El perfilador activo si `stage_name` es una de sus etapas."""
+    profiler = _CURRENT_PROFILER.get()
+    if profiler is not None and profiler.matches(stage_name):
+        return profiler
+    return None
+
+
+@contextmanager
+def profiling(cfg: Optional[ProfilingConfig], *, name: str) -> Iterator[Optional[StageProfiler]]:
+    """Perfila el bloque según `cfg`; sin `cfg`, o si ya hay un perfilado activo, no hace nada."""
+    if cfg is None or _CURRENT_PROFILER.get() is not None:
+        yield None
+        return
+    profiler = StageProfiler(cfg, name=name)
+    token = _CURRENT_PROFILER.set(profiler)
+    profiler.start()
+    try:
+        if cfg.stages is None:
+            with profiler.active():
+                yield profiler
+        else:
+            yield profiler
+    finally:
+        profiler.stop()
+        _CURRENT_PROFILER.reset(token)
+        artifacts = profiler.write()
+        logger.info(
+            f"~ Perfil: {artifacts.path_collapsed}"
+            + (f" | {artifacts.path_pstats}" if artifacts.path_pstats else "")
+        )
@@ -0,0 +1,47 @@
+"""Compresión de PDFs en el mismo proceso con PyMuPDF, sin depender de `gs`."""
+
+import logging
+
+from src.core.drivers.ghostscript import CoreGhostScript
+from src.core.entities import CompressedPDF
+
+logger = logging.getLogger(__name__)
+
+
+class PyMuPDFCompressor(CoreGhostScript):
+    """Equivalente aproximado a `gs -dPDFSETTINGS=/printer`.
+
+    Recomprime a `image_dpi` las imágenes que superan `image_dpi_threshold`, deja en las fuentes
+    sólo los glifos usados, elimina objetos sin referencias y comprime todos los streams.
+    """
+
+    def __init__(self, *, image_dpi: int = 300, image_dpi_threshold: int = 450, image_quality: int = 85) -> None:
+        self.image_dpi = image_dpi
+        self.image_dpi_threshold = image_dpi_threshold
+        self.image_quality = image_quality
+        # Se importa al construir el compresor (`build_pdf_compressor` ya difiere este módulo), no en la
+        # primera compresión: así el import no cae dentro de la etapa `compress` del primer render.
+        import fitz
+
+        self._fitz = fitz
+
+    def compress_pdf_bytes(self, pdf: bytes) -> CompressedPDF:
+        with self._fitz.open(stream=pdf, filetype="pdf") as doc:
+            doc.rewrite_images(
+                dpi_threshold=self.image_dpi_threshold,
+                dpi_target=self.image_dpi,
+                quality=self.image_quality,
+            )
+            doc.subset_fonts()
+            compressed = doc.tobytes(
+                garbage=4,
+                deflate=True,
+                deflate_images=True,
+                deflate_fonts=True,
+                clean=True,
+                use_objstms=1,
+            )
+        if len(compressed) >= len(pdf):
+            # Nunca devolver algo más grande que la entrada.
+            compressed = pdf
+        return CompressedPDF(pdf=compressed, backend="pymupdf", size_before=len(pdf), size_after=len(compressed))
@@ -0,0 +1,3 @@
+from src.app.drivers.render_cv.service import RenderCVService
+
+__all__ = ["RenderCVService"]
@@ -0,0 +1,147 @@
+"""Pipeline completo de un CV: datos de LinkedIn -> PDF -> compresión, en memoria hasta la escritura final."""
+
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+import logging
+
+from src.app.drivers.instrumentation import recording, stage
+from src.app.drivers.pdf_compressor_factory import build_pdf_compressor
+from src.app.drivers.linkedin_data.service import LinkedinDataService
+from src.core.drivers.builder import CoreBuilderCV
+from src.core.drivers.ghostscript import CoreGhostScript
+from src.core.entities import AutoFitConfig, CVSettings, LinkedinData, PersonalInformation, RunReport
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCVService:
+    """Render de un perfil; todas las rutas salen de `settings` (una instancia por perfil).
+
+    Con `instrument=True` cada render deja en `last_report` el tiempo de sus etapas, o con
+    `trace_memory=True` su pico de memoria (sin tiempos: tracemalloc los infla).
+    """
+
+    def __init__(
+        self,
+        *,
+        settings: Optional[CVSettings] = None,
+        linkedin_data_service: Optional[LinkedinDataService] = None,
+        builder_cv: Optional[CoreBuilderCV] = None,
+        ghostscript: Optional[CoreGhostScript] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+    ) -> None:
+        self.settings = settings or CVSettings()
+        self.linkedin_data_service = linkedin_data_service or LinkedinDataService(settings=self.settings)
+        if builder_cv is None:
+            # Diferido: el builder trae reportlab (canvas, platypus) y solo hace falta al renderizar.
+            from src.app.drivers.build_cv.service import BuildCVService
+
+            builder_cv = BuildCVService(settings=self.settings)
+        self.builder_cv = builder_cv
+        self.ghostscript = ghostscript
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.last_report: Optional[RunReport] = None
+
+    @contextmanager
+    def _instrumented(self) -> Iterator[None]:
+        if not self.instrument:
+            yield
+            return
+        with recording(trace_memory=self.trace_memory) as recorder:
+            yield
+        report = self.last_report = recorder.report
+        if self.trace_memory:
+            logger.info(
+                "~ Etapas (pico de memoria): "
+                + " | ".join(f"{s.name}={s.peak_bytes / 1024:.0f}KB" for s in report.stages)
+                + f" | total={report.peak_bytes / 1024:.0f}KB"
+            )
+        else:
+            logger.info(
+                "~ Etapas: "
+                + " | ".join(f"{s.name}={s.wall_s * 1e3:.1f}ms" for s in report.stages)
+                + f" | total={report.wall_s * 1e3:.1f}ms"
+            )
+
+    def _load_linkedin_data(self) -> LinkedinData:
+        with stage("linkedin_data"):
+            return self.linkedin_data_service.load()
+
+    def _render_pdf_bytes(
+        self,
+        *,
+        linkedin_data: LinkedinData,
+        personal_information: PersonalInformation,
+        compress: bool,
+        auto_fit: Optional[AutoFitConfig],
+    ) -> bytes:
+        """Build y compresión sobre buffers en memoria; ninguna etapa toca el disco."""
+        buffer = BytesIO()
+        with stage("build"):
+            self.builder_cv.build_and_save(
+                path_pdf=buffer,
+                personal_information=personal_information,
+                linkedin_data=linkedin_data,
+                auto_fit=auto_fit,
+            )
+        pdf = buffer.getvalue()
+
+        if compress:
+            logger.info("==================== Compress PDF ====================")
+            # Se elige recién acá para no detectar backends en renders sin compresión.
+            self.ghostscript = self.ghostscript or build_pdf_compressor()
+            with stage("compress"):
+                compressed = self.ghostscript.compress_pdf_bytes(pdf)
+            logger.info(
+                f"~ {compressed.backend}: {compressed.size_before / 1024:.1f}KB -> "
+                f"{compressed.size_after / 1024:.1f}KB ({compressed.ratio:.0%})"
+            )
+            pdf = compressed.pdf
+        return pdf
+
+    def render_to(
+        self,
+        output: BinaryIO,
+        *,
+        personal_information: PersonalInformation,
+        compress: bool = True,
+        auto_fit: Optional[AutoFitConfig] = None,
+    ) -> int:
+        """Escribe el PDF final en `output` (cualquier archivo binario abierto) y devuelve los bytes escritos."""
+        with self._instrumented():
+            pdf = self._render_pdf_bytes(
+                linkedin_data=self._load_linkedin_data(),
+                personal_information=personal_information,
+                compress=compress,
+                auto_fit=auto_fit,
+            )
+            with stage("write"):
+                output.write(pdf)
+        return len(pdf)
+
+    def render(
+        self,
+        *,
+        personal_information: PersonalInformation,
+        compress: bool = True,
+        auto_fit: Optional[AutoFitConfig] = None,
+    ) -> Path:
+        with self._instrumented():
+            linkedin_data = self._load_linkedin_data()
+            pdf = self._render_pdf_bytes(
+                linkedin_data=linkedin_data,
+                personal_information=personal_information,
+                compress=compress,
+                auto_fit=auto_fit,
+            )
+
+            path_pdf = self.settings.path_pdf_output(linkedin_data.profile.full_name)
+            with stage("write"):
+                path_pdf.parent.mkdir(parents=True, exist_ok=True)
+                path_pdf.write_bytes(pdf)
+        logger.info(f"~ Export PDF: {path_pdf}")
+        return path_pdf
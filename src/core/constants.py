@@ -1,5 +1,4 @@
 from pathlib import Path
-import os
 
 PATH_DATA_DIR = Path("data")
 PATH_ASSETS_DIR = Path("assets")
@@ -7,6 +6,7 @@ PATH_CONFIG = Path("config")
 PATH_IMAGES_DIR = PATH_ASSETS_DIR / "images"
 PATH_FONTS = PATH_ASSETS_DIR / "fonts"
 PATH_PLOTS_DIR = PATH_ASSETS_DIR / "plots"
+PATH_CACHE_DIR = Path(".cache")
 
 PATH_KEYWORDS = PATH_CONFIG / "keywords.json"
 
@@ -14,21 +14,10 @@ PATH_PYTHON_ICON = PATH_IMAGES_DIR / "python_icon.png"
 ENV_FOLDER_DATA = "FOLDER_DATA"
 ENV_PHOTO_NAME = "PHOTO_NAME"
 
-FOLDER_DATA = os.getenv(ENV_FOLDER_DATA)
-PHOTO_NAME = os.getenv(ENV_PHOTO_NAME)
+LINKEDIN_PROFILE_CSV = "Profile.csv"
+LINKEDIN_POSITIONS_CSV = "Positions.csv"
+LINKEDIN_EDUCATION_CSV = "Education.csv"
 
-if not FOLDER_DATA:
-    raise RuntimeError(f"La variable de entorno '{ENV_FOLDER_DATA}' es requerida.")
-if not PHOTO_NAME:
-    raise RuntimeError(f"La variable de entorno '{ENV_PHOTO_NAME}' es requerida.")
 
-
-PATH_FOLDER_DATA = PATH_DATA_DIR / FOLDER_DATA
-PATH_LINKEDIN_PROFILE = PATH_FOLDER_DATA / "Profile.csv"
-PATH_LINKEDIN_POSITIONS = PATH_FOLDER_DATA / "Positions.csv"
-PATH_LINKEDIN_EDUCATION = PATH_FOLDER_DATA / "Education.csv"
-PATH_PHOTO = PATH_IMAGES_DIR / PHOTO_NAME
-PATH_PDF_BASENAME = PATH_FOLDER_DATA.stem
-
-def get_path_pdf_output(full_name: str) -> Path:
-    return PATH_DATA_DIR / f"Curriculum - {full_name}.pdf"
\ No newline at end of file
+def get_path_pdf_output(full_name: str, path_dir: Path = PATH_DATA_DIR) -> Path:
+    return path_dir / f"Curriculum - {full_name}.pdf"
\ No newline at end of file
@@ -1,10 +1,14 @@
 """Interfaz para constructor de CV."""
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
-from src.core.entities import BuilderCVConfig, DividerLine, DrawPositionsResult, LinkedinData, PersonalInformation, SizesCV, StyleCV
+if TYPE_CHECKING:
+    # Solo anotaciones: la interfaz no carga reportlab (estilos, layout) al importarse.
+    from src.core.entities import AutoFitConfig, BuilderCVConfig, DrawPositionsResult, LinkedinData, PersonalInformation, SizesCV, StyleCV
 
 
 class CoreBuilderCV(ABC):
@@ -14,24 +18,13 @@ class CoreBuilderCV(ABC):
     def build_and_save(
         self,
         *,
-        path_pdf: Path,
+        path_pdf: Union[Path, BinaryIO],
         personal_information: PersonalInformation,
         linkedin_data: LinkedinData,
         style_cv: Optional[StyleCV] = None,
         sizes_cv: Optional[SizesCV] = None,
         cfg_builder: Optional[BuilderCVConfig] = None,
+        auto_fit: Optional[AutoFitConfig] = None,
     ) -> DrawPositionsResult:
-        """Construye y guarda el CV en PDF."""
-        pass
-    
-    @abstractmethod
-    def draw_lines(
-        self,
-        *,
-        path_pdf: Path,
-        lines: list[DividerLine],
-        color: tuple[float, float, float] = (1, 0, 0),
-        width: float = 1.0,
-    ) -> None:
-        """Dibuja líneas adicionales en el PDF."""
+        """Construye el CV en PDF (ruta o archivo binario abierto); con `auto_fit` escala el contenido para que entre en la página."""
         pass
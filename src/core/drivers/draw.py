@@ -1,15 +1,17 @@
 """Interfaz para servicio de dibujo de CV."""
 
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
 from reportlab.pdfgen.canvas import Canvas
 
 from src.core.entities import (
     BackgroundDrawCfg,
+    BodyLayout,
     DrawCVConfig,
     DrawPositionsResult,
     PhotoDrawCfg,
-    SidebarDrawCfg,
-    PositionsDrawCfg,
+    SidebarLayout,
 )
 
 
@@ -37,10 +39,19 @@ class CoreDrawCVService(ABC):
         self,
         *,
         c: Canvas,
-        cfg: SidebarDrawCfg,
-        draw_config: DrawCVConfig,
+        layout: SidebarLayout,
+    ) -> None:
+        """Dibuja la barra lateral ya ubicada por el layout."""
+        pass
+    
+    @abstractmethod
+    def draw_sidebar_panel(
+        self,
+        *,
+        c: Canvas,
+        layout: SidebarLayout,
     ) -> None:
-        """Dibuja la barra lateral."""
+        """Dibuja solo el fondo de la barra lateral, en las páginas de continuación."""
         pass
     
     @abstractmethod
@@ -48,8 +59,8 @@ class CoreDrawCVService(ABC):
         self,
         *,
         c: Canvas,
-        cfg: PositionsDrawCfg,
-        draw_config: DrawCVConfig,
+        layout: BodyLayout,
+        new_page: Optional[Callable[[], None]] = None,
     ) -> DrawPositionsResult:
-        """Dibuja las posiciones laborales."""
+        """Dibuja las posiciones laborales ya ubicadas por el layout; `new_page` abre cada página siguiente."""
         pass
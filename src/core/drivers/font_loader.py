@@ -14,7 +14,10 @@ class PairNamePathFont(BaseModel):
 
 
 class FontLoaderConfig(BaseModel):
+    """Con `lazy=True` cada cara (Regular, Bold, ...) se parsea recién cuando reportlab la resuelve por primera vez."""
+
     base_name: Literal["HackNerdFont"]
+    lazy: bool = True
 
 
 class CoreFontLoader(ABC):
@@ -3,16 +3,46 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Union
+import tempfile
+
+from src.core.entities import CompressedPDF
 
 
 class CoreGhostScript(ABC):
     """Interfaz para comprimir PDFs."""
-    
+
     @abstractmethod
-    def compress_pdf(self, path_pdf: Union[str, Path]) -> None:
-        """Comprime un PDF reduciendo su tamaño.
-        
+    def compress_pdf_bytes(self, pdf: bytes) -> CompressedPDF:
+        """Comprime un PDF en memoria y devuelve el resultado con el tamaño antes/después.
+
         Args:
-            path_pdf: Ruta al PDF (string o Path).
+            pdf: Contenido del PDF.
         """
         pass
+
+    def compress_pdf(self, path_pdf: Union[str, Path]) -> CompressedPDF:
+        """Comprime un PDF en disco, reemplazándolo.
+
+        Se escribe en un temporal junto al original y se renombra, así un corte a mitad de escritura
+        no deja el PDF truncado.
+
+        Args:
+            path_pdf: Ruta al PDF (string o Path).
+        """
+        path_pdf = Path(path_pdf)
+        compressed = self.compress_pdf_bytes(path_pdf.read_bytes())
+        with tempfile.NamedTemporaryFile(
+            suffix=".pdf",
+            prefix=f"{path_pdf.stem}_",
+            dir=path_pdf.parent,
+            delete=False,
+        ) as tmp:
+            path_tmp = Path(tmp.name)
+            try:
+                tmp.write(compressed.pdf)
+            except BaseException:
+                tmp.close()
+                path_tmp.unlink(missing_ok=True)
+                raise
+        path_tmp.replace(path_pdf)
+        return compressed
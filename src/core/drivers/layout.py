@@ -0,0 +1,33 @@
+"""Interfaz para el servicio de layout del CV."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.core.entities import (
+    BuilderCVConfig,
+    CVLayout,
+    DrawCVConfig,
+    LinkedinData,
+    PersonalInformation,
+    SizesCV,
+    StyleCV,
+)
+
+
+class CoreLayoutCVService(ABC):
+    """Interfaz para servicio de layout del CV."""
+
+    @abstractmethod
+    def layout(
+        self,
+        *,
+        personal_information: PersonalInformation,
+        linkedin_data: LinkedinData,
+        style_cv: Optional[StyleCV] = None,
+        sizes_cv: Optional[SizesCV] = None,
+        cfg_builder: Optional[BuilderCVConfig] = None,
+        draw_config: Optional[DrawCVConfig] = None,
+        scale: float = 1.0,
+    ) -> CVLayout:
+        """Mide y ubica todo el contenido del CV sin dibujar, con fuentes y espaciados escalados por `scale`."""
+        pass
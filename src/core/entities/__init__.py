@@ -1,44 +1,108 @@
-from src.core.entities.linkedin_data import Profile, Position, Education, LinkedinData
-from src.core.entities.config import (
-    StyleCVConfig,
-    BuilderCVConfig,
-    DrawCVConfig,
-    SizesCV,
-    LinkedinDataToCVConfig,
-)
-from src.core.entities.style import StyleCV
-from src.core.entities.personal_information import PersonalInformation
-from src.core.entities.draw_inputs import (
-    BackgroundDrawCfg,
-    DividerLine,
-    DrawPositionsResult,
-    PositionsLayoutDTO,
-    ImageDrawCfg,
-    ImageTitleDrawCfg,
-    PhotoDrawCfg,
-    SidebarDrawCfg,
-    PositionsDrawCfg,
-)
-
-__all__ = [
-    "Profile",
-    "Position",
-    "Education",
-    "LinkedinData",
-    "StyleCVConfig",
-    "BuilderCVConfig",
-    "DrawCVConfig",
-    "LinkedinDataToCVConfig",
-    "StyleCV",
-    "SizesCV",
-    "PersonalInformation",
-    "BackgroundDrawCfg",
-    "DividerLine",
-    "DrawPositionsResult",
-    "PositionsLayoutDTO",
-    "ImageDrawCfg",
-    "ImageTitleDrawCfg",
-    "PhotoDrawCfg",
-    "SidebarDrawCfg",
-    "PositionsDrawCfg",
-]
+"""Entidades del dominio.
+
+Los submódulos se importan recién al pedir uno de sus nombres (PEP 562): `from src.core.entities import
+CVSettings` no carga reportlab ni los modelos de layout. Los imports de abajo son solo para el tipado.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.core.entities.linkedin_data import Profile, Position, Education, LinkedinData
+    from src.core.entities.config import (
+        StyleCVConfig,
+        BuilderCVConfig,
+        PhotoPreprocessConfig,
+        DrawCVConfig,
+        SizesCV,
+        LinkedinDataToCVConfig,
+    )
+    from src.core.entities.style import StyleCV
+    from src.core.entities.personal_information import PersonalInformation, ManifestPersonalInformation
+    from src.core.entities.cv_settings import CVSettings
+    from src.core.entities.draw_inputs import (
+        BackgroundDrawCfg,
+        DividerLine,
+        DrawPositionsResult,
+        PositionsLayoutDTO,
+        ImageDrawCfg,
+        ImageTitleDrawCfg,
+        PhotoDrawCfg,
+        SidebarDrawCfg,
+        PositionsDrawCfg,
+    )
+    from src.core.entities.layout import (
+        PlacedFlowable,
+        PlacedRect,
+        SidebarLayout,
+        PositionLayout,
+        BodyLayout,
+        CVLayout,
+    )
+    from src.core.entities.paragraph_cache import ParagraphCacheInfo, ParagraphMeasure
+    from src.core.entities.image_cache import ImageCacheInfo
+    from src.core.entities.auto_fit import AutoFitConfig, AutoFitResult
+    from src.core.entities.compression import CompressedPDF
+    from src.core.entities.instrumentation import RunReport, StageMetrics
+    from src.core.entities.profiling import ProfileArtifacts, ProfilingConfig
+    from src.core.entities.batch import BatchJob, BatchJobResult, BatchSummary
+
+_LAZY_EXPORTS = {
+    "Profile": "linkedin_data",
+    "Position": "linkedin_data",
+    "Education": "linkedin_data",
+    "LinkedinData": "linkedin_data",
+    "StyleCVConfig": "config",
+    "BuilderCVConfig": "config",
+    "PhotoPreprocessConfig": "config",
+    "DrawCVConfig": "config",
+    "LinkedinDataToCVConfig": "config",
+    "StyleCV": "style",
+    "SizesCV": "config",
+    "PersonalInformation": "personal_information",
+    "BackgroundDrawCfg": "draw_inputs",
+    "DividerLine": "draw_inputs",
+    "DrawPositionsResult": "draw_inputs",
+    "PositionsLayoutDTO": "draw_inputs",
+    "ImageDrawCfg": "draw_inputs",
+    "ImageTitleDrawCfg": "draw_inputs",
+    "PhotoDrawCfg": "draw_inputs",
+    "SidebarDrawCfg": "draw_inputs",
+    "PositionsDrawCfg": "draw_inputs",
+    "ManifestPersonalInformation": "personal_information",
+    "CVSettings": "cv_settings",
+    "PlacedFlowable": "layout",
+    "PlacedRect": "layout",
+    "SidebarLayout": "layout",
+    "PositionLayout": "layout",
+    "BodyLayout": "layout",
+    "CVLayout": "layout",
+    "ParagraphMeasure": "paragraph_cache",
+    "ParagraphCacheInfo": "paragraph_cache",
+    "ImageCacheInfo": "image_cache",
+    "AutoFitConfig": "auto_fit",
+    "AutoFitResult": "auto_fit",
+    "CompressedPDF": "compression",
+    "StageMetrics": "instrumentation",
+    "RunReport": "instrumentation",
+    "ProfilingConfig": "profiling",
+    "ProfileArtifacts": "profiling",
+    "BatchJob": "batch",
+    "BatchJobResult": "batch",
+    "BatchSummary": "batch",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
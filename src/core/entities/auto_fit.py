@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field, model_validator
+
+from src.core.entities.config import DrawCVConfig
+
+
+class AutoFitConfig(BaseModel):
+    """Rango de la búsqueda binaria del factor de escala (fuentes, interlineado y espaciados)."""
+
+    min_scale: float = Field(default=0.6, gt=0)
+    max_scale: float = Field(default=1.0, gt=0)
+    tolerance: float = Field(default=0.005, gt=0)
+    max_iterations: int = Field(default=20, ge=1)
+
+    @model_validator(mode="after")
+    def _check_range(self) -> "AutoFitConfig":
+        if self.min_scale > self.max_scale:
+            raise ValueError(f"min_scale ({self.min_scale}) > max_scale ({self.max_scale})")
+        return self
+
+
+class AutoFitResult(BaseModel):
+    scale: float
+    fits: bool
+    n_layouts: int
+    font_sizes: dict[str, float]
+    draw_config: DrawCVConfig
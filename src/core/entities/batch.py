@@ -0,0 +1,50 @@
+from pathlib import Path
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from src.core.entities.cv_settings import CVSettings
+from src.core.entities.instrumentation import RunReport
+from src.core.entities.personal_information import PersonalInformation
+
+
+class BatchJob(BaseModel):
+    profile: str
+    settings: CVSettings
+    personal_information: PersonalInformation
+    compress: bool = True
+    pdf_compressor: Literal["auto", "ghostscript", "pymupdf"] = "auto"
+    csv_engine: Literal["pandas", "stream"] = "pandas"
+    use_cache: bool = True
+    auto_fit: bool = False
+    instrument: bool = False
+    trace_memory: bool = False
+
+
+class BatchJobResult(BaseModel):
+    profile: str
+    status: Literal["ok", "error"]
+    duration_s: float
+    output_size_bytes: Optional[int] = None
+    path_pdf: Optional[Path] = None
+    error: Optional[str] = None
+    report: Optional[RunReport] = None
+
+
+class BatchSummary(BaseModel):
+    """`gs_workers` es la cantidad de llamadas `gs` en paralelo que se usaron (0: cada worker comprime) y
+    `warnings` lo que cambió respecto de lo pedido, como `--gs-workers` sin `gs` instalado."""
+
+    workers: int
+    duration_s: float
+    jobs: list[BatchJobResult]
+    gs_workers: int = 0
+    warnings: list[str] = Field(default_factory=list)
+
+    @property
+    def n_ok(self) -> int:
+        return sum(1 for job in self.jobs if job.status == "ok")
+
+    @property
+    def n_error(self) -> int:
+        return len(self.jobs) - self.n_ok
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CompressedPDF(BaseModel):
+    pdf: bytes
+    backend: str
+    size_before: int
+    size_after: int
+    duration_s: Optional[float] = None
+
+    @property
+    def ratio(self) -> float:
+        return self.size_after / self.size_before if self.size_before else 1.0
@@ -13,28 +13,60 @@ class StyleCVConfig(BaseModel):
     sidebar_text: str = "#dddddd"
 
 
+class PhotoPreprocessConfig(BaseModel):
+    """Remuestreo de la foto al tamaño impreso antes de dibujarla (`enabled=False` embebe el original)."""
+
+    enabled: bool = True
+    dpi: int = 300
+    jpeg_quality: int = 85
+    precrop_circle: bool = True
+
+
 class BuilderCVConfig(BaseModel):
+    """Con `paginate`, las posiciones que no entran siguen en páginas de continuación; si no, se dibujan bajo el margen."""
+
     page_size: Tuple[float, float] = A4
     is_photo_circle: bool = True
+    paginate: bool = True
+    photo: PhotoPreprocessConfig = Field(default_factory=PhotoPreprocessConfig)
+
+
+# Espaciados que acompañan al tamaño de fuente en `DrawCVConfig.scaled`.
+_SCALED_DRAW_FIELDS = (
+    "dist_between_title_sidebar_to_text",
+    "dist_python_icon_to_title",
+    "dist_between_links",
+    "dist_full_name_to_headline",
+    "dist_headline_to_links",
+    "dist_between_title_text_sidebar",
+    "len_python_icon_mm",
+    "spacer_height",
+)
 
 
 class DrawCVConfig(BaseModel):
-    dist_between_title_sidebar_to_text: int = 5
-    dist_python_icon_to_title: int = 4
-    dist_between_links: int = 1
-    dist_full_name_to_headline: int = 8
-    dist_headline_to_links: int = 4
+    dist_between_title_sidebar_to_text: float = 5
+    dist_python_icon_to_title: float = 4
+    dist_between_links: float = 1
+    dist_full_name_to_headline: float = 8
+    dist_headline_to_links: float = 4
     dist_line_spacing_left_mm: int = 3
     dist_line_spacing_right_mm: int = 3
     line_thickness: float = 0.5
-    dist_between_title_text_sidebar: int = 9
-    len_python_icon_mm: int = 3
+    dist_between_title_text_sidebar: float = 9
+    len_python_icon_mm: float = 3
     sidebar_to_body_gap_mm: int = 2
     photo_top_padding_mm: int = 10
-    spacer_height: int = 15
+    spacer_height: float = 15
     frame_margin_left_mm: int = 1
     frame_margin_right_mm: int = 1
 
+    def scaled(self, scale: float) -> "DrawCVConfig":
+        """Copia con los espaciados del contenido multiplicados por `scale` (márgenes y foto no cambian)."""
+        if scale == 1:
+            return self
+        return self.model_copy(update={name: getattr(self, name) * scale for name in _SCALED_DRAW_FIELDS})
+
 
 class SizesCV(BaseModel):
     margin: int = 5
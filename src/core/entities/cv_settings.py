@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ConfigDict
+from pydantic_settings import BaseSettings
+
+from src.core.constants import (
+    ENV_FOLDER_DATA,
+    ENV_PHOTO_NAME,
+    LINKEDIN_EDUCATION_CSV,
+    LINKEDIN_POSITIONS_CSV,
+    LINKEDIN_PROFILE_CSV,
+    PATH_DATA_DIR,
+    PATH_IMAGES_DIR,
+    PATH_KEYWORDS,
+    get_path_pdf_output,
+)
+
+
+class CVSettings(BaseSettings):
+    """Rutas de un job de render, resueltas al construirse (no al importar módulos).
+
+    `CVSettings()` toma `FOLDER_DATA` y `PHOTO_NAME` del entorno; un worker de larga vida
+    construye una instancia por perfil y se la pasa a los servicios.
+    """
+
+    folder_data: Optional[str] = None
+    photo_name: Optional[str] = None
+    path_data_dir: Path = PATH_DATA_DIR
+    path_images_dir: Path = PATH_IMAGES_DIR
+    path_output_dir: Path = PATH_DATA_DIR
+    path_keywords: Path = PATH_KEYWORDS
+
+    model_config = ConfigDict(
+        env_prefix="",
+        frozen=True,
+        str_strip_whitespace=True,
+    )
+
+    @property
+    def path_export(self) -> Path:
+        """Carpeta extraída o `.zip` del export de LinkedIn."""
+        if not self.folder_data:
+            raise RuntimeError(f"La variable de entorno '{ENV_FOLDER_DATA}' es requerida.")
+        return self.path_data_dir / self.folder_data
+
+    @property
+    def path_linkedin_profile(self) -> Path:
+        return self.path_export / LINKEDIN_PROFILE_CSV
+
+    @property
+    def path_linkedin_positions(self) -> Path:
+        return self.path_export / LINKEDIN_POSITIONS_CSV
+
+    @property
+    def path_linkedin_education(self) -> Path:
+        return self.path_export / LINKEDIN_EDUCATION_CSV
+
+    @property
+    def path_photo(self) -> Path:
+        if not self.photo_name:
+            raise RuntimeError(f"La variable de entorno '{ENV_PHOTO_NAME}' es requerida.")
+        return self.path_images_dir / self.photo_name
+
+    def path_pdf_output(self, full_name: str) -> Path:
+        return get_path_pdf_output(full_name, self.path_output_dir)
@@ -1,3 +1,11 @@
+"""Entradas de dibujo.
+
+Las que se arman por elemento dentro del layout (una o varias por posición) son dataclasses con
+`__slots__`: sus valores ya salen de modelos validados y no pasan por pydantic. Las que reciben los
+servicios desde afuera siguen siendo modelos validados.
+"""
+
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -5,6 +13,7 @@ from pydantic import BaseModel, ConfigDict
 from reportlab.lib.styles import StyleSheet1
 from reportlab.lib.units import mm
 
+from src.core.entities.auto_fit import AutoFitResult
 from src.core.entities.config import DrawCVConfig, SizesCV
 from src.core.entities.linkedin_data import LinkedinData
 from src.core.entities.personal_information import PersonalInformation
@@ -40,12 +49,15 @@ class PositionsDrawCfg(BaseModel):
 
     linkedin_data: LinkedinData
     sizes_cv: SizesCV
+    style_cv: StyleCV
     styles: StyleSheet1
     page_width: float
     page_height: float
+    paginate: bool = False
 
 
-class PositionsLayoutDTO(BaseModel):
+@dataclass(slots=True)
+class PositionsLayoutDTO:
     body_x: float
     line_anchor_x: float
     body_width: float
@@ -67,7 +79,8 @@ class PositionsLayoutDTO(BaseModel):
         )
 
 
-class DividerLine(BaseModel):
+@dataclass(slots=True)
+class DividerLine:
     x_start: float
     y_start: float
     x_end: float
@@ -85,9 +98,12 @@ class DividerLine(BaseModel):
 class DrawPositionsResult(BaseModel):
     divider_lines: list[DividerLine]
     line_anchor_x: float
+    pages: int = 1
+    auto_fit: Optional[AutoFitResult] = None
 
 
-class ImageDrawCfg(BaseModel):
+@dataclass(slots=True)
+class ImageDrawCfg:
     path_img: Path
     x: float
     y: float
@@ -108,7 +124,8 @@ class ImageDrawCfg(BaseModel):
         return self.y + (self.height / 2)
 
 
-class ImageTitleDrawCfg(BaseModel):
+@dataclass(slots=True)
+class ImageTitleDrawCfg:
     path_img: Path
     title_html: str
     img_size: float
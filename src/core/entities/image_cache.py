@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class ImageCacheInfo(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    nbytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,67 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel
+
+_PROMETHEUS_PREFIX = "linkedin2cv"
+_PROMETHEUS_METRICS = (
+    ("stage_wall_seconds", "wall_s", "Tiempo de reloj por etapa del pipeline."),
+    ("stage_cpu_seconds", "cpu_s", "Tiempo de CPU del proceso por etapa del pipeline."),
+    ("stage_peak_memory_bytes", "peak_bytes", "Pico de memoria (tracemalloc) por encima del inicio de la etapa."),
+    ("stage_calls", "calls", "Veces que se ejecutó la etapa."),
+)
+
+
+class StageMetrics(BaseModel):
+    """Métricas acumuladas de una etapa: tiempos sumados o el mayor pico entre sus ejecuciones.
+
+    Una medición trae tiempos (`wall_s`, `cpu_s`) o picos (`peak_bytes`), nunca ambos: lo que no se
+    midió queda en `None`.
+    """
+
+    name: str
+    calls: int = 0
+    wall_s: Optional[float] = 0.0
+    cpu_s: Optional[float] = 0.0
+    peak_bytes: Optional[int] = None
+
+
+class RunReport(BaseModel):
+    """Etapas en el orden en que empezaron; las anidadas también cuentan en la etapa que las contiene."""
+
+    wall_s: Optional[float]
+    cpu_s: Optional[float]
+    peak_bytes: Optional[int] = None
+    stages: list[StageMetrics]
+
+    def stage(self, name: str) -> Optional[StageMetrics]:
+        return next((stage for stage in self.stages if stage.name == name), None)
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return self.model_dump_json(indent=indent)
+
+    def to_prometheus(self, **labels: str) -> str:
+        return render_prometheus([(labels, self)])
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape_label(str(value))}"' for key, value in labels.items())
+
+
+def render_prometheus(reports: Iterable[Tuple[Dict[str, str], RunReport]]) -> str:
+    """Formato de texto de Prometheus; cada reporte va con sus labels (por ejemplo `profile`)."""
+    reports = list(reports)
+    lines = []
+    for metric, attr, help_text in _PROMETHEUS_METRICS:
+        name = f"{_PROMETHEUS_PREFIX}_{metric}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, report in reports:
+            for stage in report.stages:
+                value = getattr(stage, attr)
+                if value is not None:
+                    lines.append(f"{name}{{{_format_labels({**labels, 'stage': stage.name})}}} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,165 @@
+"""Árbol de ubicación del CV: cajas medidas y posicionadas, sin canvas.
+
+Las cajas por elemento (`PlacedFlowable`, `PositionLayout`) son dataclasses sin validación, igual que
+las entradas de dibujo por elemento.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from reportlab.lib.colors import Color
+from reportlab.lib.styles import StyleSheet1
+from reportlab.platypus import Flowable
+
+from src.core.entities.config import DrawCVConfig
+from src.core.entities.draw_inputs import DividerLine, ImageDrawCfg
+
+
+@dataclass(slots=True)
+class PlacedFlowable:
+    """Flowable ya medido con `wrap`. `(x, y)` es la esquina inferior izquierda en la página `page`."""
+
+    flowable: Flowable
+    x: float
+    y: float
+    width: float
+    height: float
+    overflow: bool = False
+    page: int = 0
+
+    @property
+    def top(self) -> float:
+        return self.y + self.height
+
+
+class PlacedRect(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    x: float
+    y: float
+    width: float
+    height: float
+    color: Color
+
+
+class SidebarLayout(BaseModel):
+    """Contenido de la barra lateral apilado con la misma semántica que `reportlab.platypus.Frame`.
+
+    Las cajas que no entran quedan con `overflow=True`, apiladas debajo del límite, y no se dibujan.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    panel: PlacedRect
+    frame_x: float
+    frame_y: float
+    frame_width: float
+    frame_height: float
+    boxes: list[PlacedFlowable]
+
+    @property
+    def overflow(self) -> bool:
+        return any(box.overflow for box in self.boxes)
+
+    @property
+    def placed_boxes(self) -> list[PlacedFlowable]:
+        return [box for box in self.boxes if not box.overflow]
+
+    @property
+    def content_bottom(self) -> float:
+        return min((box.y for box in self.boxes), default=self.frame_y + self.frame_height)
+
+
+@dataclass(slots=True)
+class PositionLayout:
+    """Posición que empieza en la página `page`; si la descripción se cortó, `continuation` tiene el resto.
+
+    El divisor queda bajo la fila del título, en `page`; `bottom` queda en la última página (`end_page`).
+    """
+
+    icon: ImageDrawCfg
+    title: PlacedFlowable
+    subtitle: PlacedFlowable
+    description: PlacedFlowable
+    top: float
+    title_row_bottom: float
+    bottom: float
+    divider: Optional[DividerLine] = None
+    page: int = 0
+    continuation: list[PlacedFlowable] = field(default_factory=list)
+
+    @property
+    def end_page(self) -> int:
+        return self.continuation[-1].page if self.continuation else self.page
+
+    @property
+    def overflow(self) -> bool:
+        return (
+            self.title.overflow
+            or self.subtitle.overflow
+            or self.description.overflow
+            or any(part.overflow for part in self.continuation)
+        )
+
+    @property
+    def boxes(self) -> list[PlacedFlowable]:
+        return [self.title, self.subtitle, self.description]
+
+
+class BodyLayout(BaseModel):
+    """Posiciones y crédito final. Lo que cae bajo `bottom_limit` se marca como overflow.
+
+    Paginado, lo que no entra sigue en páginas de continuación (con `top` en el mismo margen) y nada
+    queda en overflow; el crédito final va en la última página. Cada posición salvo la última lleva un
+    divisor bajo la fila del título (icono + título).
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    x: float
+    width: float
+    top: float
+    bottom_limit: float
+    line_anchor_x: float
+    divider_color: Color
+    divider_width: float
+    positions: list[PositionLayout]
+    final_credit: PlacedFlowable
+
+    @property
+    def overflow(self) -> bool:
+        return self.final_credit.overflow or any(position.overflow for position in self.positions)
+
+    @property
+    def divider_lines(self) -> list[DividerLine]:
+        return [position.divider for position in self.positions if position.divider is not None]
+
+    @property
+    def content_bottom(self) -> float:
+        return self.final_credit.y
+
+    @property
+    def pages(self) -> int:
+        return self.final_credit.page + 1
+
+
+class CVLayout(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    page_width: float
+    page_height: float
+    scale: float = 1.0
+    draw_config: DrawCVConfig
+    styles: StyleSheet1
+    sidebar: SidebarLayout
+    body: BodyLayout
+
+    @property
+    def overflow(self) -> bool:
+        return self.sidebar.overflow or self.body.overflow
+
+    @property
+    def fits(self) -> bool:
+        """Entra en una sola página, sin overflow."""
+        return not self.overflow and self.body.pages == 1
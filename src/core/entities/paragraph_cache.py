@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict
+from reportlab.platypus import Paragraph
+
+
+class ParagraphMeasure(BaseModel):
+    """`Paragraph` ya parseado y cortado en líneas (`blPara`) para un ancho dado."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    paragraph: Paragraph
+    width: float
+    height: float
+
+
+class ParagraphCacheInfo(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -2,7 +2,7 @@ from datetime import date
 from typing import Optional
 
 from pydantic import ConfigDict, EmailStr, Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
 
 class PersonalInformation(BaseSettings):
@@ -28,3 +28,18 @@ class PersonalInformation(BaseSettings):
         env_prefix="",
         str_strip_whitespace=True,
     )
+
+
+class ManifestPersonalInformation(PersonalInformation):
+    """Igual que `PersonalInformation`, pero sólo con valores explícitos (no lee el entorno)."""
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (init_settings,)
@@ -0,0 +1,29 @@
+from pathlib import Path
+from typing import Literal, Optional, get_args
+
+from pydantic import BaseModel, Field
+
+from src.core.constants import PATH_DATA_DIR
+
+ProfilerMode = Literal["cprofile", "sampling"]
+PROFILER_MODES: tuple[str, ...] = get_args(ProfilerMode)
+
+
+class ProfilingConfig(BaseModel):
+    """Perfilado opcional de un render.
+
+    Sin `stages` se perfila toda la corrida; con `stages` solo las etapas cuyo nombre coincide con
+    alguno de los patrones (`fnmatch`: `fix:*`, `sidebar`, `positions`, `compress`).
+    """
+
+    mode: ProfilerMode = "cprofile"
+    stages: Optional[list[str]] = None
+    path_dir: Path = PATH_DATA_DIR / "profiles"
+    sampling_interval_s: float = Field(default=0.001, gt=0)
+
+
+class ProfileArtifacts(BaseModel):
+    """Archivos que deja un perfilado; `path_pstats` solo existe en modo `cprofile`."""
+
+    path_pstats: Optional[Path] = None
+    path_collapsed: Path
@@ -1,4 +1,6 @@
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from reportlab.lib import colors
 from reportlab.lib.colors import Color
@@ -8,26 +10,84 @@ from src.core.entities.config import StyleCVConfig
 
 FONT = "HackNerdFont"
 
+_ConfigKey = Tuple[Tuple[str, str], ...]
+
+
+def _config_key(config: StyleCVConfig) -> _ConfigKey:
+    return tuple(config.model_dump().items())
+
+
+@lru_cache(maxsize=64)
+def _parse_colors(config_key: _ConfigKey) -> Dict[str, Color]:
+    return {name: colors.HexColor(value) for name, value in config_key}
+
+
+def _build_styles(style_cv: "StyleCV", font: str, scale: float) -> StyleSheet1:
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name="Header", fontName=font, fontSize=25 * scale, leading=24 * scale, alignment=TA_LEFT, textColor=style_cv.accent))
+    styles.add(ParagraphStyle(name="SubHeader", fontName=font, fontSize=6 * scale, leading=16 * scale, alignment=TA_LEFT, textColor=style_cv.sidebar_text))
+    styles.add(ParagraphStyle(name="JobTitle", fontName=font, fontSize=11 * scale, leading=14 * scale, textColor=style_cv.accent, spaceAfter=4 * scale))
+    styles.add(ParagraphStyle(name="JobSubTitle", fontName=font, fontSize=8 * scale, leading=14 * scale, textColor=style_cv.accent, spaceAfter=4 * scale))
+    styles.add(ParagraphStyle(name="JobDesc", fontName=font, fontSize=7 * scale, leading=12 * scale, textColor=style_cv.text))
+    styles.add(ParagraphStyle(name="SidebarName", fontName=font, fontSize=15 * scale, leading=12 * scale, textColor=style_cv.sidebar_text, alignment=TA_CENTER))
+    styles.add(ParagraphStyle(name="SidebarHeadline", fontName=font, fontSize=7 * scale, leading=10 * scale, textColor=style_cv.sidebar_text, alignment=TA_CENTER, spaceAfter=4 * scale))
+    styles.add(ParagraphStyle(name="SidebarTitle", fontName=font, fontSize=10 * scale, leading=10 * scale, textColor=style_cv.sidebar_text, alignment=TA_LEFT))
+    styles.add(ParagraphStyle(name="SidebarText", fontName=font, fontSize=6 * scale, leading=10 * scale, textColor=style_cv.sidebar_text, alignment=TA_LEFT))
+    styles.add(ParagraphStyle(name="SidebarLinks", fontName=font, fontSize=6 * scale, leading=9 * scale, textColor=style_cv.sidebar_text, alignment=TA_LEFT))
+    return styles
+
+
+class StyleRegistry:
+    """Un `StyleSheet1` por valor de `(StyleCVConfig, fuente, scale)`, compartido entre builds.
+
+    Los stylesheets (y los colores de `StyleCV`) devueltos son instancias compartidas de sólo lectura:
+    `ParagraphMeasureCache` memoiza la huella de cada estilo por identidad, así que modificar uno le
+    serviría mediciones viejas a los builds siguientes. Para variantes, `styles[name].clone(...)`; para
+    un stylesheet modificable, `copy(...)`.
+    """
+
+    def __init__(self, *, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._styles: "OrderedDict[Tuple[_ConfigKey, str, float], StyleSheet1]" = OrderedDict()
+
+    def get(self, style_cv: "StyleCV", *, font: str = FONT, scale: float = 1.0) -> StyleSheet1:
+        key = (style_cv.config_key, font, scale)
+        styles = self._styles.get(key)
+        if styles is not None:
+            self._styles.move_to_end(key)
+            return styles
+        styles = _build_styles(style_cv, font, scale)
+        self._styles[key] = styles
+        if len(self._styles) > self.maxsize:
+            self._styles.popitem(last=False)
+        return styles
+
+    def copy(self, style_cv: "StyleCV", *, font: str = FONT, scale: float = 1.0) -> StyleSheet1:
+        """Stylesheet nuevo, fuera del registro: sus estilos se pueden modificar (los colores siguen siendo
+        los compartidos de `style_cv`; reemplazarlos en vez de modificarlos)."""
+        return _build_styles(style_cv, font, scale)
+
+    def clear(self) -> None:
+        self._styles.clear()
+
+
+STYLE_REGISTRY = StyleRegistry()
+
 
 class StyleCV:
     def __init__(self, config: Optional[StyleCVConfig] = None):
         config = config or StyleCVConfig()
-        self.sidebar_panel: Color = colors.HexColor(config.sidebar_panel)
-        self.accent: Color = colors.HexColor(config.accent)
-        self.text: Color = colors.HexColor(config.text)
-        self.background: Color = colors.HexColor(config.background)
-        self.sidebar_text: Color = colors.HexColor(config.sidebar_text)
-
-    def get_styles(self) -> StyleSheet1:
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(name="Header", fontName=FONT, fontSize=25, leading=24, alignment=TA_LEFT, textColor=self.accent))
-        styles.add(ParagraphStyle(name="SubHeader", fontName=FONT, fontSize=6, leading=16, alignment=TA_LEFT, textColor=self.sidebar_text))
-        styles.add(ParagraphStyle(name="JobTitle", fontName=FONT, fontSize=11, leading=14, textColor=self.accent, spaceAfter=4))
-        styles.add(ParagraphStyle(name="JobSubTitle", fontName=FONT, fontSize=8, leading=14, textColor=self.accent, spaceAfter=4))
-        styles.add(ParagraphStyle(name="JobDesc", fontName=FONT, fontSize=7, leading=12, textColor=self.text))
-        styles.add(ParagraphStyle(name="SidebarName", fontName=FONT, fontSize=15, leading=12, textColor=self.sidebar_text, alignment=TA_CENTER))
-        styles.add(ParagraphStyle(name="SidebarHeadline", fontName=FONT, fontSize=7, leading=10, textColor=self.sidebar_text, alignment=TA_CENTER, spaceAfter=4))
-        styles.add(ParagraphStyle(name="SidebarTitle", fontName=FONT, fontSize=10, leading=10, textColor=self.sidebar_text, alignment=TA_LEFT))
-        styles.add(ParagraphStyle(name="SidebarText", fontName=FONT, fontSize=6, leading=10, textColor=self.sidebar_text, alignment=TA_LEFT))
-        styles.add(ParagraphStyle(name="SidebarLinks", fontName=FONT, fontSize=6, leading=9, textColor=self.sidebar_text, alignment=TA_LEFT))
-        return styles
+        self.config_key = _config_key(config)
+        parsed = _parse_colors(self.config_key)
+        self.sidebar_panel: Color = parsed["sidebar_panel"]
+        self.accent: Color = parsed["accent"]
+        self.text: Color = parsed["text"]
+        self.background: Color = parsed["background"]
+        self.sidebar_text: Color = parsed["sidebar_text"]
+
+    def get_styles(self, scale: float = 1.0) -> StyleSheet1:
+        """`scale` multiplica tamaño de fuente, interlineado y `spaceAfter` de los estilos del CV.
+
+        El stylesheet sale de `STYLE_REGISTRY` y es compartido: no modificarlo (ver `StyleRegistry`).
+        """
+        return STYLE_REGISTRY.get(self, scale=scale)